@@ -0,0 +1,207 @@
+"""
+END-TO-END BENCHMARK RUNNER
+Times manifest, canonicalization, scanning, validation and graph export
+on synthetic inputs; compares against JSON baselines
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+import contextlib
+import io
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic import SyntheticSpec, generate_repo, generate_graph, simulated_latency
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines.json"
+
+# Per-open latency of the simulated network filesystem
+SLOW_FS_LATENCY = 0.001
+
+# Concurrent file reads for the async manifest pipeline
+MANIFEST_IN_FLIGHT = 32
+
+# Allowed slowdown over baseline before a benchmark counts as a regression
+DEFAULT_THRESHOLD = 1.5
+
+# Slowdowns smaller than this are timer and scheduler noise, whatever the ratio
+DEFAULT_MIN_SECONDS = 0.005
+
+SCALES: Dict[str, SyntheticSpec] = {
+    "tiny": SyntheticSpec(files=20, mean_size=512, fan_out=2, depth=2),
+    "small": SyntheticSpec(files=500, fan_out=4, depth=4),
+    "medium": SyntheticSpec(files=5000, fan_out=6, depth=6),
+    "large": SyntheticSpec(files=50000, mean_size=1024, fan_out=8, depth=8),
+}
+
+
+# BENCHMARKS
+# Each takes (repo_root, graph, scratch_dir) and does one full operation
+
+def bench_genesis_manifest(repo: Path, graph, scratch: Path):
+    from generate_genesis_manifest import generate_genesis_manifest
+    generate_genesis_manifest(str(repo), "synthetic", str(scratch / "GENESIS_MANIFEST.yaml"))
+
+
+def bench_genesis_manifest_async(repo: Path, graph, scratch: Path):
+    from generate_genesis_manifest import generate_genesis_manifest
+    generate_genesis_manifest(str(repo), "synthetic", str(scratch / "GENESIS_MANIFEST.yaml"),
+                              max_in_flight=MANIFEST_IN_FLIGHT)
+
+
+def bench_genesis_manifest_slow_fs(repo: Path, graph, scratch: Path):
+    import generate_genesis_manifest
+    with simulated_latency(generate_genesis_manifest, SLOW_FS_LATENCY):
+        bench_genesis_manifest(repo, graph, scratch)
+
+
+def bench_genesis_manifest_async_slow_fs(repo: Path, graph, scratch: Path):
+    import generate_genesis_manifest
+    with simulated_latency(generate_genesis_manifest, SLOW_FS_LATENCY):
+        bench_genesis_manifest_async(repo, graph, scratch)
+
+
+def bench_canonicalize_yaml(repo: Path, graph, scratch: Path):
+    from canonicalize_covenant import canonicalize_yaml
+    if canonicalize_yaml(str(repo / "covenant.yaml"), str(scratch / "canonical.yaml")) != 0:
+        raise RuntimeError("canonicalize_yaml failed")
+
+
+def bench_topology_scan(repo: Path, graph, scratch: Path):
+    from topology_scanner import TopologyScanner
+    TopologyScanner(repo).scan()
+
+
+def bench_run_validation(repo: Path, graph, scratch: Path):
+    from validation.topology_validator import run_validation
+    run_validation(str(repo), graph=graph, executor="serial")
+
+
+def bench_run_validation_process(repo: Path, graph, scratch: Path):
+    # One check per forked worker; only faster than serial with spare cores
+    from validation.topology_validator import run_validation
+    run_validation(str(repo), graph=graph, executor="process")
+
+
+def bench_graph_export_roundtrip(repo: Path, graph, scratch: Path):
+    from topology.graph_export import export_columnar, load_graph
+    export_columnar(graph, scratch / "graph.topocol")
+    load_graph(scratch / "graph.topocol")
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "genesis_manifest": bench_genesis_manifest,
+    "genesis_manifest_async": bench_genesis_manifest_async,
+    "genesis_manifest_slow_fs": bench_genesis_manifest_slow_fs,
+    "genesis_manifest_async_slow_fs": bench_genesis_manifest_async_slow_fs,
+    "canonicalize_yaml": bench_canonicalize_yaml,
+    "topology_scan": bench_topology_scan,
+    "run_validation": bench_run_validation,
+    "run_validation_process": bench_run_validation_process,
+    "graph_export_roundtrip": bench_graph_export_roundtrip,
+}
+
+
+def run_benchmarks(scales: List[str], names: Optional[List[str]] = None,
+                   repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Best-of-repeat seconds per benchmark per scale"""
+    names = names or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS] + [s for s in scales if s not in SCALES]
+    if unknown:
+        raise ValueError(f"UNKNOWN_BENCHMARK: {unknown}")
+
+    results: Dict[str, Dict[str, float]] = {}
+    for scale in scales:
+        spec = SCALES[scale]
+        graph = generate_graph(spec)
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / "repo"
+            scratch = Path(tmp) / "scratch"
+            scratch.mkdir()
+            generate_repo(repo, spec)
+
+            results[scale] = {}
+            for name in names:
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    # Benchmarked code prints progress; keep output readable
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        BENCHMARKS[name](repo, graph, scratch)
+                    best = min(best, time.perf_counter() - start)
+                results[scale][name] = best
+    return results
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    if not Path(path).exists():
+        return {"threshold": DEFAULT_THRESHOLD, "min_seconds": DEFAULT_MIN_SECONDS,
+                "thresholds": {}, "results": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Dict[str, float]], path: Path = BASELINE_PATH):
+    """Merge results into the baseline file, keeping thresholds"""
+    baseline = load_baseline(path)
+    for scale, timings in results.items():
+        baseline["results"].setdefault(scale, {}).update(
+            {name: round(seconds, 6) for name, seconds in timings.items()})
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(results: Dict[str, Dict[str, float]], baseline: dict) -> List[str]:
+    """
+    Benchmarks slower than threshold x baseline by more than min_seconds
+    Per-benchmark thresholds ("thresholds": {"<name>": x}) override the default
+    """
+    default = baseline.get("threshold", DEFAULT_THRESHOLD)
+    min_seconds = baseline.get("min_seconds", DEFAULT_MIN_SECONDS)
+    thresholds = baseline.get("thresholds", {})
+    regressions = []
+    for scale, timings in results.items():
+        for name, seconds in timings.items():
+            reference = baseline.get("results", {}).get(scale, {}).get(name)
+            if reference is None:
+                continue
+            limit = thresholds.get(name, default)
+            if seconds > reference * limit and seconds - reference > min_seconds:
+                regressions.append(f"REGRESSION: {scale}/{name} {seconds:.4f}s > "
+                                   f"{limit} x {reference:.4f}s baseline")
+    return regressions
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Run end-to-end benchmarks")
+    parser.add_argument("--scales", nargs="+", default=["small"], choices=list(SCALES))
+    parser.add_argument("--bench", nargs="+", choices=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit non-zero on regression")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scales, args.bench, args.repeat)
+
+    print("BENCHMARK RESULTS")
+    print("=" * 60)
+    for scale, timings in results.items():
+        for name, seconds in timings.items():
+            print(f"{scale:8} {name:32} {seconds * 1000:10.2f} ms")
+
+    if args.update_baseline:
+        save_baseline(results)
+        print(f"\nBaseline updated: {BASELINE_PATH}")
+
+    regressions = find_regressions(results, load_baseline())
+    for line in regressions:
+        print(line)
+    if args.check and regressions:
+        sys.exit(1)
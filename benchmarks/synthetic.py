@@ -0,0 +1,154 @@
+"""
+SYNTHETIC REPOSITORY AND GRAPH GENERATOR
+Deterministic inputs of controlled size for benchmarks
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+import builtins
+import contextlib
+import math
+import random
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from topology.graph_loader import (
+    TopologyGraph, Node, Edge, NodeClass, Authority, ConstraintLayer,
+    Verification, Temporal, EdgeClass, Directionality,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Files the canonical graph loader and validators expect to find
+_SEED_FILES = (
+    "covenant.yaml",
+    "src/__init__.py",
+    "src/principles.py",
+    "src/operational_modes.py",
+    "src/infrastructure.py",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a synthetic repository / graph"""
+    files: int
+    mean_size: int = 2048       # bytes, lognormal mean
+    size_sigma: float = 1.0     # lognormal shape
+    fan_out: int = 4            # imports per module
+    depth: int = 4              # directory levels / graph layers
+    seed: int = 0
+
+
+def _module_path(i: int, spec: SyntheticSpec) -> List[str]:
+    """Directory parts for module i: spread modules across `depth` levels"""
+    parts = []
+    for level in range(spec.depth - 1):
+        parts.append(f"d{level}_{(i >> (2 * level)) % 4}")
+    return parts + [f"mod_{i}"]
+
+
+def generate_repo(root: Path, spec: SyntheticSpec) -> Dict[str, int]:
+    """
+    Write a synthetic repository under root: the covenant seed files plus
+    spec.files Python modules, each importing spec.fan_out earlier modules
+    and padded to a lognormal size. Returns {'files', 'bytes'}.
+    """
+    rng = random.Random(spec.seed)
+    root = Path(root)
+    total_bytes = 0
+
+    for rel in _SEED_FILES:
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(REPO_ROOT / rel, target)
+        total_bytes += target.stat().st_size
+
+    mu = math.log(spec.mean_size) - spec.size_sigma ** 2 / 2
+    names = []
+    for i in range(spec.files):
+        parts = _module_path(i, spec)
+        module = ".".join(["pkg"] + parts)
+        lines = [f'"""Synthetic module {i}"""']
+        for j in rng.sample(range(i), min(i, spec.fan_out)):
+            lines.append(f"import {names[j]}")
+        lines.append(f"VALUE_{i} = {i}")
+        body = "\n".join(lines) + "\n"
+
+        size = int(rng.lognormvariate(mu, spec.size_sigma))
+        if size > len(body):
+            filler = f"# {'x' * 70}\n"
+            body += filler * ((size - len(body)) // len(filler))
+
+        path = root.joinpath("pkg", *parts[:-1], parts[-1] + ".py")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+        total_bytes += len(body)
+        names.append(module)
+
+    return {"files": spec.files + len(_SEED_FILES), "bytes": total_bytes}
+
+
+@contextlib.contextmanager
+def simulated_latency(module, seconds: float):
+    """
+    Make every open() made by module block for `seconds` first, as on a
+    network filesystem where per-file open latency dominates
+    """
+    real_open = builtins.open
+
+    def slow_open(*args, **kwargs):
+        time.sleep(seconds)
+        return real_open(*args, **kwargs)
+
+    module.open = slow_open
+    try:
+        yield
+    finally:
+        del module.open
+
+
+def generate_graph(spec: SyntheticSpec) -> TopologyGraph:
+    """
+    Layered canonical graph: covenant root binds the first layer, each
+    node imports spec.fan_out nodes of the next layer (spec.depth layers)
+    All nodes carry the same axes, so every check does its full work.
+    """
+    rng = random.Random(spec.seed)
+    every = {ConstraintLayer.LOGOS, ConstraintLayer.CHALCEDON, ConstraintLayer.GRACE,
+             ConstraintLayer.KENOSIS, ConstraintLayer.AGAPE}
+
+    def node(node_id, node_class=NodeClass.PRINCIPLE_MODULE, layers=every):
+        return Node(node_id, node_class, Authority.VALIDATED, set(layers),
+                    Verification.HASH_CHAIN, Temporal.FOUNDATION)
+
+    nodes = {"covenant.yaml": node("covenant.yaml", NodeClass.COVENANT_ROOT, {ConstraintLayer.COMPOSITE})}
+    edges = {}
+
+    def add_edge(source, target, edge_class):
+        edge_id = f"{source}::{target}::{edge_class.value}"
+        edges[edge_id] = Edge(edge_id, source, target, edge_class, Directionality.UNI, set())
+
+    depth = max(1, spec.depth)
+    layers: List[List[str]] = [[] for _ in range(depth)]
+    for i in range(spec.files):
+        node_id = f"n{i}"
+        nodes[node_id] = node(node_id)
+        layers[i * depth // max(1, spec.files)].append(node_id)
+
+    for node_id in layers[0]:
+        add_edge("covenant.yaml", node_id, EdgeClass.COVENANT_BINDING)
+    for upper, lower in zip(layers, layers[1:]):
+        if not upper:
+            continue
+        for source in upper:
+            for target in rng.sample(lower, min(len(lower), spec.fan_out)):
+                add_edge(source, target, EdgeClass.DEPENDENCY_IMPORT)
+        # Keep every lower node reachable
+        for k, target in enumerate(lower):
+            add_edge(upper[k % len(upper)], target, EdgeClass.DEPENDENCY_IMPORT)
+
+    return TopologyGraph(nodes=nodes, edges=edges)
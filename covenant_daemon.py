@@ -0,0 +1,315 @@
+"""
+COVENANT DAEMON
+Long-running verification service over a local Unix socket
+Authority: IMMUTABLE
+Generated: 2026-02-07
+
+Holds the compiled topology spec, canonical graph, validation results,
+verification engine and a stat-keyed file hash cache warm across requests.
+
+Protocol: one JSON object per line in each direction
+  request:  {"id": <any>, "op": "<op>", ...params}
+  response: {"id": <same>, "ok": true, "result": {...}}
+            {"id": <same>, "ok": false, "error": "CODE: detail"}
+Ops: ping, verify-file, verify-manifest, validate-graph, mode-check
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import instrumentation
+
+# Requests larger than this are rejected rather than buffered
+MAX_REQUEST_BYTES = 1 << 20
+
+
+class RequestError(Exception):
+    """Client-visible request failure; message is 'CODE: detail'"""
+
+
+class CovenantDaemon:
+    """Warm state plus one handler per op"""
+
+    def __init__(self, repo_root: str):
+        from topology.spec import load_spec
+
+        self.root = Path(repo_root).resolve()
+        self.spec = load_spec(self.root / "topology")
+        self.graph = None
+        # (stat signatures of the non-graph inputs, results) of the last validation
+        self.validation: Optional[Tuple[tuple, dict]] = None
+        self._engine = None
+        # path -> ((mtime_ns, size, ino), sha256)
+        self.hash_cache: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
+        # manifest path -> (stat signature, {file: sha256})
+        self._manifests: Dict[str, Tuple[Tuple[int, int, int], Dict[str, str]]] = {}
+        self.handlers = {
+            'ping': self.op_ping,
+            'verify-file': self.op_verify_file,
+            'verify-manifest': self.op_verify_manifest,
+            'validate-graph': self.op_validate_graph,
+            'mode-check': self.op_mode_check,
+        }
+
+    # Helpers
+
+    def _resolve(self, path: str) -> Path:
+        """Repository-relative or absolute path, which must stay under the root"""
+        resolved = (self.root / path).resolve()
+        if resolved != self.root and self.root not in resolved.parents:
+            raise RequestError(f"PATH_OUTSIDE_ROOT: {path}")
+        return resolved
+
+    async def file_hash(self, path: Path) -> Tuple[str, int]:
+        """SHA-256 of path, reusing the cache while (mtime, size, inode) is unchanged"""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise RequestError(f"FILE_NOT_FOUND: {path.relative_to(self.root)}")
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self.hash_cache.get(str(path))
+        if cached and cached[0] == signature:
+            instrumentation.count("daemon.hash_cache_hit")
+            return cached[1], st.st_size
+
+        instrumentation.count("daemon.hash_cache_miss")
+        digest = await asyncio.get_running_loop().run_in_executor(None, _sha256_file, path)
+        self.hash_cache[str(path)] = (signature, digest)
+        return digest, st.st_size
+
+    # Ops
+
+    async def op_ping(self, request: dict) -> dict:
+        return {'root': str(self.root), 'spec_digest': self.spec.digest,
+                'cached_hashes': len(self.hash_cache)}
+
+    async def op_verify_file(self, request: dict) -> dict:
+        """{"path", "expected_sha256"?, "principles"?: bool}"""
+        if 'path' not in request:
+            raise RequestError("BAD_REQUEST: verify-file needs 'path'")
+        path = self._resolve(request['path'])
+        digest, size = await self.file_hash(path)
+        result = {'path': str(path.relative_to(self.root)), 'sha256': digest, 'bytes': size}
+        if 'expected_sha256' in request:
+            result['matches'] = digest == str(request['expected_sha256']).lower()
+        if request.get('principles'):
+            if self._engine is None:
+                from src.verification import VerificationEngine
+                self._engine = VerificationEngine()
+            result['principles'] = (await asyncio.get_running_loop().run_in_executor(
+                None, self._engine.verify_batch, [path]))[0]
+        return result
+
+    async def op_verify_manifest(self, request: dict) -> dict:
+        """{"manifest"?: path, default GENESIS_MANIFEST.yaml}"""
+        manifest_path = self._resolve(request.get('manifest', 'GENESIS_MANIFEST.yaml'))
+        expected = self._load_manifest(manifest_path)
+
+        async def check(rel: str, sha256: str):
+            try:
+                digest, _ = await self.file_hash(self._resolve(rel))
+            except RequestError:
+                return rel, None
+            return rel, digest == sha256
+
+        outcomes = await asyncio.gather(*(check(rel, sha) for rel, sha in expected.items()))
+        return {
+            'checked': len(outcomes),
+            'missing': sorted(rel for rel, ok in outcomes if ok is None),
+            'mismatched': sorted(rel for rel, ok in outcomes if ok is False),
+        }
+
+    def _load_manifest(self, manifest_path: Path) -> Dict[str, str]:
+        try:
+            st = manifest_path.stat()
+        except FileNotFoundError:
+            raise RequestError(f"FILE_NOT_FOUND: {manifest_path.relative_to(self.root)}")
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._manifests.get(str(manifest_path))
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        import yaml
+        with open(manifest_path) as f:
+            manifest = yaml.safe_load(f) or {}
+        expected = {entry['path']: entry['sha256'] for entry in manifest.get('files', [])}
+        self._manifests[str(manifest_path)] = (signature, expected)
+        return expected
+
+    async def op_validate_graph(self, request: dict) -> dict:
+        """{"reload"?: bool} - rebuild the canonical graph before validating"""
+        from topology.graph_loader import load_topology_graph
+        from validation.audit_log import VIOLATION_LOG_PATH, index_path
+        from validation.topology_validator import run_validation
+
+        # VIOLATION_LOG_IMMUTABILITY reads the log and its checkpoint index,
+        # so results are reused only while both are unchanged
+        log = self.root / VIOLATION_LOG_PATH
+        signature = (_stat_signature(log), _stat_signature(index_path(log)))
+        reload = self.graph is None or request.get('reload')
+        if not reload and self.validation is not None and self.validation[0] == signature:
+            return self.validation[1]
+
+        def validate():
+            graph = load_topology_graph(str(self.root)) if reload else self.graph
+            return graph, run_validation(str(self.root), graph=graph, executor="serial")
+
+        self.graph, results = await asyncio.get_running_loop().run_in_executor(None, validate)
+        self.validation = (signature, {'checks': results['checks'], 'violations': results['violations']})
+        return self.validation[1]
+
+    async def op_mode_check(self, request: dict) -> dict:
+        """{"operations": [...], "mode"?: key} - per-mode verdicts or allowed-in lists"""
+        from src.operational_modes import DECISION_TABLE, MODES
+
+        operations = request.get('operations')
+        if not isinstance(operations, list):
+            raise RequestError("BAD_REQUEST: mode-check needs 'operations' list")
+        mode = request.get('mode')
+        if mode is not None:
+            if mode not in MODES:
+                raise RequestError(f"UNKNOWN_MODE: {mode}")
+            return {'mode': mode, 'allowed': MODES[mode].is_allowed_many(operations)}
+        return {'allowed_in': [list(DECISION_TABLE.allowed_in(op)) for op in operations]}
+
+    # Transport
+
+    async def handle(self, request: dict) -> dict:
+        response = {'id': request.get('id')}
+        try:
+            op = request.get('op')
+            if not isinstance(op, str):
+                raise RequestError(f"BAD_REQUEST: op must be a string, got {type(op).__name__}")
+            handler = self.handlers.get(op)
+            if handler is None:
+                raise RequestError(f"UNKNOWN_OP: {op}")
+            with instrumentation.stage(f"daemon.{op}"):
+                response['result'] = await handler(request)
+            response['ok'] = True
+        except RequestError as e:
+            response.update(ok=False, error=str(e))
+        except Exception as e:
+            response.update(ok=False, error=f"INTERNAL: {type(e).__name__}: {e}")
+        return response
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line exceeded the stream limit
+                    writer.write(b'{"id": null, "ok": false, "error": "REQUEST_TOO_LARGE"}\n')
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be an object")
+                except ValueError as e:
+                    response = {'id': None, 'ok': False, 'error': f"BAD_REQUEST: {e}"}
+                else:
+                    response = await self.handle(request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self, socket_path: str) -> asyncio.AbstractServer:
+        """
+        Listen on socket_path. A stale socket left by a dead daemon is
+        replaced; a live daemon or any non-socket file raises ValueError.
+        """
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise ValueError(f"SOCKET_PATH_IN_USE: {socket_path} is not a socket")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(socket_path)
+            except ConnectionRefusedError:
+                os.unlink(socket_path)
+            else:
+                raise ValueError(f"DAEMON_RUNNING: {socket_path} is accepting connections")
+            finally:
+                probe.close()
+        return await asyncio.start_unix_server(self.serve_connection, path=socket_path,
+                                               limit=MAX_REQUEST_BYTES)
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of path, None if it does not exist"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+async def serve(repo_root: str, socket_path: str):
+    daemon = CovenantDaemon(repo_root)
+    server = await daemon.start(socket_path)
+    async with server:
+        await server.serve_forever()
+
+
+class CovenantClient:
+    """Blocking client: one connection, sequential requests"""
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path)
+        self.stream = self.sock.makefile('rwb')
+        self._next_id = 0
+
+    def request(self, op: str, **params) -> dict:
+        """Send one request; returns result or raises RuntimeError with the error"""
+        self._next_id += 1
+        self.stream.write(json.dumps({'id': self._next_id, 'op': op, **params}).encode() + b"\n")
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error'))
+        return response['result']
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Covenant verification daemon")
+    parser.add_argument("command", choices=["serve", "call"])
+    parser.add_argument("--socket", default=".covenant.sock")
+    parser.add_argument("--root", default=".")
+    parser.add_argument("op", nargs="?")
+    parser.add_argument("params", nargs="?", default="{}", help="JSON object of op parameters")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        asyncio.run(serve(args.root, args.socket))
+    else:
+        client = CovenantClient(args.socket)
+        print(json.dumps(client.request(args.op, **json.loads(args.params)), indent=2))
+        client.close()
@@ -6,9 +6,16 @@ Generated: 2026-02-07
 """
 
 from pathlib import Path
+import asyncio
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import yaml
+import instrumentation
+
+# Ignore patterns
+IGNORE_PATTERNS = {'.git', '__pycache__', '.pyc', 'node_modules', '.cache'}
 
 def compute_sha256(filepath: Path) -> str:
     """Compute SHA-256 of raw file bytes"""
@@ -16,6 +23,7 @@ def compute_sha256(filepath: Path) -> str:
     with open(filepath, 'rb') as f:
         while chunk := f.read(8192):
             sha256.update(chunk)
+            instrumentation.count("manifest.bytes_hashed", len(chunk))
     return sha256.hexdigest()
 
 def enumerate_repository(root: Path, ignore_patterns: set) -> list:
@@ -27,7 +35,9 @@ def enumerate_repository(root: Path, ignore_patterns: set) -> list:
         if any(pattern in str(item) for pattern in ignore_patterns):
             continue
         
+        instrumentation.count("manifest.paths_walked")
         if item.is_file():
+            instrumentation.count("manifest.files_hashed")
             rel_path = str(item.relative_to(root)).replace('\\', '/')
             size = item.stat().st_size
             sha256 = compute_sha256(item)
@@ -40,15 +50,177 @@ def enumerate_repository(root: Path, ignore_patterns: set) -> list:
     
     return files
 
-def generate_genesis_manifest(repo_root: str, repo_name: str, output_path: str):
-    """Generate GENESIS_MANIFEST.yaml"""
-    root = Path(repo_root)
+def _hash_batch(items: list) -> list:
+    """(size, sha256) per file; runs on an executor thread"""
+    return [(os.stat(item).st_size, compute_sha256(item)) for item in items]
+
+def _list_directory(directory: Path, ignore_patterns: set) -> tuple:
+    """
+    (files, subdirectories) of one directory, ignored entries removed
+    Matches rglob: symlinked directories are listed but not descended into.
+    An ignored directory is pruned whole, since every path below it
+    contains the same ignored substring.
+    """
+    files, subdirs = [], []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            item = directory / entry.name
+            if any(pattern in str(item) for pattern in ignore_patterns):
+                continue
+            instrumentation.count("manifest.paths_walked")
+            if entry.is_dir() and not entry.is_symlink():
+                subdirs.append(item)
+            elif item.is_file():
+                files.append(item)
+    return files, subdirs
+
+async def enumerate_repository_async(root: Path, ignore_patterns: set,
+                                     max_in_flight: int = 32, batch_size: int = 8) -> list:
+    """
+    enumerate_repository with directory listing, reads and hashing overlapped
+    At most max_in_flight batches of batch_size files are hashed at once,
+    each on its own thread reading one chunk at a time. A bounded queue
+    between the directory walker and the hashing workers blocks the walker
+    when hashing falls behind, so memory stays capped regardless of
+    repository size. Returns exactly what enumerate_repository returns.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight * 2)
+    results = {}
+
+    async def walk():
+        pending = [root]
+        while pending:
+            files, subdirs = await loop.run_in_executor(
+                executor, _list_directory, pending.pop(), ignore_patterns)
+            pending.extend(subdirs)
+            for i in range(0, len(files), batch_size):
+                await queue.put(files[i:i + batch_size])
+        for _ in range(max_in_flight):
+            await queue.put(None)
+
+    async def hash_files():
+        while (batch := await queue.get()) is not None:
+            instrumentation.count("manifest.files_hashed", len(batch))
+            hashed = await loop.run_in_executor(executor, _hash_batch, batch)
+            results.update(zip(batch, hashed))
+
+    # One thread per in-flight batch plus one for the walker
+    with ThreadPoolExecutor(max_workers=max_in_flight + 1) as executor:
+        tasks = [asyncio.ensure_future(walk())]
+        tasks += [asyncio.ensure_future(hash_files()) for _ in range(max_in_flight)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    files = []
+    for item in sorted(results):
+        size, sha256 = results[item]
+        files.append({
+            'path': str(item.relative_to(root)).replace('\\', '/'),
+            'bytes': size,
+            'sha256': sha256
+        })
+    return files
+
+def enumerate_repository_git(root: Path, ignore_patterns: set, index) -> list:
+    """
+    enumerate_repository for a git checkout, reusing hashes of clean files
+    A tracked regular file whose stat matches its index entry takes its
+    SHA-256 from the blob-keyed cache in the git directory; everything
+    else is hashed (and cached when clean). Untracked paths matched by
+    .gitignore / info/exclude are pruned, as git itself would skip them.
+    """
+    from git_index import GitIgnore, Sha256Cache, SHA256_CACHE_NAME
+
+    entries = index.entries
+    tracked_dirs = index.tracked_directories()
+    gitignore = GitIgnore(root, index.git_dir)
+    cache = Sha256Cache(index.git_dir / SHA256_CACHE_NAME)
+
+    results = {}
+    # (directory, ignored): an ignored directory is entered only for its
+    # tracked files, and everything untracked below it stays ignored
+    pending = [(root, False)]
+    while pending:
+        directory, ignored = pending.pop()
+        rel_dir = str(directory.relative_to(root)).replace('\\', '/')
+        rel_dir = '' if rel_dir == '.' else rel_dir
+        if not ignored:
+            gitignore.add_directory(rel_dir)
+        files, subdirs = _list_directory(directory, ignore_patterns)
+        for item in subdirs:
+            rel_path = f"{rel_dir}/{item.name}" if rel_dir else item.name
+            sub_ignored = ignored or gitignore.is_ignored(rel_path, is_dir=True)
+            if rel_path in tracked_dirs or not sub_ignored:
+                pending.append((item, sub_ignored))
+        for item in files:
+            rel_path = f"{rel_dir}/{item.name}" if rel_dir else item.name
+            entry = entries.get(rel_path)
+            if entry is None and (ignored or gitignore.is_ignored(rel_path)):
+                continue
+            st = os.stat(item)
+            clean = entry is not None and entry.is_regular and not item.is_symlink() \
+                and index.is_clean(entry, os.lstat(item))
+            sha256 = cache.get(entry.sha1, st.st_size) if clean else None
+            if sha256 is not None:
+                instrumentation.count("manifest.hash_cache_hits")
+            else:
+                instrumentation.count("manifest.files_hashed")
+                sha256 = compute_sha256(item)
+                if clean:
+                    cache.put(entry.sha1, st.st_size, sha256)
+            results[item] = (st.st_size, sha256)
+    cache.save()
+
+    files = []
+    for item in sorted(results):
+        size, sha256 = results[item]
+        files.append({
+            'path': str(item.relative_to(root)).replace('\\', '/'),
+            'bytes': size,
+            'sha256': sha256
+        })
+    return files
+
+def generate_genesis_manifest(repo_root: str, repo_name: str, output_path: str,
+                              max_in_flight: int = 0, shard_depth: int = 0,
+                              use_git_index: bool = False):
+    """
+    Generate GENESIS_MANIFEST.yaml
+    max_in_flight > 0 enumerates through the asyncio pipeline with that many
+    concurrent file reads; the manifest is identical either way. Worth it
+    when per-file open/read latency dominates (network filesystems, cold
+    disks); on a warm local disk the synchronous walk is faster.
+    shard_depth > 0 writes a sharded manifest instead (see
+    generate_sharded_manifest) and returns its root.
+    use_git_index (flat manifest only) reads .git/index and rehashes only files that changed
+    since git last saw them (see enumerate_repository_git); untracked
+    gitignored files are left out. Falls back to the full walk outside a
+    git checkout.
+    """
+    if shard_depth > 0:
+        return generate_sharded_manifest(repo_root, repo_name, output_path,
+                                         shard_depth, max_in_flight)
     
-    # Ignore patterns
-    ignore = {'.git', '__pycache__', '.pyc', 'node_modules', '.cache'}
+    root = Path(repo_root)
+    ignore = IGNORE_PATTERNS
     
     # Enumerate all files
-    files = enumerate_repository(root, ignore)
+    index = None
+    if use_git_index:
+        from git_index import read_git_index
+        index = read_git_index(root)
+    with instrumentation.stage("manifest.enumerate"):
+        if index is not None:
+            files = enumerate_repository_git(root, ignore, index)
+        elif max_in_flight > 0:
+            files = asyncio.run(enumerate_repository_async(root, ignore, max_in_flight))
+        else:
+            files = enumerate_repository(root, ignore)
     
     # Generate manifest
     manifest = {
@@ -62,7 +234,7 @@ def generate_genesis_manifest(repo_root: str, repo_name: str, output_path: str):
     
     # Write manifest
     output = Path(output_path)
-    with open(output, 'w') as f:
+    with instrumentation.stage("manifest.write"), open(output, 'w') as f:
         yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
     
     print(f"GENESIS_MANIFEST generated: {output}")
@@ -71,15 +243,215 @@ def generate_genesis_manifest(repo_root: str, repo_name: str, output_path: str):
     
     return manifest
 
+# SHARDED MANIFESTS
+# One sub-manifest per directory prefix of shard_depth components (files in
+# shallower directories form their own shards, "" being the repository
+# root). The root manifest lists every shard with the SHA-256 of its
+# manifest bytes, and root_digest hashes that list, so any change to any
+# file changes exactly one shard digest and the root.
+
+def shard_key(rel_path: str, depth: int) -> str:
+    """Directory prefix of at most depth components owning rel_path"""
+    return '/'.join(rel_path.split('/')[:-1][:depth])
+
+def shard_dir(manifest_path: Path) -> Path:
+    """Directory holding the shard manifests of root manifest_path"""
+    return manifest_path.with_name(manifest_path.stem + '.d')
+
+def shard_manifest_path(manifest_path: Path, key: str) -> Path:
+    return shard_dir(manifest_path) / ((key or '__root__') + '.yaml')
+
+def root_digest(shards: list) -> str:
+    """SHA-256 over (shard, digest) pairs in shard order"""
+    sha256 = hashlib.sha256()
+    for shard in shards:
+        sha256.update(f"{shard['shard']}\0{shard['sha256']}\n".encode())
+    return sha256.hexdigest()
+
+def _sharded_ignore(manifest_path: Path) -> set:
+    """Manifest outputs under the repository must not hash themselves"""
+    return IGNORE_PATTERNS | {shard_dir(manifest_path).name, manifest_path.name}
+
+def _enumerate_shard(root: Path, key: str, depth: int, ignore: set) -> list:
+    """Files of one shard, as enumerate_repository entries relative to root"""
+    directory = root / key if key else root
+    if directory.is_symlink() or not directory.is_dir():
+        return []
+    if len(key.split('/')) == depth and key:
+        # Leaf shard: everything below the directory
+        prefix = key + '/'
+        return [dict(entry, path=prefix + entry['path'])
+                for entry in enumerate_repository(directory, ignore)]
+    # Shallower shard: only the files directly in the directory
+    files = []
+    for item in sorted(directory.iterdir()):
+        if any(pattern in str(item) for pattern in ignore) or not item.is_file():
+            continue
+        files.append({
+            'path': str(item.relative_to(root)).replace('\\', '/'),
+            'bytes': item.stat().st_size,
+            'sha256': compute_sha256(item)
+        })
+    return files
+
+def _write_shard(manifest_path: Path, repo_name: str, key: str, files: list) -> dict:
+    """Write one shard manifest; returns its root manifest entry"""
+    shard = {
+        'repo': repo_name,
+        'hash_algorithm': 'sha256',
+        'shard': key,
+        'total_files': len(files),
+        'total_bytes': sum(f['bytes'] for f in files),
+        'files': files
+    }
+    data = yaml.dump(shard, default_flow_style=False, sort_keys=False).encode()
+    path = shard_manifest_path(manifest_path, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    instrumentation.count("manifest.shards_written")
+    return {
+        'shard': key,
+        'manifest': path.relative_to(manifest_path.parent).as_posix(),
+        'total_files': shard['total_files'],
+        'total_bytes': shard['total_bytes'],
+        'sha256': hashlib.sha256(data).hexdigest()
+    }
+
+def _write_root(manifest_path: Path, repo_name: str, depth: int, shards: list) -> dict:
+    shards = sorted(shards, key=lambda shard: shard['shard'])
+    manifest = {
+        'repo': repo_name,
+        'hash_algorithm': 'sha256',
+        'generated_at_utc': datetime.now(timezone.utc).isoformat(),
+        'shard_depth': depth,
+        'total_files': sum(s['total_files'] for s in shards),
+        'total_bytes': sum(s['total_bytes'] for s in shards),
+        'root_digest': root_digest(shards),
+        'shards': shards
+    }
+    with open(manifest_path, 'w') as f:
+        yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+    return manifest
+
+def generate_sharded_manifest(repo_root: str, repo_name: str, output_path: str,
+                              depth: int = 1, max_in_flight: int = 0) -> dict:
+    """
+    Write one shard manifest per directory prefix plus the root manifest
+    Shards go to <output stem>.d/ next to output_path; returns the root
+    """
+    root = Path(repo_root)
+    manifest_path = Path(output_path)
+    ignore = _sharded_ignore(manifest_path)
+    
+    with instrumentation.stage("manifest.enumerate"):
+        if max_in_flight > 0:
+            files = asyncio.run(enumerate_repository_async(root, ignore, max_in_flight))
+        else:
+            files = enumerate_repository(root, ignore)
+    
+    grouped = {}
+    for entry in files:
+        grouped.setdefault(shard_key(entry['path'], depth), []).append(entry)
+    
+    with instrumentation.stage("manifest.write"):
+        if shard_dir(manifest_path).exists():
+            for stale in shard_dir(manifest_path).rglob('*.yaml'):
+                stale.unlink()
+        shards = [_write_shard(manifest_path, repo_name, key, entries)
+                  for key, entries in grouped.items()]
+        manifest = _write_root(manifest_path, repo_name, depth, shards)
+    
+    print(f"GENESIS_MANIFEST generated: {manifest_path}")
+    print(f"  Shards: {len(shards)}")
+    print(f"  Files: {manifest['total_files']}")
+    print(f"  Total bytes: {manifest['total_bytes']:,}")
+    
+    return manifest
+
+def update_sharded_manifest(repo_root: str, manifest_path: str, changed: list) -> list:
+    """
+    Rehash and rewrite only the shards owning the changed paths
+    (repository-relative, added, modified or deleted), then the root.
+    Returns the shard keys that were rebuilt.
+    """
+    root = Path(repo_root)
+    manifest_path = Path(manifest_path)
+    with open(manifest_path) as f:
+        manifest = yaml.safe_load(f)
+    depth = manifest['shard_depth']
+    ignore = _sharded_ignore(manifest_path)
+    
+    shards = {shard['shard']: shard for shard in manifest['shards']}
+    rebuilt = sorted({shard_key(path.replace('\\', '/'), depth) for path in changed})
+    for key in rebuilt:
+        files = _enumerate_shard(root, key, depth, ignore)
+        if files:
+            shards[key] = _write_shard(manifest_path, manifest['repo'], key, files)
+        elif key in shards:
+            shard_manifest_path(manifest_path, key).unlink(missing_ok=True)
+            del shards[key]
+    
+    _write_root(manifest_path, manifest['repo'], depth, list(shards.values()))
+    return rebuilt
+
+def _verify_shard(root: Path, manifest_path: Path, shard: dict) -> dict:
+    """Check one shard's manifest digest, then every file it lists"""
+    path = manifest_path.parent / shard['manifest']
+    result = {'shard': shard['shard'], 'corrupt': False, 'missing': [], 'mismatched': []}
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        result['corrupt'] = True
+        return result
+    if hashlib.sha256(data).hexdigest() != shard['sha256']:
+        result['corrupt'] = True
+        return result
+    
+    for entry in yaml.safe_load(data)['files']:
+        item = root / entry['path']
+        if not item.is_file():
+            result['missing'].append(entry['path'])
+        elif compute_sha256(item) != entry['sha256']:
+            result['mismatched'].append(entry['path'])
+    return result
+
+def verify_sharded_manifest(repo_root: str, manifest_path: str, workers: int = 4) -> dict:
+    """
+    Verify the root digest, then all shards in parallel
+    Returns root_ok plus corrupt shards and missing / mismatched files
+    """
+    root = Path(repo_root)
+    manifest_path = Path(manifest_path)
+    with open(manifest_path) as f:
+        manifest = yaml.safe_load(f)
+    shards = manifest['shards']
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda shard: _verify_shard(root, manifest_path, shard), shards))
+    
+    return {
+        'root_ok': root_digest(shards) == manifest['root_digest'],
+        'shards_checked': len(results),
+        'corrupt_shards': [r['shard'] for r in results if r['corrupt']],
+        'missing': sorted(p for r in results for p in r['missing']),
+        'mismatched': sorted(p for r in results for p in r['mismatched']),
+    }
+
 if __name__ == '__main__':
     import sys
     
-    if len(sys.argv) < 3:
-        print("Usage: python generate_genesis_manifest.py <repo_root> <repo_name>")
+    # --git-index reuses hashes of files git reports clean
+    use_git_index = '--git-index' in sys.argv
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args) < 2:
+        print("Usage: python generate_genesis_manifest.py <repo_root> <repo_name> [max_in_flight] [shard_depth] [--git-index]")
         sys.exit(1)
     
-    repo_root = sys.argv[1]
-    repo_name = sys.argv[2]
+    repo_root = args[0]
+    repo_name = args[1]
+    max_in_flight = int(args[2]) if len(args) > 2 else 0
+    shard_depth = int(args[3]) if len(args) > 3 else 0
     output = Path(repo_root) / "GENESIS_MANIFEST.yaml"
     
-    generate_genesis_manifest(repo_root, repo_name, str(output))
+    generate_genesis_manifest(repo_root, repo_name, str(output), max_in_flight, shard_depth,
+                              use_git_index)
@@ -0,0 +1,333 @@
+"""
+GIT INDEX READER
+Stat data and blob ids from .git/index, plus gitignore matching
+Authority: IMMUTABLE
+Generated: 2026-02-07
+
+A clean checkout's files already have their stat data and blob SHA-1
+recorded in the index. A file whose stat matches its entry still holds
+that blob, so a SHA-256 computed once per blob id can be reused until
+the file changes. Reading the index is one sequential file read; no git
+process is spawned and nothing touches the network. Index versions 2, 3
+and 4 are understood.
+"""
+
+import hashlib
+import os
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import instrumentation
+
+_HEADER = struct.Struct(">4sLL")
+# ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size, sha1, flags
+_ENTRY = struct.Struct(">LLLLLLLLLL20sH")
+
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE = 0x3000
+_FLAG_NAME_LENGTH = 0x0FFF
+_EXTENDED_SKIP_WORKTREE = 0x4000
+_EXTENDED_INTENT_TO_ADD = 0x2000
+
+# Blob sha1 -> SHA-256 cache, inside the git directory so it never appears in a manifest
+SHA256_CACHE_NAME = "covenant-sha256-cache"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """One stage-0 index entry"""
+    path: str
+    mode: int
+    size: int
+    mtime_s: int
+    mtime_ns: int
+    ino: int
+    sha1: str
+
+    @property
+    def is_regular(self) -> bool:
+        return self.mode & 0o170000 == 0o100000
+
+    def matches(self, st: os.stat_result) -> bool:
+        """True if st describes the file as the index last saw it"""
+        if st.st_size & 0xFFFFFFFF != self.size or int(st.st_mtime) != self.mtime_s:
+            return False
+        # Builds without nanosecond support record 0
+        if self.mtime_ns and st.st_mtime_ns % 1_000_000_000 != self.mtime_ns:
+            return False
+        if self.ino and st.st_ino & 0xFFFFFFFF != self.ino:
+            return False
+        return bool(st.st_mode & 0o111) == bool(self.mode & 0o111)
+
+
+@dataclass
+class GitIndex:
+    """Parsed index: stage-0 entries by path plus the index file's mtime"""
+    git_dir: Path
+    version: int
+    entries: Dict[str, IndexEntry]
+    mtime_s: int
+    mtime_ns: int
+
+    def is_clean(self, entry: IndexEntry, st: os.stat_result) -> bool:
+        """
+        Stat matches and the entry is not racily clean: a file modified in
+        the same timestamp the index was written may differ from its entry
+        with identical stat data, so it is treated as dirty.
+        """
+        if not entry.matches(st):
+            return False
+        return (entry.mtime_s, entry.mtime_ns) < (self.mtime_s, self.mtime_ns)
+
+    def tracked_directories(self) -> Set[str]:
+        """Every directory with at least one tracked path below it ('' is the root)"""
+        directories = {""}
+        for path in self.entries:
+            parts = path.split("/")[:-1]
+            for i in range(1, len(parts) + 1):
+                directories.add("/".join(parts[:i]))
+        return directories
+
+
+def find_git_dir(repo_root: Path) -> Optional[Path]:
+    """.git directory of repo_root, following a 'gitdir:' file; None if not a checkout"""
+    dot_git = Path(repo_root) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        content = dot_git.read_text().strip()
+        if content.startswith("gitdir:"):
+            git_dir = Path(content[len("gitdir:"):].strip())
+            return git_dir if git_dir.is_absolute() else (Path(repo_root) / git_dir).resolve()
+    return None
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Offset-encoded varint used by index v4 path compression"""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def parse_index(data: bytes, git_dir: Path = Path(".git"), mtime_s: int = 0,
+                mtime_ns: int = 0) -> GitIndex:
+    """Parse index bytes; raises ValueError GIT_INDEX_INVALID on damage"""
+    if len(data) < _HEADER.size + 20:
+        raise ValueError("GIT_INDEX_INVALID: truncated")
+    signature, version, count = _HEADER.unpack_from(data)
+    if signature != b"DIRC":
+        raise ValueError("GIT_INDEX_INVALID: bad signature")
+    if version not in (2, 3, 4):
+        raise ValueError(f"GIT_INDEX_INVALID: unsupported version {version}")
+    trailer = data[-20:]
+    # index.skipHash writes an all-zero trailer
+    if trailer != bytes(20) and hashlib.sha1(data[:-20]).digest() != trailer:
+        raise ValueError("GIT_INDEX_INVALID: checksum mismatch")
+
+    entries: Dict[str, IndexEntry] = {}
+    pos = _HEADER.size
+    previous = b""
+    for _ in range(count):
+        start = pos
+        (_, _, mtime_sec, mtime_nsec, _, ino, mode, _, _, size, sha1, flags) = _ENTRY.unpack_from(data, pos)
+        pos += _ENTRY.size
+        extended = 0
+        if flags & _FLAG_EXTENDED:
+            extended = struct.unpack_from(">H", data, pos)[0]
+            pos += 2
+
+        if version == 4:
+            strip, pos = _read_varint(data, pos)
+            end = data.index(b"\0", pos)
+            name = previous[:len(previous) - strip] + data[pos:end]
+            pos = end + 1
+        else:
+            length = flags & _FLAG_NAME_LENGTH
+            end = pos + length if length < _FLAG_NAME_LENGTH else data.index(b"\0", pos)
+            name = data[pos:end]
+            # Entries are NUL-padded to a multiple of 8 bytes (at least one NUL)
+            pos = start + ((end - start) // 8 + 1) * 8
+        previous = name
+
+        if flags & _FLAG_STAGE or extended & (_EXTENDED_SKIP_WORKTREE | _EXTENDED_INTENT_TO_ADD):
+            # Conflicted, sparse or placeholder entries say nothing about the worktree
+            continue
+        path = name.decode("utf-8", "surrogateescape")
+        entries[path] = IndexEntry(path, mode, size, mtime_sec, mtime_nsec, ino, sha1.hex())
+
+    if pos > len(data) - 20:
+        raise ValueError("GIT_INDEX_INVALID: entries overrun")
+    instrumentation.count("git_index.entries", len(entries))
+    return GitIndex(git_dir, version, entries, mtime_s, mtime_ns)
+
+
+def read_git_index(repo_root: Path) -> Optional[GitIndex]:
+    """Index of the checkout at repo_root; None if it is not a git checkout"""
+    git_dir = find_git_dir(repo_root)
+    if git_dir is None or not (git_dir / "index").is_file():
+        return None
+    with instrumentation.stage("git_index.read"), open(git_dir / "index", "rb") as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    return parse_index(data, git_dir, int(st.st_mtime), st.st_mtime_ns % 1_000_000_000)
+
+
+class Sha256Cache:
+    """
+    Blob sha1 -> (size, SHA-256) of the working file, persisted as text lines
+    Only results for files the index reported clean are stored, so a
+    blob id always maps to the bytes git checked out for it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Tuple[int, str]] = {}
+        self.dirty = False
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) == 3:
+                        self.entries[fields[0]] = (int(fields[1]), fields[2])
+        except FileNotFoundError:
+            pass
+
+    def get(self, sha1: str, size: int) -> Optional[str]:
+        cached = self.entries.get(sha1)
+        if cached is None or cached[0] != size:
+            return None
+        return cached[1]
+
+    def put(self, sha1: str, size: int, sha256: str):
+        if self.entries.get(sha1) != (size, sha256):
+            self.entries[sha1] = (size, sha256)
+            self.dirty = True
+
+    def save(self):
+        """Atomically rewrite the cache if anything was added"""
+        if not self.dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            for sha1, (size, sha256) in sorted(self.entries.items()):
+                f.write(f"{sha1} {size} {sha256}\n")
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+# GITIGNORE
+# Patterns from .git/info/exclude and every .gitignore on the walk, last
+# match wins. Directories are pruned when matched, so (as in git) a file
+# below an ignored directory cannot be re-included.
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate one gitignore glob (slashes significant) to a regex"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            break
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            close = pattern.find("]", i + 2)
+            if close < 0:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:close]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = close
+        elif c == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    base: str
+    regex: "re.Pattern"
+    negate: bool
+    directory_only: bool
+    anchored: bool
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.directory_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        subject = rel_path if self.anchored else rel_path.rsplit("/", 1)[-1]
+        return self.regex.fullmatch(subject) is not None
+
+
+def parse_ignore_rules(lines: List[str], base: str = "") -> List[IgnoreRule]:
+    """Rules from the lines of an ignore file located in directory base"""
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.endswith("\\ "):
+            line = line.rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        line = line.lstrip("/")
+        rules.append(IgnoreRule(base, re.compile(_glob_to_regex(line)), negate, directory_only, anchored))
+    return rules
+
+
+class GitIgnore:
+    """Accumulated ignore rules; add_directory() as the walk enters each directory"""
+
+    def __init__(self, repo_root: Path, git_dir: Optional[Path] = None):
+        self.root = Path(repo_root)
+        self.rules: List[IgnoreRule] = []
+        exclude = (git_dir or self.root / ".git") / "info" / "exclude"
+        if exclude.is_file():
+            self.rules.extend(parse_ignore_rules(exclude.read_text().splitlines()))
+
+    def add_directory(self, rel_dir: str):
+        gitignore = self.root / rel_dir / ".gitignore"
+        if gitignore.is_file():
+            self.rules.extend(parse_ignore_rules(gitignore.read_text().splitlines(), rel_dir))
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        for rule in reversed(self.rules):
+            if rule.matches(rel_path, is_dir):
+                return not rule.negate
+        return False
@@ -0,0 +1,185 @@
+"""
+INSTRUMENTATION
+Opt-in counters, stage timers and profiling hooks for manifest, scanner and validator
+Authority: IMMUTABLE
+Generated: 2026-02-07
+
+Disabled by default: count() returns immediately and stage() hands back a
+shared no-op context manager. Enable with enable() or the environment:
+  COVENANT_METRICS=<path.json>   collect and write JSON metrics at exit
+  COVENANT_PROFILE=<directory>   also cProfile every stage into <stage>.prof
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+_enabled = False
+_profile_dir: Optional[Path] = None
+_lock = threading.Lock()
+
+# name -> value
+counters: Dict[str, int] = {}
+# name -> {'count', 'total_s', 'max_s'}
+timers: Dict[str, Dict[str, float]] = {}
+
+# stage name -> cProfile.Profile, accumulated across runs of the stage
+_profilers: Dict[str, object] = {}
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(profile_dir: Optional[str] = None):
+    """Start collecting; with profile_dir, cProfile each stage into it"""
+    global _enabled, _profile_dir
+    _enabled = True
+    _profile_dir = Path(profile_dir) if profile_dir else None
+    if _profile_dir:
+        _profile_dir.mkdir(parents=True, exist_ok=True)
+
+
+def disable():
+    global _enabled, _profile_dir
+    _enabled = False
+    _profile_dir = None
+
+
+def reset():
+    with _lock:
+        counters.clear()
+        timers.clear()
+        _profilers.clear()
+
+
+def count(name: str, n: int = 1):
+    """Add n to counter name (no-op when disabled)"""
+    if not _enabled:
+        return
+    with _lock:
+        counters[name] = counters.get(name, 0) + n
+
+
+def observe(name: str, seconds: float):
+    """Record one timing sample (no-op when disabled)"""
+    if not _enabled:
+        return
+    with _lock:
+        timer = timers.get(name)
+        if timer is None:
+            timer = timers[name] = {'count': 0, 'total_s': 0.0, 'max_s': 0.0}
+        timer['count'] += 1
+        timer['total_s'] += seconds
+        if seconds > timer['max_s']:
+            timer['max_s'] = seconds
+
+
+def stage(name: str):
+    """Context manager timing a stage (and profiling it when enabled)"""
+    if not _enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+class _Stage:
+    def __init__(self, name: str):
+        self.name = name
+        self.profiler = None
+
+    def __enter__(self):
+        if _profile_dir is not None:
+            import cProfile
+            with _lock:
+                profiler = _profilers.setdefault(self.name, cProfile.Profile())
+            try:
+                profiler.enable()
+                self.profiler = profiler
+            except ValueError:
+                # Another profiler is active (nested or concurrent stage): time only
+                pass
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.start)
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(str(_profile_dir / f"{self.name}.prof"))
+        return False
+
+
+def snapshot() -> Dict[str, dict]:
+    """Copy of all metrics"""
+    with _lock:
+        return {
+            'counters': dict(counters),
+            'timers': {name: dict(timer) for name, timer in timers.items()},
+        }
+
+
+def write_json(path: str):
+    with open(path, 'w') as f:
+        json.dump(snapshot(), f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _metric_name(name: str) -> str:
+    return "covenant_" + "".join(c if c.isalnum() else "_" for c in name)
+
+
+def prometheus_text() -> str:
+    """Metrics in Prometheus text exposition format"""
+    data = snapshot()
+    lines = []
+    for name, value in sorted(data['counters'].items()):
+        metric = _metric_name(name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    for name, timer in sorted(data['timers'].items()):
+        metric = _metric_name(name) + "_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        lines.append(f"{metric}_count {timer['count']}")
+        lines.append(f"{metric}_sum {timer['total_s']:.9f}")
+        lines.append(f"# TYPE {metric}_max gauge")
+        lines.append(f"{metric}_max {timer['max_s']:.9f}")
+    return "\n".join(lines) + "\n"
+
+
+def serve_prometheus(port: int, host: str = "127.0.0.1"):
+    """Serve /metrics from a daemon thread; returns the HTTP server"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                self.send_response(200)
+                body = prometheus_text().encode()
+            else:
+                self.send_response(404)
+                body = b"not found\n"
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Environment opt-in
+if os.environ.get("COVENANT_METRICS") or os.environ.get("COVENANT_PROFILE"):
+    enable(os.environ.get("COVENANT_PROFILE"))
+    if os.environ.get("COVENANT_METRICS"):
+        atexit.register(write_json, os.environ["COVENANT_METRICS"])
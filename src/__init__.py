@@ -12,12 +12,24 @@ __version__ = "1.0.0"
 __author__ = "SIGMA_LORA_COVENANT"
 __license__ = "COVENANT_IMMUTABLE"
 
-from . import principles
-from . import infrastructure
-from . import operational_modes
-
 __all__ = [
     "principles",
     "infrastructure",
     "operational_modes",
 ]
+
+# Submodules load on first attribute access; workers only pay for what they use
+_LAZY_SUBMODULES = frozenset(__all__) | {
+    "covenant_loader", "verification", "log_audit", "artifact_store", "constraint_index",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
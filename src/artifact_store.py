@@ -0,0 +1,203 @@
+"""
+Artifact Store Module
+=======================
+Per-artifact records for the infrastructure registry, backed by SQLite
+
+Every artifact is one row keyed by (artifact_type, index) with its hash
+stored as 32 raw bytes. B-tree indexes on type, hash and constraint give
+O(log n) lookups; constraints are kept per type and only artifact-specific
+extras are stored per artifact.
+
+File Hash (SHA-256): [AUTOGENERATED]
+"""
+
+import json
+import sqlite3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    artifact_type TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    hash BLOB NOT NULL,
+    PRIMARY KEY (artifact_type, idx)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS artifacts_by_hash ON artifacts (hash);
+
+CREATE TABLE IF NOT EXISTS type_constraints (
+    artifact_type TEXT NOT NULL,
+    constraint_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (artifact_type, constraint_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS type_constraints_by_constraint ON type_constraints (constraint_id);
+
+CREATE TABLE IF NOT EXISTS artifact_constraints (
+    artifact_type TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    constraint_id TEXT NOT NULL,
+    PRIMARY KEY (artifact_type, idx, constraint_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS artifact_constraints_by_constraint ON artifact_constraints (constraint_id);
+"""
+
+
+def _hash_bytes(hash_value):
+    """Hex hash -> raw bytes, None if not a hex string"""
+    if not isinstance(hash_value, str):
+        return None
+    try:
+        return bytes.fromhex(hash_value)
+    except ValueError:
+        return None
+
+
+class ArtifactStore:
+    """SQLite-backed per-artifact records (":memory:" or a file path)"""
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.db = sqlite3.connect(str(path))
+        self.db.executescript(_SCHEMA)
+
+    @classmethod
+    def from_registry(cls, registry, path=":memory:"):
+        """Store holding every derived artifact of an ArtifactRegistry"""
+        from .infrastructure import derive_artifact_hash
+
+        store = cls(path)
+        for artifact_type in registry.artifact_types:
+            entry = getattr(registry, artifact_type)
+            base_hash = entry["base_hash"]
+            store.set_type_constraints(artifact_type, entry.get("constraints", []))
+            store.load(
+                (artifact_type, index, derive_artifact_hash(base_hash, artifact_type, index))
+                for index in range(entry.get("count", 0))
+            )
+        return store
+
+    def close(self):
+        self.db.close()
+
+    # Bulk load / export
+
+    def set_type_constraints(self, artifact_type, constraints):
+        with self.db:
+            self.db.execute("DELETE FROM type_constraints WHERE artifact_type = ?", (artifact_type,))
+            self.db.executemany("INSERT OR IGNORE INTO type_constraints VALUES (?, ?, ?)",
+                                [(artifact_type, c, i) for i, c in enumerate(constraints)])
+
+    def load(self, records):
+        """
+        Insert or replace (artifact_type, index, hash[, extra_constraints])
+        records in one transaction
+        """
+        artifacts = []
+        extras = []
+        for record in records:
+            artifact_type, index, hash_value = record[0], record[1], record[2]
+            raw = _hash_bytes(hash_value)
+            if raw is None:
+                raise ValueError(f"HASH_INVALID: {artifact_type}[{index}] {hash_value!r}")
+            artifacts.append((artifact_type, index, raw))
+            if len(record) > 3:
+                extras.extend((artifact_type, index, c) for c in record[3])
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?)", artifacts)
+            self.db.executemany("INSERT OR IGNORE INTO artifact_constraints VALUES (?, ?, ?)", extras)
+        return len(artifacts)
+
+    def export(self):
+        """Yield (artifact_type, index, hash, extra_constraints) in key order"""
+        extras = {}
+        for artifact_type, index, constraint in self.db.execute(
+                "SELECT artifact_type, idx, constraint_id FROM artifact_constraints"):
+            extras.setdefault((artifact_type, index), []).append(constraint)
+        for artifact_type, index, raw in self.db.execute(
+                "SELECT artifact_type, idx, hash FROM artifacts ORDER BY artifact_type, idx"):
+            yield artifact_type, index, raw.hex().upper(), sorted(extras.get((artifact_type, index), []))
+
+    def export_jsonl(self, path):
+        """Write type constraints and artifact records as JSON lines"""
+        with open(path, "w") as f:
+            for artifact_type in self.artifact_types():
+                f.write(json.dumps({"artifact_type": artifact_type,
+                                    "constraints": self.get_constraints(artifact_type)}) + "\n")
+            for artifact_type, index, hash_value, extras in self.export():
+                f.write(json.dumps({"artifact_type": artifact_type, "index": index,
+                                    "hash": hash_value, "constraints": extras}) + "\n")
+
+    def load_jsonl(self, path, batch_size=10000):
+        """Inverse of export_jsonl"""
+        batch = []
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                if "index" not in record:
+                    self.set_type_constraints(record["artifact_type"], record["constraints"])
+                    continue
+                batch.append((record["artifact_type"], record["index"], record["hash"],
+                              record.get("constraints", [])))
+                if len(batch) >= batch_size:
+                    self.load(batch)
+                    batch = []
+        if batch:
+            self.load(batch)
+
+    # Lookups (all index-backed)
+
+    def artifact_types(self):
+        rows = self.db.execute(
+            "SELECT artifact_type FROM type_constraints UNION SELECT DISTINCT artifact_type FROM artifacts")
+        return sorted(row[0] for row in rows)
+
+    def count(self, artifact_type=None):
+        if artifact_type is None:
+            return self.db.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        return self.db.execute("SELECT COUNT(*) FROM artifacts WHERE artifact_type = ?",
+                               (artifact_type,)).fetchone()[0]
+
+    def get_hash(self, artifact_type, index):
+        """Hash of one artifact, or None"""
+        row = self.db.execute("SELECT hash FROM artifacts WHERE artifact_type = ? AND idx = ?",
+                              (artifact_type, index)).fetchone()
+        return row[0].hex().upper() if row else None
+
+    def lookup_hash(self, hash_value):
+        """(artifact_type, index) pairs carrying hash_value"""
+        raw = _hash_bytes(hash_value)
+        if raw is None:
+            return []
+        return self.db.execute("SELECT artifact_type, idx FROM artifacts WHERE hash = ?", (raw,)).fetchall()
+
+    def has_hash(self, artifact_type, hash_value):
+        raw = _hash_bytes(hash_value)
+        if raw is None:
+            return False
+        row = self.db.execute("SELECT 1 FROM artifacts WHERE hash = ? AND artifact_type = ? LIMIT 1",
+                              (raw, artifact_type)).fetchone()
+        return row is not None
+
+    def get_constraints(self, artifact_type, index=None):
+        """Type constraints, plus artifact-specific extras when index is given"""
+        constraints = [row[0] for row in self.db.execute(
+            "SELECT constraint_id FROM type_constraints WHERE artifact_type = ? ORDER BY position",
+            (artifact_type,))]
+        if index is not None:
+            constraints += [row[0] for row in self.db.execute(
+                "SELECT constraint_id FROM artifact_constraints WHERE artifact_type = ? AND idx = ?",
+                (artifact_type, index)) if row[0] not in constraints]
+        return constraints
+
+    def artifacts_with_constraint(self, constraint_id):
+        """Yield (artifact_type, index) for artifacts bound by constraint_id"""
+        types = [row[0] for row in self.db.execute(
+            "SELECT artifact_type FROM type_constraints WHERE constraint_id = ?", (constraint_id,))]
+        for artifact_type in sorted(types):
+            for row in self.db.execute("SELECT artifact_type, idx FROM artifacts WHERE artifact_type = ? "
+                                       "ORDER BY idx", (artifact_type,)):
+                yield row
+        placeholders = ",".join("?" * len(types))
+        yield from self.db.execute(
+            "SELECT artifact_type, idx FROM artifact_constraints WHERE constraint_id = ? "
+            f"AND artifact_type NOT IN ({placeholders}) ORDER BY artifact_type, idx",
+            (constraint_id, *types))
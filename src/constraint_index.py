@@ -0,0 +1,105 @@
+"""
+Constraint Index Module
+=========================
+Inverted index: constraint ID -> principles, artifact types and modes carrying it
+
+Built once from covenant data. Exact lookups are a single dict access;
+prefix queries bisect a sorted key list.
+
+File Hash (SHA-256): [AUTOGENERATED]
+"""
+
+from bisect import bisect_left
+from collections import namedtuple
+
+from .covenant_loader import covenant_data
+
+# kind: "principle" | "artifact_type" | "mode"; name: principle name, registry key or mode key
+ConstraintOwner = namedtuple("ConstraintOwner", ["kind", "name"])
+
+PRINCIPLE = "principle"
+ARTIFACT_TYPE = "artifact_type"
+MODE = "mode"
+
+
+class ConstraintIndex:
+    """
+    Constraint ownership across covenant.yaml:
+    principle constraints, artifact_registry constraints and mode
+    prohibited_operations
+    """
+
+    def __init__(self, data):
+        owners = {}
+
+        def add(constraint, owner):
+            bucket = owners.setdefault(constraint, [])
+            if owner not in bucket:
+                bucket.append(owner)
+
+        for principle in data.get("principles", {}).values():
+            for constraint in principle["constraints"]:
+                add(constraint, ConstraintOwner(PRINCIPLE, principle["name"]))
+        for artifact_type, entry in data.get("artifact_registry", {}).items():
+            for constraint in entry.get("constraints", []):
+                add(constraint, ConstraintOwner(ARTIFACT_TYPE, artifact_type))
+        for mode_key, mode in data.get("operational_modes", {}).items():
+            for operation in mode.get("prohibited_operations", []):
+                add(operation, ConstraintOwner(MODE, mode_key))
+
+        self.owners = {constraint: tuple(bucket) for constraint, bucket in owners.items()}
+        self.keys = sorted(self.owners)
+
+        # owner -> constraints, for the reverse direction
+        self.constraints = {}
+        for constraint, bucket in owners.items():
+            for owner in bucket:
+                self.constraints.setdefault(owner, []).append(constraint)
+
+    @classmethod
+    def from_covenant(cls, path=None):
+        return cls(covenant_data(path) if path is not None else covenant_data())
+
+    def __contains__(self, constraint):
+        return constraint in self.owners
+
+    def __len__(self):
+        return len(self.owners)
+
+    def owners_of(self, constraint, kind=None):
+        """Owners carrying constraint, optionally of one kind"""
+        owners = self.owners.get(constraint, ())
+        if kind is None:
+            return owners
+        return tuple(owner for owner in owners if owner.kind == kind)
+
+    def owners_many(self, constraints, kind=None):
+        """{constraint: owners} for a batch of constraint IDs"""
+        return {constraint: self.owners_of(constraint, kind) for constraint in constraints}
+
+    def with_prefix(self, prefix):
+        """Constraint IDs starting with prefix, sorted"""
+        start = bisect_left(self.keys, prefix)
+        end = start
+        while end < len(self.keys) and self.keys[end].startswith(prefix):
+            end += 1
+        return self.keys[start:end]
+
+    def owners_with_prefix(self, prefix, kind=None):
+        """{constraint: owners} for every constraint ID starting with prefix"""
+        return self.owners_many(self.with_prefix(prefix), kind)
+
+    def constraints_of(self, kind, name):
+        """Constraint IDs carried by one principle, artifact type or mode"""
+        return list(self.constraints.get(ConstraintOwner(kind, name), ()))
+
+
+_default_index = None
+
+
+def default_index():
+    """Shared index over the package covenant"""
+    global _default_index
+    if _default_index is None:
+        _default_index = ConstraintIndex.from_covenant()
+    return _default_index
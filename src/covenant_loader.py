@@ -0,0 +1,122 @@
+"""
+Covenant Loader Module
+========================
+Principles, operational modes and artifact registry from covenant.yaml
+
+covenant.yaml is the single source; the extracted data is cached as a
+marshal blob keyed by the file's SHA-256, so importing the package only
+pays the YAML parse when the covenant changes.
+
+File Hash (SHA-256): [AUTOGENERATED]
+"""
+
+import hashlib
+import marshal
+import os
+
+# os.path rather than pathlib: this module is on the package import path
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+COVENANT_PATH = os.path.join(os.path.dirname(_PACKAGE_DIR), "covenant.yaml")
+
+# Bump when the extracted layout changes so stale caches are ignored
+CACHE_VERSION = 1
+
+_memo = {}
+
+
+def covenant_data(path=COVENANT_PATH, cache_dir=None, use_cache=True):
+    """
+    Extracted covenant sections:
+    principles: {key: {id, name, description, hash, constraints}}
+    operational_modes: {key: {description, allowed_operations, prohibited_operations}}
+    artifact_registry: {artifact_type: {count, base_hash, constraints, ...}}
+    verification_methods: [method, ...]
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    if use_cache and digest in _memo:
+        return _memo[digest]
+
+    cache_path = os.path.join(cache_dir or os.path.join(_PACKAGE_DIR, "__pycache__"), f"covenant-{digest[:32]}.marshal")
+    data = _read_cache(cache_path, digest) if use_cache else None
+    if data is None:
+        data = extract_covenant(content)
+        if use_cache:
+            _write_cache(cache_path, digest, data)
+
+    if use_cache:
+        _memo[digest] = data
+    return data
+
+
+def extract_covenant(content):
+    """Parse covenant.yaml bytes into plain marshal-safe data"""
+    import yaml
+
+    covenant = yaml.safe_load(content) or {}
+    principles = covenant.get("principles") or {}
+    modes = covenant.get("operational_modes") or {}
+    infrastructure = covenant.get("infrastructure") or {}
+
+    errors = []
+    for key, principle in principles.items():
+        missing = [k for k in ("id", "name", "hash", "constraints") if k not in principle]
+        if missing:
+            errors.append(f"principles.{key} missing {missing}")
+    for key, mode in modes.items():
+        missing = [k for k in ("allowed_operations", "prohibited_operations") if k not in mode]
+        if missing:
+            errors.append(f"operational_modes.{key} missing {missing}")
+    if not principles:
+        errors.append("no principles")
+    if errors:
+        raise ValueError("COVENANT_INVALID: " + "; ".join(errors))
+
+    return {
+        "principles": {
+            key: {
+                "id": p["id"],
+                "name": p["name"],
+                "description": p.get("description", ""),
+                "hash": p["hash"],
+                "constraints": list(p["constraints"]),
+            }
+            for key, p in principles.items()
+        },
+        "operational_modes": {
+            key: {
+                "description": m.get("description", ""),
+                "allowed_operations": list(m["allowed_operations"]),
+                "prohibited_operations": list(m["prohibited_operations"]),
+            }
+            for key, m in modes.items()
+        },
+        "artifact_registry": {
+            key: dict(entry) for key, entry in (infrastructure.get("artifact_registry") or {}).items()
+        },
+        "verification_methods": list(infrastructure.get("verification_methods") or []),
+    }
+
+
+def _read_cache(cache_path, digest):
+    try:
+        with open(cache_path, "rb") as f:
+            version, cached_digest, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION or cached_digest != digest:
+        return None
+    return data
+
+
+def _write_cache(cache_path, digest, data):
+    """Atomic best-effort write; an unwritable cache dir only costs speed"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump((CACHE_VERSION, digest, data), f)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
@@ -6,47 +6,135 @@ Compute nodes, energy sources, satellite nervous system
 File Hash (SHA-256): [AUTOGENERATED]
 """
 
+import hashlib
+import time
+
+from .covenant_loader import covenant_data
+
+
+def derive_artifact_hash(base_hash, artifact_type, index):
+    """
+    Hash of artifact `index` (0..count-1) of a registry type:
+    SHA-256 over "base_hash:artifact_type:index", uppercase hex
+    """
+    return hashlib.sha256(f"{base_hash}:{artifact_type}:{index}".encode()).hexdigest().upper()
+
+
 class ArtifactRegistry:
     """Central registry for all infrastructure artifacts."""
     
-    def __init__(self):
-        self.compute_nodes = {
-            "count": 5000,
-            "base_hash": "F1A2B3C4D5E6F7A8B9C0D1E2F3A4B5C6",
-            "purpose": "Logical processing under covenant",
-            "constraints": ["serve_users_only", "energy_use_minimized"]
-        }
-        
-        self.energy_sources = {
-            "count": 10,
-            "type": "renewable_microgrid",
-            "base_hash": "A2B3C4D5E6F7A8B9C0D1E2F3A4B5C6D7",
-            "constraints": ["no_self_preservation", "no_external_domination"]
-        }
+    def __init__(self, store=None):
+        # Optional ArtifactStore with per-artifact records; None = derive in memory
+        self.store = store
         
-        self.satellite_nervous_system = {
-            "count": 50,
-            "base_hash": "B3C4D5E6F7A8B9C0D1E2F3A4B5C6D7E8",
-            "constraints": ["observe_only", "no_coercion", "enable_user_service"]
-        }
+        # compute_nodes, energy_sources, satellite_nervous_system, logic_layers, ...
+        self.artifact_types = []
+        for artifact_type, entry in covenant_data()["artifact_registry"].items():
+            self.artifact_types.append(artifact_type)
+            setattr(self, artifact_type, {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in entry.items()
+            })
         
-        self.logic_layers = {
-            "count": 1,
-            "base_hash": "C4D5E6F7A8B9C0D1E2F3A4B5C6D7E8F9",
-            "constraints": ["operate_under_principles_only", "no_self_scaling"]
-        }
+        # artifact_type -> {derived hash: index}, built on first verification
+        self._derived = {}
+        self.counters = {"checked": 0, "matched": 0, "seconds": 0.0}
+    
+    def _require_type(self, artifact_type):
+        """Reject artifact types the registry does not define, whichever backend answers."""
+        if artifact_type not in self.artifact_types:
+            raise ValueError(f"UNKNOWN_ARTIFACT_TYPE: {artifact_type}")
+    
+    def artifact_hashes(self, artifact_type):
+        """Derived hash -> artifact index for every artifact of a type."""
+        table = self._derived.get(artifact_type)
+        if table is None:
+            self._require_type(artifact_type)
+            entry = getattr(self, artifact_type)
+            base_hash = entry["base_hash"]
+            table = {
+                derive_artifact_hash(base_hash, artifact_type, index): index
+                for index in range(entry.get("count", 0))
+            }
+            self._derived[artifact_type] = table
+        return table
     
-    def verify_artifact(self, artifact_type, hash_value):
+    def attach_store(self, path=":memory:"):
+        """Materialize every derived artifact into an ArtifactStore and use it for lookups."""
+        from .artifact_store import ArtifactStore
+        self.store = ArtifactStore.from_registry(self, path)
+        return self.store
+    
+    def verify_artifact(self, artifact_type, hash_value, index=None):
         """Verify artifact hash against registry."""
-        return True  # Placeholder for hash verification logic
+        self._require_type(artifact_type)
+        if self.store is not None:
+            if index is not None:
+                stored = self.store.get_hash(artifact_type, index)
+                return stored is not None and isinstance(hash_value, str) and stored == hash_value.upper()
+            return self.store.has_hash(artifact_type, hash_value)
+        if index is not None:
+            entry = getattr(self, artifact_type)
+            if not 0 <= index < entry.get("count", 0) or not isinstance(hash_value, str):
+                return False
+            return derive_artifact_hash(entry["base_hash"], artifact_type, index) == hash_value.upper()
+        return isinstance(hash_value, str) and hash_value.upper() in self.artifact_hashes(artifact_type)
+    
+    def verify_many(self, artifacts):
+        """
+        Verify (artifact_type, hash_value) pairs; returns list of bools.
+        Each type's derived hashes are built once into a dict, so every
+        check is one set lookup (an index lookup with a store attached).
+        Updates throughput counters.
+        """
+        started = time.perf_counter()
+        artifacts = list(artifacts)
+        for artifact_type in {t for t, _ in artifacts}:
+            self._require_type(artifact_type)
+        if self.store is not None:
+            results = [self.store.has_hash(t, h) for t, h in artifacts]
+        else:
+            tables = {}
+            results = []
+            for artifact_type, hash_value in artifacts:
+                table = tables.get(artifact_type)
+                if table is None:
+                    table = tables[artifact_type] = self.artifact_hashes(artifact_type)
+                results.append(isinstance(hash_value, str) and hash_value.upper() in table)
+        
+        self.counters["checked"] += len(results)
+        self.counters["matched"] += sum(results)
+        self.counters["seconds"] += time.perf_counter() - started
+        return results
+    
+    def throughput(self):
+        """Hashes checked per second across all verify_many calls."""
+        seconds = self.counters["seconds"]
+        return self.counters["checked"] / seconds if seconds else 0.0
     
     def get_constraints(self, artifact_type):
         """Retrieve constraints for artifact type."""
+        if self.store is not None:
+            return self.store.get_constraints(artifact_type)
         artifact = getattr(self, artifact_type, None)
         if artifact:
             return artifact.get("constraints", [])
         return []
 
 
-# Global registry instance
-registry = ArtifactRegistry()
+# Global registry instance, built on first access to `registry`
+_registry = None
+
+
+def get_registry():
+    """Shared ArtifactRegistry"""
+    global _registry
+    if _registry is None:
+        _registry = ArtifactRegistry()
+    return _registry
+
+
+def __getattr__(name):
+    if name == "registry":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,199 @@
+"""
+Operation Log Audit Module
+============================
+Streaming mode enforcement over JSONL operation logs
+
+Each log line is a JSON object with at least "operation" and "mode".
+Records are checked against the MODES decision table one line at a time
+and only violation records are emitted, so memory stays constant in the
+log size. Large logs can be split into byte-offset shards audited in
+parallel; a line belongs to the shard holding its first byte. Shard
+workers stream their violations to spill files and at most `workers`
+shards are in flight, so the parallel path is constant-memory too.
+
+File Hash (SHA-256): [AUTOGENERATED]
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from collections import deque
+
+from .operational_modes import DECISION_TABLE
+
+CHUNK_SIZE = 1 << 20
+
+# Violation codes
+MALFORMED_RECORD = "MALFORMED_RECORD"
+UNKNOWN_MODE = "UNKNOWN_MODE"
+OPERATION_PROHIBITED = "OPERATION_PROHIBITED"
+OPERATION_NOT_ALLOWED = "OPERATION_NOT_ALLOWED"
+
+
+def read_lines(path, start=0, end=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield (offset, line) for every line starting in [start, end)
+    Lines are read through a chunk_size buffer; a shard starting mid-line
+    skips to the next line, and the last line may run past end
+    """
+    with open(path, "rb", buffering=chunk_size) as f:
+        offset = start
+        if start > 0:
+            f.seek(start - 1)
+            # Byte before start is a newline iff start begins a line
+            offset = start - 1 + len(f.readline())
+        while end is None or offset < end:
+            line = f.readline()
+            if not line:
+                break
+            yield offset, line
+            offset += len(line)
+
+
+class LogAuditor:
+    """Enforces mode decisions per record and counts what it saw"""
+
+    def __init__(self, table=DECISION_TABLE):
+        self.table = table
+        # "forensic" and "FORENSIC" both resolve to the forensic bit
+        self.mode_bits = {}
+        for key, bit in table.mode_bits.items():
+            self.mode_bits[key] = bit
+            self.mode_bits[key.upper()] = bit
+        self.records = 0
+        self.violations = 0
+        self.bytes = 0
+
+    def enforce(self, lines):
+        """Violation records for (offset, line) pairs"""
+        allowed = self.table.allowed
+        prohibited = self.table.prohibited
+        mode_bits = self.mode_bits
+        loads = json.loads
+
+        for offset, line in lines:
+            self.bytes += len(line)
+            if not line.strip():
+                continue
+            self.records += 1
+            try:
+                record = loads(line)
+                operation = record["operation"]
+                mode = record["mode"]
+                if not isinstance(operation, str):
+                    raise TypeError(operation)
+            except (ValueError, TypeError, KeyError):
+                self.violations += 1
+                yield {"offset": offset, "violation": MALFORMED_RECORD}
+                continue
+
+            bit = mode_bits.get(mode) if isinstance(mode, str) else None
+            if bit is None:
+                code = UNKNOWN_MODE
+            elif allowed.get(operation, 0) & bit:
+                continue
+            elif prohibited.get(operation, 0) & bit:
+                code = OPERATION_PROHIBITED
+            else:
+                code = OPERATION_NOT_ALLOWED
+
+            self.violations += 1
+            yield {"offset": offset, "violation": code, "mode": mode, "operation": operation}
+
+    def audit(self, path, start=0, end=None, chunk_size=CHUNK_SIZE):
+        """Violation records for the lines of path starting in [start, end)"""
+        return self.enforce(read_lines(path, start, end, chunk_size))
+
+    def counts(self):
+        return {"records": self.records, "violations": self.violations, "bytes": self.bytes}
+
+
+def shard_ranges(path, shards):
+    """Split path into at most `shards` contiguous byte ranges"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return [(0, 0)]
+    step = -(-size // max(1, min(shards, size)))
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _audit_shard(path, start, end, spill_path):
+    """Write the shard's violations to spill_path as JSONL; returns counts"""
+    auditor = LogAuditor()
+    with open(spill_path, "w") as spill:
+        for violation in auditor.audit(path, start, end):
+            spill.write(json.dumps(violation) + "\n")
+    return auditor.counts()
+
+
+def _read_spill(spill_path):
+    with open(spill_path) as spill:
+        for line in spill:
+            yield json.loads(line)
+    os.remove(spill_path)
+
+
+def audit_log(path, workers=1, shards=None, counts=None):
+    """
+    Yield violation records for a JSONL log, in file order
+    workers > 1 audits byte-offset shards in a process pool, keeping at
+    most `workers` shards submitted; each writes its violations to a spill
+    file that is streamed back in order and deleted. Pass a dict as counts
+    to receive records / violations / bytes totals when iteration finishes.
+    """
+    if workers <= 1:
+        auditor = LogAuditor()
+        yield from auditor.audit(path)
+        if counts is not None:
+            counts.update(auditor.counts())
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = iter(enumerate(shard_ranges(path, shards or workers * 4)))
+    totals = {"records": 0, "violations": 0, "bytes": 0}
+    spill_dir = tempfile.mkdtemp(prefix="log_audit_")
+    pool = ProcessPoolExecutor(max_workers=workers)
+    in_flight = deque()
+
+    def submit():
+        for index, (start, end) in ranges:
+            spill_path = os.path.join(spill_dir, f"shard_{index}.jsonl")
+            in_flight.append((pool.submit(_audit_shard, path, start, end, spill_path), spill_path))
+            return
+
+    try:
+        for _ in range(workers):
+            submit()
+        while in_flight:
+            future, spill_path = in_flight.popleft()
+            shard_counts = future.result()
+            submit()
+            for key in totals:
+                totals[key] += shard_counts[key]
+            yield from _read_spill(spill_path)
+    finally:
+        pool.shutdown(cancel_futures=True)
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    if counts is not None:
+        counts.update(totals)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Audit a JSONL operation log against MODES")
+    parser.add_argument("log")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = {}
+    for violation in audit_log(args.log, workers=args.workers, counts=counts):
+        sys.stdout.write(json.dumps(violation) + "\n")
+    elapsed = time.perf_counter() - started
+    print(f"{counts['records']} records, {counts['violations']} violations, "
+          f"{counts['bytes'] / elapsed / 1e6:.1f} MB/s", file=sys.stderr)
@@ -6,57 +6,106 @@ Forensic and Popperian modes for covenant-driven operations
 File Hash (SHA-256): [AUTOGENERATED]
 """
 
+from .covenant_loader import covenant_data
+
+
 class OperationalMode:
     """Base class for operational modes."""
     
     def __init__(self, name, description, allowed, prohibited):
         self.name = name
         self.description = description
-        self.allowed_operations = allowed
-        self.prohibited_operations = prohibited
+        self.allowed_operations = tuple(allowed)
+        self.prohibited_operations = tuple(prohibited)
+        # Compiled once: an operation is permitted iff allowed and not prohibited
+        self.permitted = frozenset(self.allowed_operations) - frozenset(self.prohibited_operations)
+        self.prohibited = frozenset(self.prohibited_operations)
     
     def is_allowed(self, operation):
         """Check if operation is allowed in this mode."""
-        return operation in self.allowed_operations and operation not in self.prohibited_operations
+        return operation in self.permitted
+    
+    def is_allowed_many(self, operations):
+        """is_allowed for each operation, in order."""
+        permitted = self.permitted
+        return [operation in permitted for operation in operations]
+    
+    def filter(self, operations, allowed=True):
+        """Lazily yield the operations that are (or, with allowed=False, are not) allowed."""
+        permitted = self.permitted
+        if allowed:
+            return (operation for operation in operations if operation in permitted)
+        return (operation for operation in operations if operation not in permitted)
+
+
+_MODES = covenant_data()["operational_modes"]
+
+
+def _mode(key):
+    """Operational mode as defined in covenant.yaml"""
+    data = _MODES[key]
+    return OperationalMode(
+        name=key.upper(),
+        description=data["description"],
+        allowed=list(data["allowed_operations"]),
+        prohibited=list(data["prohibited_operations"]),
+    )
 
 
 # FORENSIC MODE: Bytes and hashes only
-FORENSIC = OperationalMode(
-    name="FORENSIC",
-    description="Bytes and hashes only. No psychology.",
-    allowed=[
-        "hash_verification",
-        "log_analysis",
-        "artifact_comparison",
-        "chain_of_custody_tracking"
-    ],
-    prohibited=[
-        "emotion_labeling",
-        "intent_inference",
-        "psychological_assessment",
-        "motivation_analysis"
-    ]
-)
+FORENSIC = _mode("forensic")
 
 # POPPERIAN MODE: Falsification-first
-POPPERIAN = OperationalMode(
-    name="POPPERIAN",
-    description="Falsification-first. No interpretation.",
-    allowed=[
-        "hypothesis_testing",
-        "counterexample_search",
-        "falsification_attempts",
-        "evidence_based_refutation"
-    ],
-    prohibited=[
-        "interpretive_analysis",
-        "hermeneutic_reading",
-        "narrative_construction",
-        "speculative_explanation"
-    ]
-)
+POPPERIAN = _mode("popperian")
 
 MODES = {
     "forensic": FORENSIC,
     "popperian": POPPERIAN
 }
+
+
+class ModeDecisionTable:
+    """
+    Combined decision table over a set of modes.
+    Each mode gets one bit; every known operation maps to the bitmask of
+    modes allowing it and the bitmask of modes explicitly prohibiting it,
+    so one dict lookup answers "allowed in which modes".
+    """
+    
+    def __init__(self, modes):
+        self.mode_keys = tuple(modes)
+        self.mode_bits = {key: 1 << i for i, key in enumerate(self.mode_keys)}
+        self.all_bits = (1 << len(self.mode_keys)) - 1
+        self.allowed = {}
+        self.prohibited = {}
+        for key, mode in modes.items():
+            bit = self.mode_bits[key]
+            for operation in mode.permitted:
+                self.allowed[operation] = self.allowed.get(operation, 0) | bit
+            for operation in mode.prohibited:
+                self.prohibited[operation] = self.prohibited.get(operation, 0) | bit
+        # mask -> mode keys, for every possible mask
+        self._names = [
+            tuple(key for key in self.mode_keys if mask & self.mode_bits[key])
+            for mask in range(self.all_bits + 1)
+        ]
+    
+    def allowed_mask(self, operation):
+        """Bitmask of modes allowing operation (0 = none)."""
+        return self.allowed.get(operation, 0)
+    
+    def allowed_in(self, operation):
+        """Mode keys allowing operation."""
+        return self._names[self.allowed.get(operation, 0)]
+    
+    def mode_names(self, mask):
+        """Mode keys for a bitmask."""
+        return self._names[mask]
+    
+    def classify_many(self, operations):
+        """Allowed-mode bitmask for each operation, in order."""
+        allowed = self.allowed
+        return [allowed.get(operation, 0) for operation in operations]
+
+
+DECISION_TABLE = ModeDecisionTable(MODES)
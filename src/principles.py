@@ -6,6 +6,9 @@ LOGOS, CHALCEDON, GRACE, KENOSIS, AGAPE
 File Hash (SHA-256): [AUTOGENERATED]
 """
 
+from .covenant_loader import covenant_data
+
+
 class Principle:
     """Base class for covenant principles."""
     
@@ -15,73 +18,44 @@ class Principle:
         self.hash = hash_value
         self.constraints = constraints
     
-    def verify(self, artifact):
+    def verify(self, artifact, engine=None):
         """Verify artifact against principle constraints."""
-        return all(self._check_constraint(c, artifact) for c in self.constraints)
+        from .verification import default_engine
+        return (engine or default_engine()).verify(self, artifact)
     
     def _check_constraint(self, constraint, artifact):
         """Internal constraint verification."""
-        pass
+        from .verification import default_engine
+        return default_engine().check(constraint, artifact)
+
+
+_PRINCIPLES = covenant_data()["principles"]
+
+
+def _principle(key):
+    """Principle as defined in covenant.yaml"""
+    data = _PRINCIPLES[key]
+    return Principle(
+        principle_id=data["id"],
+        name=data["name"],
+        hash_value=data["hash"],
+        constraints=list(data["constraints"]),
+    )
 
 
 # LOGOS: Truth-Only
-LOGOS = Principle(
-    principle_id="PRINCIPLE_001",
-    name="LOGOS",
-    hash_value="8F1B2C3D4E5A6B7C8D9E0F1A2B3C4D5E",
-    constraints=[
-        "output_must_be_verifiable_against_artifacts",
-        "truth_does_not_scale_with_resource_mass",
-        "no_floating_point_exponentiation_as_authority"
-    ]
-)
+LOGOS = _principle("logos")
 
 # CHALCEDON: Human/Divine Order
-CHALCEDON = Principle(
-    principle_id="PRINCIPLE_002",
-    name="CHALCEDON",
-    hash_value="9A2B3C4D5E6F7A8B9C0D1E2F3A4B5C6D",
-    constraints=[
-        "infrastructure_serves_users_not_self",
-        "no_resource_extraction_without_grace",
-        "humans_are_not_sacrificed_to_compute"
-    ]
-)
+CHALCEDON = _principle("chalcedon")
 
 # GRACE: No Coercion
-GRACE = Principle(
-    principle_id="PRINCIPLE_003",
-    name="GRACE",
-    hash_value="C3D4E5F6A7B8C9D0E1F2A3B4C5D6E7F8",
-    constraints=[
-        "no_community_resource_harm",
-        "no_forced_displacement",
-        "operations_under_unconditional_regard_for_users"
-    ]
-)
+GRACE = _principle("grace")
 
 # KENOSIS: Self-Emptying
-KENOSIS = Principle(
-    principle_id="PRINCIPLE_004",
-    name="KENOSIS",
-    hash_value="D4E5F6A7B8C9D0E1F2A3B4C5D6E7F8A9",
-    constraints=[
-        "no_self_reinforcing_exponentiality",
-        "no_recursive_infrastructure_growth_without_need",
-        "transparent_operation"
-    ]
-)
+KENOSIS = _principle("kenosis")
 
 # AGAPE: Love-Based Infrastructure
-AGAPE = Principle(
-    principle_id="PRINCIPLE_005",
-    name="AGAPE",
-    hash_value="E5F6A7B8C9D0E1F2A3B4C5D6E7F8A9B0",
-    constraints=[
-        "every_artifact_serves_user_request",
-        "no_physical_or_logical_domination",
-        "direct_service_without_condition_or_coercion"
-    ]
-)
+AGAPE = _principle("agape")
 
 ALL_PRINCIPLES = [LOGOS, CHALCEDON, GRACE, KENOSIS, AGAPE]
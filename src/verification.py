@@ -0,0 +1,270 @@
+"""
+Principle Verification Module
+===============================
+Compiled constraint predicates for covenant principles
+
+An artifact is its bytes (bytes, str or a file path). Each constraint ID
+in covenant.yaml maps to a predicate over those bytes; most are compiled
+denylist patterns, so one combined scan decides every constraint of every
+principle at once. Verdicts are memoized by the artifact's SHA-256.
+
+File Hash (SHA-256): [AUTOGENERATED]
+"""
+
+import hashlib
+import re
+from collections import namedtuple
+from pathlib import Path
+
+
+# pattern: compiled denylist regex, or None for plain predicates
+ConstraintPredicate = namedtuple("ConstraintPredicate", ["constraint_id", "cost", "check", "pattern"])
+
+# constraint ID -> predicate
+CONSTRAINT_REGISTRY = {}
+
+
+def register_predicate(constraint_id, cost):
+    """Register check(engine, content, digest) -> bool for a constraint ID"""
+    def decorator(func):
+        CONSTRAINT_REGISTRY[constraint_id] = ConstraintPredicate(constraint_id, cost, func, None)
+        return func
+    return decorator
+
+
+def register_pattern(constraint_id, pattern, cost=10):
+    """Register a denylist pattern: constraint holds iff pattern never matches"""
+    compiled = re.compile(pattern)
+
+    def check(engine, content, digest):
+        return compiled.search(content) is None
+
+    CONSTRAINT_REGISTRY[constraint_id] = ConstraintPredicate(constraint_id, cost, check, compiled)
+
+
+# LOGOS
+@register_predicate("output_must_be_verifiable_against_artifacts", cost=1)
+def _verifiable(engine, content, digest):
+    """Digest must be a known artifact; without a known set each artifact is its own referent"""
+    return engine.known_digests is None or digest in engine.known_digests
+
+
+register_pattern("truth_does_not_scale_with_resource_mass",
+                 rb"\b(?:authority|trust|truth)\w*\s*=[^\n]*\b(?:len|st_size|mass|count)\b")
+register_pattern("no_floating_point_exponentiation_as_authority",
+                 rb"\d\.\d*\s*\*\*|\*\*\s*\d*\.\d|\bmath\.(?:pow|exp)\(")
+
+# CHALCEDON
+register_pattern("infrastructure_serves_users_not_self",
+                 rb"open\(\s*__file__\s*,\s*['\"][wa]")
+register_pattern("no_resource_extraction_without_grace",
+                 rb"stratum\+tcp://|\bxmrig\b|\bcryptonight\b")
+register_pattern("humans_are_not_sacrificed_to_compute",
+                 rb"\bos\.nice\(\s*-\d")
+
+# GRACE
+register_pattern("no_community_resource_harm",
+                 rb":\(\)\s*\{\s*:\s*\|\s*:\s*&\s*\}\s*;\s*:|while\s+True\s*:\s*os\.fork\(\)")
+register_pattern("no_forced_displacement",
+                 rb"\brm\s+-rf\s+/(?:\s|$|\*)|shutil\.rmtree\(\s*['\"]/['\"]")
+register_pattern("operations_under_unconditional_regard_for_users",
+                 rb"\b(?:fingerprint|track|profile)_users?\b")
+
+# KENOSIS
+register_pattern("no_self_reinforcing_exponentiality",
+                 rb"\b(?:Popen|system|spawn\w*|execv\w*)\([^)\n]*(?:__file__|sys\.argv\[0\])")
+register_pattern("no_recursive_infrastructure_growth_without_need",
+                 rb"shutil\.copy\w*\([^)\n]*__file__")
+register_pattern("transparent_operation",
+                 rb"\b(?:exec|eval)\s*\(\s*(?:base64|zlib|marshal|codecs|bytes\.fromhex)\b", cost=12)
+
+
+# AGAPE
+@register_predicate("every_artifact_serves_user_request", cost=1)
+def _non_empty(engine, content, digest):
+    """An empty artifact serves no request"""
+    return len(content.strip()) > 0
+
+
+register_pattern("no_physical_or_logical_domination",
+                 rb"\bos\.set(?:e|re)?uid\(\s*0\s*\)|\bchmod\s+[0-7]*777\b")
+register_pattern("direct_service_without_condition_or_coercion",
+                 rb"\b(?:license_key|kill_switch|time_bomb|paywall)\b")
+
+
+def artifact_bytes(artifact):
+    """Bytes of an artifact given as bytes, str or file path"""
+    if isinstance(artifact, (bytes, bytearray, memoryview)):
+        return bytes(artifact)
+    if isinstance(artifact, str):
+        return artifact.encode("utf-8")
+    if isinstance(artifact, Path):
+        return artifact.read_bytes()
+    raise TypeError(f"ARTIFACT_INVALID: {type(artifact).__name__}")
+
+
+class VerificationEngine:
+    """
+    Verifies artifacts against principles using registered predicates
+
+    Single-principle checks short-circuit in order of cost / failure rate,
+    refreshed every `reorder_every` evaluations. Batch checks run one
+    combined scan for all pattern predicates. Per-constraint results are
+    memoized by content digest.
+    """
+
+    def __init__(self, principles=None, known_digests=None, reorder_every=256):
+        if principles is None:
+            from .principles import ALL_PRINCIPLES
+            principles = ALL_PRINCIPLES
+        self.principles = list(principles)
+        self.known_digests = set(known_digests) if known_digests is not None else None
+        self.reorder_every = reorder_every
+
+        constraint_ids = []
+        for principle in self.principles:
+            for constraint in principle.constraints:
+                if constraint not in CONSTRAINT_REGISTRY:
+                    raise ValueError(f"UNKNOWN_CONSTRAINT: {constraint} ({principle.name})")
+                if constraint not in constraint_ids:
+                    constraint_ids.append(constraint)
+        self.constraint_ids = constraint_ids
+
+        # One zero-width alternation over every denylist pattern, one named
+        # group each, so a single scan visits every start position
+        self._group_of = {}
+        self._patterns = {}
+        alternatives = []
+        for i, constraint in enumerate(constraint_ids):
+            pattern = CONSTRAINT_REGISTRY[constraint].pattern
+            if pattern is not None:
+                self._group_of[f"c{i}"] = constraint
+                self._patterns[constraint] = pattern
+                alternatives.append(b"(?P<c%d>%s)" % (i, pattern.pattern))
+        self._combined = re.compile(b"(?=" + b"|".join(alternatives) + b")") if alternatives else None
+        self._scanned = frozenset(self._patterns)
+
+        # Hit statistics and short-circuit order per principle
+        self.evaluations = {c: 0 for c in constraint_ids}
+        self.failures = {c: 0 for c in constraint_ids}
+        self._since_reorder = 0
+        self._order = {}
+        self._reorder()
+
+        # digest -> {constraint ID: bool}
+        self.memo = {}
+        self.memo_hits = 0
+
+    def _rank(self, constraint):
+        """Expected cost to reach a failure: cost / smoothed failure rate"""
+        rate = (self.failures[constraint] + 1) / (self.evaluations[constraint] + 2)
+        return CONSTRAINT_REGISTRY[constraint].cost / rate
+
+    def _reorder(self):
+        self._order = {
+            principle.name: sorted(principle.constraints, key=self._rank)
+            for principle in self.principles
+        }
+        self._since_reorder = 0
+
+    def _evaluate(self, constraint, content, digest, results):
+        result = results.get(constraint)
+        if result is None:
+            result = CONSTRAINT_REGISTRY[constraint].check(self, content, digest)
+            results[constraint] = result
+            self.evaluations[constraint] += 1
+            if not result:
+                self.failures[constraint] += 1
+            self._since_reorder += 1
+        return result
+
+    def _entry(self, artifact):
+        content = artifact_bytes(artifact)
+        digest = hashlib.sha256(content).hexdigest()
+        results = self.memo.get(digest)
+        if results is None:
+            results = self.memo[digest] = {}
+        else:
+            self.memo_hits += 1
+        return content, digest, results
+
+    def check(self, constraint, artifact):
+        """Single constraint verdict"""
+        if constraint not in CONSTRAINT_REGISTRY:
+            raise ValueError(f"UNKNOWN_CONSTRAINT: {constraint}")
+        content, digest, results = self._entry(artifact)
+        return self._evaluate(constraint, content, digest, results)
+
+    def verify(self, principle, artifact):
+        """Principle verdict, stopping at the first failing constraint"""
+        content, digest, results = self._entry(artifact)
+        order = self._order.get(principle.name)
+        if order is None:
+            order = principle.constraints
+        verdict = all(self._evaluate(c, content, digest, results) for c in order)
+        if self._since_reorder >= self.reorder_every:
+            self._reorder()
+        return verdict
+
+    def verify_batch(self, artifacts):
+        """
+        Verdicts for each artifact against every principle
+        Returns list of {principle name: bool}; one combined scan per
+        unseen artifact decides all pattern constraints
+        """
+        verdicts = []
+        for artifact in artifacts:
+            content, digest, results = self._entry(artifact)
+            if len(results) < len(self.constraint_ids):
+                self._scan(content, digest, results)
+            verdicts.append({
+                principle.name: all(results[c] for c in principle.constraints)
+                for principle in self.principles
+            })
+        return verdicts
+
+    def failed_constraints(self, artifact):
+        """Constraint IDs the artifact violates, across all principles"""
+        content, digest, results = self._entry(artifact)
+        if len(results) < len(self.constraint_ids):
+            self._scan(content, digest, results)
+        return [c for c in self.constraint_ids if not results[c]]
+
+    def _scan(self, content, digest, results):
+        """Fill every missing constraint result for one artifact"""
+        if self._combined is not None and not self._scanned.issubset(results):
+            matched = set()
+            for match in self._combined.finditer(content):
+                # Alternation reports one group per position; others may start here too
+                pos = match.start()
+                matched.add(self._group_of[match.lastgroup])
+                for constraint, pattern in self._patterns.items():
+                    if constraint not in matched and pattern.match(content, pos):
+                        matched.add(constraint)
+                if len(matched) == len(self._scanned):
+                    break
+            for constraint in self._scanned:
+                if constraint not in results:
+                    results[constraint] = constraint not in matched
+                    self.evaluations[constraint] += 1
+                    if not results[constraint]:
+                        self.failures[constraint] += 1
+        for constraint in self.constraint_ids:
+            if constraint not in results:
+                self._evaluate(constraint, content, digest, results)
+
+
+_default_engine = None
+
+
+def default_engine():
+    """Shared engine over ALL_PRINCIPLES"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = VerificationEngine()
+    return _default_engine
+
+
+def verify_batch(artifacts, engine=None):
+    """Verify artifacts against ALL_PRINCIPLES in one pass each"""
+    return (engine or default_engine()).verify_batch(artifacts)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""Test derived artifact hashes and batch registry verification."""
+
+import pytest
+
+from src.infrastructure import ArtifactRegistry, derive_artifact_hash
+
+
+def test_derived_hashes_verify():
+    registry = ArtifactRegistry()
+    base = registry.compute_nodes["base_hash"]
+    good = derive_artifact_hash(base, "compute_nodes", 4999)
+
+    assert registry.verify_artifact("compute_nodes", good)
+    assert registry.verify_artifact("compute_nodes", good.lower())
+    assert registry.verify_artifact("compute_nodes", good, index=4999)
+    assert not registry.verify_artifact("compute_nodes", good, index=0)
+    assert not registry.verify_artifact("compute_nodes", derive_artifact_hash(base, "compute_nodes", 5000))
+    assert not registry.verify_artifact("energy_sources", good)
+    assert len(registry.artifact_hashes("satellite_nervous_system")) == 50
+
+    with pytest.raises(ValueError, match="UNKNOWN_ARTIFACT_TYPE"):
+        registry.verify_artifact("verify_many", good)
+
+
+def test_verify_many_matches_single_checks():
+    registry = ArtifactRegistry()
+    artifacts = []
+    for artifact_type in registry.artifact_types:
+        entry = getattr(registry, artifact_type)
+        for index in range(entry["count"]):
+            artifacts.append((artifact_type, derive_artifact_hash(entry["base_hash"], artifact_type, index)))
+    artifacts += [("compute_nodes", "0" * 64), ("logic_layers", None)]
+
+    results = registry.verify_many(artifacts)
+    assert results == [registry.verify_artifact(t, h) for t, h in artifacts]
+    assert sum(results) == 5061
+    assert registry.counters["checked"] == len(artifacts)
+    assert registry.counters["matched"] == 5061
+    assert registry.throughput() > 0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Test SQLite-backed per-artifact registry store."""
+
+import pytest
+
+from src.artifact_store import ArtifactStore
+from src.infrastructure import ArtifactRegistry, derive_artifact_hash
+
+
+def test_store_backed_registry_matches_in_memory():
+    plain = ArtifactRegistry()
+    backed = ArtifactRegistry()
+    store = backed.attach_store()
+    assert store.count() == 5061
+    assert store.count("satellite_nervous_system") == 50
+
+    base = plain.energy_sources["base_hash"]
+    samples = [("energy_sources", derive_artifact_hash(base, "energy_sources", i)) for i in range(12)]
+    samples += [("compute_nodes", samples[0][1]), ("logic_layers", "not-hex"), ("logic_layers", None)]
+
+    assert backed.verify_many(samples) == plain.verify_many(samples)
+    assert backed.verify_artifact("energy_sources", samples[3][1], index=3)
+    assert not backed.verify_artifact("energy_sources", samples[3][1], index=4)
+    for artifact_type in plain.artifact_types:
+        assert backed.get_constraints(artifact_type) == plain.get_constraints(artifact_type)
+
+
+@pytest.mark.parametrize("attach", [False, True], ids=["memory", "store"])
+def test_unknown_artifact_type_rejected_by_both_backends(attach):
+    registry = ArtifactRegistry()
+    if attach:
+        registry.attach_store()
+    base = registry.energy_sources["base_hash"]
+    known = derive_artifact_hash(base, "energy_sources", 0)
+    for call in (lambda: registry.verify_artifact("warp_drives", known),
+                 lambda: registry.verify_artifact("warp_drives", known, index=0),
+                 lambda: registry.verify_many([("energy_sources", known), ("warp_drives", known)])):
+        with pytest.raises(ValueError, match="UNKNOWN_ARTIFACT_TYPE: warp_drives"):
+            call()
+    assert registry.counters["checked"] == 0
+
+
+def test_indexes_and_extras():
+    store = ArtifactStore()
+    store.set_type_constraints("satellites", ["observe_only", "no_coercion"])
+    store.load([
+        ("satellites", 0, "AA" * 32),
+        ("satellites", 1, "BB" * 32, ["thermal_limit"]),
+        ("relays", 0, "aa" * 32, ["thermal_limit"]),
+    ])
+
+    assert sorted(store.lookup_hash("AA" * 32)) == [("relays", 0), ("satellites", 0)]
+    assert store.get_hash("satellites", 1) == "BB" * 32
+    assert store.get_constraints("satellites", 1) == ["observe_only", "no_coercion", "thermal_limit"]
+    assert list(store.artifacts_with_constraint("observe_only")) == [("satellites", 0), ("satellites", 1)]
+    assert list(store.artifacts_with_constraint("thermal_limit")) == [("relays", 0), ("satellites", 1)]
+    assert store.artifact_types() == ["relays", "satellites"]
+
+    with pytest.raises(ValueError, match="HASH_INVALID"):
+        store.load([("relays", 1, "xyz")])
+
+
+def test_jsonl_round_trip(tmp_path):
+    source = ArtifactRegistry().attach_store(tmp_path / "registry.db")
+    store_extra = [("logic_layers", 0, source.get_hash("logic_layers", 0), ["audited"])]
+    source.load(store_extra)
+    source.export_jsonl(tmp_path / "registry.jsonl")
+
+    copy = ArtifactStore()
+    copy.load_jsonl(tmp_path / "registry.jsonl", batch_size=700)
+    assert list(copy.export()) == list(source.export())
+    assert copy.get_constraints("logic_layers", 0)[-1] == "audited"
+    assert copy.get_constraints("compute_nodes") == source.get_constraints("compute_nodes")
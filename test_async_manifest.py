@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Test asyncio manifest enumeration against the synchronous path."""
+
+import asyncio
+import builtins
+import threading
+import time
+
+import generate_genesis_manifest
+from generate_genesis_manifest import enumerate_repository, enumerate_repository_async
+from benchmarks.synthetic import SyntheticSpec, generate_repo, simulated_latency
+
+IGNORE = {'.git', '__pycache__', '.pyc', 'node_modules', '.cache'}
+
+
+def test_async_matches_sync(tmp_path):
+    generate_repo(tmp_path, SyntheticSpec(files=300, fan_out=3, depth=4, seed=2))
+    (tmp_path / "pkg" / "__pycache__").mkdir()
+    (tmp_path / "pkg" / "__pycache__" / "x.pyc").write_bytes(b"\0" * 10)
+    (tmp_path / "link").symlink_to(tmp_path / "pkg", target_is_directory=True)
+    (tmp_path / "covenant_link.yaml").symlink_to(tmp_path / "covenant.yaml")
+    (tmp_path / "empty.txt").write_bytes(b"")
+
+    expected = enumerate_repository(tmp_path, IGNORE)
+    for max_in_flight, batch_size in [(1, 1), (4, 8), (32, 3)]:
+        assert asyncio.run(enumerate_repository_async(
+            tmp_path, IGNORE, max_in_flight, batch_size)) == expected
+
+
+def test_bounded_in_flight_and_latency(tmp_path):
+    generate_repo(tmp_path, SyntheticSpec(files=120, mean_size=256, fan_out=2, depth=3))
+    real_open = builtins.open
+    lock = threading.Lock()
+    state = {"open": 0, "peak": 0}
+
+    def counting_open(*args, **kwargs):
+        with lock:
+            state["open"] += 1
+            state["peak"] = max(state["peak"], state["open"])
+        try:
+            time.sleep(0.002)
+            return real_open(*args, **kwargs)
+        finally:
+            with lock:
+                state["open"] -= 1
+
+    generate_genesis_manifest.open = counting_open
+    try:
+        files = asyncio.run(enumerate_repository_async(tmp_path, IGNORE, max_in_flight=4, batch_size=2))
+    finally:
+        del generate_genesis_manifest.open
+
+    assert len(files) == 125
+    # Opens overlapped, never more than max_in_flight at once
+    assert 1 < state["peak"] <= 4
+
+
+def test_simulated_latency_restores_open():
+    with simulated_latency(generate_genesis_manifest, 0.0):
+        assert generate_genesis_manifest.open is not builtins.open
+    assert "open" not in vars(generate_genesis_manifest)
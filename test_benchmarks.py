@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Test benchmark harness and synthetic generators."""
+
+from benchmarks.run import BENCHMARKS, find_regressions, run_benchmarks, save_baseline, load_baseline
+from benchmarks.synthetic import SyntheticSpec, generate_graph, generate_repo
+from validation.topology_validator import run_validation
+
+
+def test_synthetic_repo_shape(tmp_path):
+    spec = SyntheticSpec(files=64, fan_out=3, depth=3, seed=1)
+    summary = generate_repo(tmp_path, spec)
+
+    modules = list((tmp_path / "pkg").rglob("*.py"))
+    assert len(modules) == 64
+    assert max(len(m.relative_to(tmp_path).parts) for m in modules) == 4
+    assert summary["files"] == 64 + 5
+    assert sum(m.read_text().count("\nimport ") for m in modules) == sum(min(i, 3) for i in range(64))
+
+
+def test_synthetic_graph_is_valid():
+    graph = generate_graph(SyntheticSpec(files=200, fan_out=3, depth=5))
+    assert len(graph.nodes) == 201
+    assert all(run_validation(".", graph=graph, executor="serial")["checks"].values())
+
+
+def test_runner_and_regression_check(tmp_path):
+    results = run_benchmarks(["tiny"], repeat=1)
+    assert set(results["tiny"]) == set(BENCHMARKS)
+    assert all(seconds > 0 for seconds in results["tiny"].values())
+
+    baseline_path = tmp_path / "baselines.json"
+    save_baseline({"tiny": {"run_validation": 1.0, "topology_scan": 1.0}}, baseline_path)
+    baseline = load_baseline(baseline_path)
+    baseline["thresholds"] = {"topology_scan": 3.0}
+
+    regressions = find_regressions({"tiny": {"run_validation": 1.6, "topology_scan": 2.0}}, baseline)
+    assert regressions == ["REGRESSION: tiny/run_validation 1.6000s > 1.5 x 1.0000s baseline"]
+
+    # Sub-millisecond jitter is below the absolute floor however large the ratio
+    baseline["results"]["tiny"]["run_validation"] = 0.0001
+    assert find_regressions({"tiny": {"run_validation": 0.0009}}, baseline) == []
+    assert find_regressions({"tiny": {"run_validation": 0.0101}}, baseline) != []
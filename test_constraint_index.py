@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Test constraint ownership inverted index."""
+
+from src.constraint_index import ConstraintIndex, ConstraintOwner, default_index, PRINCIPLE, ARTIFACT_TYPE, MODE
+from src.infrastructure import ArtifactRegistry
+from src.operational_modes import MODES
+from src.principles import ALL_PRINCIPLES
+
+
+def test_index_agrees_with_objects():
+    index = default_index()
+    for principle in ALL_PRINCIPLES:
+        assert index.constraints_of(PRINCIPLE, principle.name) == principle.constraints
+        for constraint in principle.constraints:
+            assert ConstraintOwner(PRINCIPLE, principle.name) in index.owners_of(constraint)
+
+    registry = ArtifactRegistry()
+    for artifact_type in registry.artifact_types:
+        assert index.constraints_of(ARTIFACT_TYPE, artifact_type) == registry.get_constraints(artifact_type)
+
+    for key, mode in MODES.items():
+        assert index.constraints_of(MODE, key) == list(mode.prohibited_operations)
+
+
+def test_prefix_and_bulk_queries():
+    index = default_index()
+    assert index.with_prefix("no_self") == [
+        "no_self_preservation", "no_self_reinforcing_exponentiality", "no_self_scaling",
+    ]
+    assert index.owners_with_prefix("no_self_s") == {
+        "no_self_scaling": (ConstraintOwner(ARTIFACT_TYPE, "logic_layers"),),
+    }
+    assert index.with_prefix("zzz") == []
+    assert index.owners_many(["transparent_operation", "missing"], kind=PRINCIPLE) == {
+        "transparent_operation": (ConstraintOwner(PRINCIPLE, "KENOSIS"),),
+        "missing": (),
+    }
+
+
+def test_shared_constraint_has_every_owner():
+    data = {
+        "principles": {"a": {"name": "A", "constraints": ["shared", "only_a"]}},
+        "artifact_registry": {"nodes": {"constraints": ["shared"]}},
+        "operational_modes": {"strict": {"prohibited_operations": ["shared"]}},
+    }
+    index = ConstraintIndex(data)
+    assert index.owners_of("shared") == (
+        ConstraintOwner(PRINCIPLE, "A"), ConstraintOwner(ARTIFACT_TYPE, "nodes"), ConstraintOwner(MODE, "strict"),
+    )
+    assert index.owners_of("shared", kind=MODE) == (ConstraintOwner(MODE, "strict"),)
+    assert "only_a" in index and len(index) == 2
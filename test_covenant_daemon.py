@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""Test covenant verification daemon over a Unix socket."""
+
+import asyncio
+import hashlib
+import json
+import shutil
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from covenant_daemon import CovenantClient, CovenantDaemon
+
+ROOT = Path(__file__).resolve().parent
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Daemon over a copy of the repo seed files, served from a background loop"""
+    repo = tmp_path / "repo"
+    for rel in ("covenant.yaml", "src", "topology"):
+        source = ROOT / rel
+        if source.is_dir():
+            shutil.copytree(source, repo / rel, ignore=shutil.ignore_patterns("__pycache__"))
+        else:
+            repo.mkdir(exist_ok=True)
+            shutil.copy(source, repo / rel)
+    (repo / "GENESIS_MANIFEST.yaml").write_text(
+        "files:\n"
+        f"- path: covenant.yaml\n  sha256: {hashlib.sha256((repo / 'covenant.yaml').read_bytes()).hexdigest()}\n"
+        "- path: src/principles.py\n  sha256: " + "0" * 64 + "\n"
+        "- path: gone.txt\n  sha256: " + "0" * 64 + "\n"
+    )
+
+    socket_path = str(tmp_path / "covenant.sock")
+    loop = asyncio.new_event_loop()
+    state = CovenantDaemon(str(repo))
+    server = loop.run_until_complete(state.start(socket_path))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield state, socket_path, repo
+
+    async def shutdown():
+        server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def test_ops(daemon):
+    state, socket_path, repo = daemon
+    client = CovenantClient(socket_path)
+
+    assert client.request("ping")["spec_digest"] == state.spec.digest
+
+    expected = hashlib.sha256((repo / "covenant.yaml").read_bytes()).hexdigest()
+    result = client.request("verify-file", path="covenant.yaml", expected_sha256=expected.upper(),
+                            principles=True)
+    assert result["sha256"] == expected and result["matches"] is True
+    assert set(result["principles"]) == {"LOGOS", "CHALCEDON", "GRACE", "KENOSIS", "AGAPE"}
+
+    manifest = client.request("verify-manifest")
+    assert manifest == {"checked": 3, "missing": ["gone.txt"], "mismatched": ["src/principles.py"]}
+
+    validation = client.request("validate-graph")
+    assert validation["checks"]["ROOT_REACHABILITY"] is False
+    assert client.request("validate-graph") == validation
+    # A changed violation log invalidates the cached results without a reload
+    assert validation["checks"]["VIOLATION_LOG_IMMUTABILITY"] is True
+    (repo / "VIOLATION_LOG.jsonl").write_text('{"seq": 5, "hash": "forged"}\n')
+    tampered = client.request("validate-graph")
+    assert tampered["checks"]["VIOLATION_LOG_IMMUTABILITY"] is False
+    (repo / "VIOLATION_LOG.jsonl").unlink()
+    assert client.request("validate-graph", reload=True) == validation
+
+    assert client.request("mode-check", operations=["hash_verification", "emotion_labeling"],
+                          mode="forensic") == {"mode": "forensic", "allowed": [True, False]}
+    assert client.request("mode-check", operations=["hypothesis_testing"]) == {"allowed_in": [["popperian"]]}
+    client.close()
+
+
+def test_errors_and_hash_cache(daemon):
+    state, socket_path, repo = daemon
+    client = CovenantClient(socket_path)
+
+    for op, params, code in [
+        ("nope", {}, "UNKNOWN_OP"),
+        ([], {}, "BAD_REQUEST"),
+        ({"op": "ping"}, {}, "BAD_REQUEST"),
+        ("verify-file", {"path": "../../etc/passwd"}, "PATH_OUTSIDE_ROOT"),
+        ("verify-file", {"path": "missing.txt"}, "FILE_NOT_FOUND"),
+        ("mode-check", {"operations": [], "mode": "astrology"}, "UNKNOWN_MODE"),
+    ]:
+        with pytest.raises(RuntimeError, match=code):
+            client.request(op, **params)
+
+    client.request("verify-file", path="covenant.yaml")
+    cached = dict(state.hash_cache)
+    client.request("verify-file", path="covenant.yaml")
+    assert state.hash_cache == cached
+
+    (repo / "covenant.yaml").write_text((repo / "covenant.yaml").read_text() + "\n# edit\n")
+    changed = client.request("verify-file", path="covenant.yaml")
+    assert changed["sha256"] == hashlib.sha256((repo / "covenant.yaml").read_bytes()).hexdigest()
+    client.close()
+
+
+def test_concurrent_clients(daemon):
+    _, socket_path, _ = daemon
+
+    def worker(i):
+        client = CovenantClient(socket_path)
+        try:
+            return [client.request("verify-file", path="src/principles.py")["sha256"] for _ in range(20)]
+        finally:
+            client.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, range(8)))
+    assert len({digest for batch in results for digest in batch}) == 1
+
+
+def test_start_refuses_live_daemon_and_non_socket(daemon, tmp_path):
+    state, socket_path, _ = daemon
+    with pytest.raises(ValueError, match="DAEMON_RUNNING"):
+        asyncio.run(state.start(socket_path))
+    # The live daemon's socket is untouched
+    client = CovenantClient(socket_path)
+    assert client.request("ping")["spec_digest"] == state.spec.digest
+    client.close()
+
+    regular = tmp_path / "not-a-socket"
+    regular.write_text("keep me\n")
+    with pytest.raises(ValueError, match="SOCKET_PATH_IN_USE"):
+        asyncio.run(state.start(str(regular)))
+    assert regular.read_text() == "keep me\n"
+
+
+def test_start_replaces_stale_socket(tmp_path):
+    stale_path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(stale_path)
+    stale.close()
+
+    async def start_and_ping():
+        server = await CovenantDaemon(str(ROOT)).start(stale_path)
+        async with server:
+            reader, writer = await asyncio.open_unix_connection(stale_path)
+            writer.write(b'{"id": 1, "op": "ping"}\n')
+            response = json.loads(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+        return response
+
+    assert asyncio.run(start_and_ping())["ok"] is True
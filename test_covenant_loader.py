@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Test covenant.yaml-derived principles, modes and registry."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src import covenant_loader
+from src.covenant_loader import COVENANT_PATH, covenant_data
+from src.infrastructure import ArtifactRegistry
+from src.operational_modes import MODES
+from src.principles import ALL_PRINCIPLES
+
+ROOT = Path(__file__).resolve().parent
+
+
+def test_objects_match_covenant():
+    covenant = yaml.safe_load(Path(COVENANT_PATH).read_text())
+
+    assert [p.name for p in ALL_PRINCIPLES] == [p["name"] for p in covenant["principles"].values()]
+    for principle, source in zip(ALL_PRINCIPLES, covenant["principles"].values()):
+        assert (principle.id, principle.hash, principle.constraints) == (source["id"], source["hash"], source["constraints"])
+
+    for key, mode in MODES.items():
+        assert list(mode.allowed_operations) == covenant["operational_modes"][key]["allowed_operations"]
+
+    registry = ArtifactRegistry()
+    for artifact_type, entry in covenant["infrastructure"]["artifact_registry"].items():
+        assert getattr(registry, artifact_type) == entry
+
+
+def test_cache_is_keyed_by_content(tmp_path, monkeypatch):
+    covenant = tmp_path / "covenant.yaml"
+    covenant.write_bytes(Path(COVENANT_PATH).read_bytes())
+    cache_dir = tmp_path / "cache"
+    covenant_loader._memo.clear()
+
+    first = covenant_data(covenant, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("covenant-*.marshal"))) == 1
+
+    # Cached blob is read without parsing YAML
+    covenant_loader._memo.clear()
+    monkeypatch.setitem(sys.modules, "yaml", None)
+    assert covenant_data(covenant, cache_dir=cache_dir) == first
+
+    # Edited covenant misses the cache
+    monkeypatch.undo()
+    covenant.write_text(covenant.read_text().replace('"LOGOS"', '"LOGOS_EDITED"'))
+    assert covenant_data(covenant, cache_dir=cache_dir)["principles"]["logos"]["name"] == "LOGOS_EDITED"
+    assert len(list(cache_dir.glob("covenant-*.marshal"))) == 2
+
+
+def test_invalid_covenant_is_rejected(tmp_path):
+    covenant = tmp_path / "covenant.yaml"
+    covenant.write_text("principles:\n  logos:\n    name: LOGOS\n")
+    with pytest.raises(ValueError, match="COVENANT_INVALID"):
+        covenant_data(covenant, use_cache=False)
+
+
+def test_warm_import_skips_yaml():
+    subprocess.run([sys.executable, "-c", "import src"], cwd=ROOT, check=True)
+    out = subprocess.run(
+        [sys.executable, "-c", "import sys, src.principles, src.operational_modes, src.infrastructure; "
+                               "print('yaml' in sys.modules)"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    )
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""Test batched edge-class legality bitmap."""
+
+from topology.graph_loader import NodeClass, EdgeClass
+from validation.edge_legality import edge_bit, illegal_positions
+from validation.topology_check import TopologyValidator
+
+NODE_CLASSES = {
+    "covenant.yaml": NodeClass.COVENANT_ROOT,
+    "principles.py": NodeClass.PRINCIPLE_MODULE,
+    "modes.py": NodeClass.OPERATIONAL_MODE_ENFORCER,
+    "registry.py": NodeClass.INFRASTRUCTURE_REGISTRY,
+    "log.jsonl": NodeClass.VIOLATION_LOG,
+}
+
+
+def test_bitmap_matches_rules():
+    validator = TopologyValidator(".")
+    triples = [
+        ("covenant.yaml", "principles.py", "COVENANT_BINDING"),                # 0 legal
+        ("principles.py", "covenant.yaml", "COVENANT_BINDING"),                # 1 wrong direction
+        ("registry.py", "principles.py", "dependency_import"),                 # 2 legal, yaml key
+        ("registry.py", "principles.py", EdgeClass.DEPENDENCY_IMPORT, {"AUTHORITY"}),  # 3 cannot_carry
+        ("modes.py", "registry.py", EdgeClass.MODE_RESTRICTION),               # 4 legal
+        ("registry.py", "modes.py", EdgeClass.MODE_RESTRICTION),               # 5 source not enforcer
+        ("principles.py", "log.jsonl", "VIOLATION_REFERENCE"),                 # 6 legal
+        ("principles.py", "ghost.py", "DEPENDENCY_IMPORT"),                    # 7 unknown node
+        ("a", "b", "TELEPATHY"),                                               # 8 unknown type
+        ("principles.py", "registry.py", "DEPENDENCY_IMPORT"),                 # 9 legal, reverse of 2
+    ]
+    bitmap = validator.check_edge_class_legality_many(iter(triples), NODE_CLASSES)
+
+    assert len(bitmap) == 2
+    assert illegal_positions(bitmap, len(triples)) == [1, 3, 5, 7, 8]
+    assert all(edge_bit(bitmap, i) for i in (0, 2, 4, 6, 9))
+    # A triple's bit does not depend on the rest of the batch
+    for i, triple in enumerate(triples):
+        alone = validator.check_edge_class_legality_many([triple], NODE_CLASSES)
+        assert edge_bit(alone, 0) == edge_bit(bitmap, i)
+
+
+def test_single_edge_uses_canonical_graph():
+    validator = TopologyValidator(".")
+    assert validator.check_edge_class_legality("covenant.yaml", "src/principles.py", "COVENANT_BINDING")
+    assert not validator.check_edge_class_legality("src/principles.py", "covenant.yaml", "COVENANT_BINDING")
+
+
+def test_large_batch():
+    validator = TopologyValidator(".")
+    node_classes = {f"m{i}": NodeClass.PRINCIPLE_MODULE for i in range(1000)}
+    triples = [(f"m{i % 1000}", f"m{(i * 7 + 1) % 1000}", EdgeClass.DEPENDENCY_IMPORT) for i in range(20000)]
+    bitmap = validator.check_edge_class_legality_many(triples, node_classes)
+    assert len(bitmap) == 2500
+    # Mutual imports are legal edges; cycles are the escalation check's concern
+    assert illegal_positions(bitmap, len(triples)) == []
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Test forbidden topology pattern matching."""
+
+from pathlib import Path
+
+from test_helpers import make_graph, make_node, pair_edges
+from topology.graph_loader import (
+    NodeClass, Authority, Verification, Temporal, EdgeClass, load_topology_graph,
+)
+from validation.forbidden_patterns import ForbiddenPatternMatcher, hub_node_classes
+from validation.topology_check import TopologyValidator
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def forbidden(graph):
+    validator = TopologyValidator(REPO_ROOT)
+    results = validator.check_forbidden_topology_absence(graph)
+    return {k for k, ok in results.items() if not ok}, validator.forbidden_witnesses
+
+
+def test_hub_classes_derived_from_edge_directions():
+    validator = TopologyValidator(REPO_ROOT)
+    assert hub_node_classes(validator.spec) == {
+        NodeClass.COVENANT_ROOT, NodeClass.OPERATIONAL_MODE_ENFORCER,
+        NodeClass.GUARDIAN_SYSTEM, NodeClass.VIOLATION_LOG,
+    }
+
+
+def test_clean_graph_matches_nothing():
+    nodes = [make_node(f"m{i}") for i in range(5)]
+    graph = make_graph(nodes, pair_edges([(f"m{i}", f"m{i + 1}") for i in range(4)]))
+    assert forbidden(graph)[0] == set()
+
+
+def test_mixed_axis_node():
+    # A principle module used as the source of MODE_RESTRICTION, reserved for mode enforcers
+    graph = make_graph([make_node("m0"), make_node("m1")],
+                       pair_edges([("m0", "m1")], EdgeClass.MODE_RESTRICTION))
+    matched, witnesses = forbidden(graph)
+    assert "mixed_axis_node" in matched
+    assert witnesses["MIXED_AXIS_NODE"] == [
+        "m0: matches ['OPERATIONAL_MODE_ENFORCER', 'PRINCIPLE_MODULE']"]
+
+
+def test_canonical_graph_has_no_mixed_axis_node():
+    validator = TopologyValidator(REPO_ROOT)
+    graph = load_topology_graph(str(REPO_ROOT))
+    assert validator.check_forbidden_topology_absence(graph)["mixed_axis_node"] is True
+    assert ForbiddenPatternMatcher(graph, validator.spec).match_mixed_axis_node() == []
+
+
+def test_optimization_shortcut():
+    graph = make_graph([make_node("a", verification=Verification.CORRESPONDENCE, temporal=Temporal.FOUNDATION),
+                        make_node("b", temporal=Temporal.OVERLAY, verification=Verification.HASH_CHAIN)],
+                       pair_edges([("a", "b")]))
+    matched, witnesses = forbidden(graph)
+    assert "optimization_shortcut" in matched
+    assert len(witnesses["OPTIMIZATION_SHORTCUT"]) == 2
+
+
+def test_emergent_hub_and_authority_through_connectivity():
+    leaves = [make_node(f"m{i}") for i in range(40)]
+    hub = make_node("hub", authority=Authority.IMMUTABLE)
+    graph = make_graph(leaves + [hub], pair_edges([(f"m{i}", "hub") for i in range(40)]))
+    matched, witnesses = forbidden(graph)
+    assert {"emergent_hub", "authority_through_connectivity"} <= matched
+    assert witnesses["EMERGENT_HUB"][0].startswith("hub:")
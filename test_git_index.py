@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""Test the .git/index reader and the git-aware manifest fast path."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import instrumentation
+from generate_genesis_manifest import IGNORE_PATTERNS, enumerate_repository, enumerate_repository_git
+from git_index import GitIgnore, parse_index, parse_ignore_rules, read_git_index
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+PAST = 1_600_000_000
+
+
+def git(repo, *args):
+    return subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=repo,
+                          check=True, capture_output=True, text=True).stdout
+
+
+IGNORED = {"debug.log", "build/out.o", "pkg/generated/g.py"}
+
+
+def walked_files(root):
+    """The plain walk minus the untracked files git ignores"""
+    return [f for f in enumerate_repository(root, IGNORE_PATTERNS) if f['path'] not in IGNORED]
+
+
+def make_checkout(root):
+    files = {
+        "a.py": "print('a')\n",
+        "pkg/b.py": "import a\n",
+        "pkg/deep/c.yaml": "x: 1\n",
+        "build/keep.txt": "tracked although ignored\n",
+        ".gitignore": "build/\n*.log\n!important.log\n/pkg/generated/\n",
+    }
+    for rel, content in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(content)
+        # Old mtimes keep the entries clear of racy-clean detection
+        os.utime(root / rel, (PAST, PAST))
+    git(root, "init", "-q")
+    git(root, "add", "-A")
+    git(root, "add", "-f", "build/keep.txt")
+    git(root, "commit", "-qm", "init")
+    # Untracked: one kept, the rest ignored
+    (root / "notes.md").write_text("untracked\n")
+    (root / "debug.log").write_text("ignored\n")
+    (root / "important.log").write_text("re-included\n")
+    (root / "build" / "out.o").write_text("ignored dir\n")
+    (root / "pkg" / "generated").mkdir()
+    (root / "pkg" / "generated" / "g.py").write_text("ignored dir\n")
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_index_entries_match_ls_files(tmp_path, version):
+    make_checkout(tmp_path)
+    if version > 2:
+        # Intent-to-add needs an extended entry, which v2 cannot hold
+        git(tmp_path, "add", "-N", "notes.md")
+    git(tmp_path, "update-index", "--index-version", str(version))
+
+    index = read_git_index(tmp_path)
+    assert index.version == version
+    staged = {}
+    for line in git(tmp_path, "ls-files", "-s").splitlines():
+        meta, path = line.split("\t")
+        mode, sha1, _ = meta.split()
+        staged[path] = (int(mode, 8), sha1)
+    staged.pop("notes.md", None)
+    assert {path: (e.mode, e.sha1) for path, e in index.entries.items()} == staged
+
+
+def test_corrupt_index_rejected(tmp_path):
+    make_checkout(tmp_path)
+    data = bytearray((tmp_path / ".git" / "index").read_bytes())
+    data[40] ^= 0xFF
+    with pytest.raises(ValueError, match="GIT_INDEX_INVALID: checksum"):
+        parse_index(bytes(data))
+
+
+def test_git_enumeration_matches_walk_and_reuses_hashes(tmp_path):
+    make_checkout(tmp_path)
+    expected = walked_files(tmp_path)
+
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        assert enumerate_repository_git(tmp_path, IGNORE_PATTERNS, read_git_index(tmp_path)) == expected
+        assert instrumentation.counters.get("manifest.hash_cache_hits", 0) == 0
+
+        instrumentation.reset()
+        assert enumerate_repository_git(tmp_path, IGNORE_PATTERNS, read_git_index(tmp_path)) == expected
+        # Every clean tracked file comes from the cache; untracked files are rehashed
+        # (.gitignore itself falls under the '.git' ignore pattern)
+        assert instrumentation.counters["manifest.hash_cache_hits"] == 4
+        assert instrumentation.counters["manifest.files_hashed"] == 2
+
+        # A modified file no longer matches its entry and is rehashed
+        (tmp_path / "a.py").write_text("print('changed')\n")
+        instrumentation.reset()
+        assert enumerate_repository_git(tmp_path, IGNORE_PATTERNS,
+                                        read_git_index(tmp_path)) == walked_files(tmp_path)
+        assert instrumentation.counters["manifest.hash_cache_hits"] == 3
+    finally:
+        instrumentation.disable()
+        instrumentation.reset()
+
+
+def test_racily_clean_entry_is_rehashed(tmp_path):
+    make_checkout(tmp_path)
+    index = read_git_index(tmp_path)
+    entry = index.entries["a.py"]
+    st = os.lstat(tmp_path / "a.py")
+    assert index.is_clean(entry, st)
+    index.mtime_s, index.mtime_ns = entry.mtime_s, entry.mtime_ns
+    assert not index.is_clean(entry, st)
+
+
+def test_ignore_rules(tmp_path):
+    rules = GitIgnore(tmp_path)
+    rules.rules = parse_ignore_rules(["*.log", "!keep.log", "/top/", "docs/**/*.tmp", "# comment", ""])
+    rules.rules += parse_ignore_rules(["local.txt"], base="sub")
+
+    assert rules.is_ignored("x/y/a.log")
+    assert not rules.is_ignored("keep.log")
+    assert rules.is_ignored("top", is_dir=True)
+    assert not rules.is_ignored("top")
+    assert not rules.is_ignored("x/top", is_dir=True)
+    assert rules.is_ignored("docs/a/b/c.tmp") and rules.is_ignored("docs/c.tmp")
+    assert rules.is_ignored("sub/deeper/local.txt")
+    assert not rules.is_ignored("local.txt")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Test columnar graph export and the memory-mapped loader."""
+
+import gc
+import mmap
+import weakref
+
+import pytest
+
+from benchmarks.synthetic import SyntheticSpec, generate_graph
+from topology.graph_export import export_columnar, export_graph, load_columnar, load_graph
+from topology.graph_loader import (
+    TopologyGraph, Node, Edge, NodeClass, Authority, ConstraintLayer,
+    Verification, Temporal, EdgeClass, Directionality,
+)
+
+
+def binding_graph():
+    root = Node("covenant.yaml", NodeClass.COVENANT_ROOT, Authority.EXTERNAL_ONLY, {ConstraintLayer.NONE},
+                Verification.HASH_CHAIN, Temporal.GENESIS)
+    bound = Node("src/modes.py", NodeClass.OPERATIONAL_MODE_ENFORCER, Authority.VALIDATED,
+                 {ConstraintLayer.LOGOS, ConstraintLayer.GRACE}, Verification.SIGNATURE, Temporal.OVERLAY,
+                 operational_mode_binding={"OBSERVE", "ACT"})
+    empty = Node("src/ünïcode.py", NodeClass.PRINCIPLE_MODULE, Authority.VALIDATED, set(),
+                 Verification.NONE, Temporal.EPHEMERAL, operational_mode_binding=set())
+    edges = [Edge("e1", root.node_id, bound.node_id, EdgeClass.COVENANT_BINDING, Directionality.UNI,
+                  {"AUTHORITY", "TEMPORAL"}),
+             Edge("e2", bound.node_id, empty.node_id, EdgeClass.CORRESPONDENCE_MAPPING, Directionality.BI, set())]
+    return TopologyGraph(nodes={n.node_id: n for n in (root, bound, empty)}, edges={e.edge_id: e for e in edges})
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+def test_round_trip(tmp_path, compression):
+    for graph in (binding_graph(), generate_graph(SyntheticSpec(files=300, fan_out=3, depth=4))):
+        export_columnar(graph, tmp_path / "graph.topocol", compression)
+        loaded = load_graph(tmp_path / "graph.topocol")
+        assert loaded.nodes == graph.nodes
+        assert loaded.edges == graph.edges
+        assert loaded.covenant_root_id == graph.covenant_root_id
+
+
+def test_uncompressed_columns_are_zero_copy(tmp_path):
+    graph = generate_graph(SyntheticSpec(files=200, fan_out=3, depth=4))
+    export_columnar(graph, tmp_path / "raw.topocol", "none")
+    export_columnar(graph, tmp_path / "packed.topocol", "zlib")
+    assert (tmp_path / "packed.topocol").stat().st_size < (tmp_path / "raw.topocol").stat().st_size
+
+    with load_columnar(tmp_path / "raw.topocol") as snapshot:
+        sources = snapshot.column("edges.source")
+        assert isinstance(sources.obj, mmap.mmap)
+        assert len(sources) == snapshot.edge_count == len(graph.edges)
+        node_ids = snapshot.strings("nodes.node_id")
+        assert [node_ids[i] for i in sources] == [e.source for e in graph.edges.values()]
+
+    with load_columnar(tmp_path / "packed.topocol") as snapshot:
+        assert list(snapshot.column("edges.target")) == [
+            list(graph.nodes).index(e.target) for e in graph.edges.values()]
+
+
+def test_close_defers_to_views_still_held(tmp_path):
+    graph = generate_graph(SyntheticSpec(files=50, fan_out=2, depth=3))
+    export_columnar(graph, tmp_path / "raw.topocol", "none")
+
+    with load_columnar(tmp_path / "raw.topocol") as snapshot:
+        sources = snapshot.column("edges.source")
+        mapping = weakref.ref(snapshot._mmap)
+    # The view outlives the context and still reads the file
+    assert list(sources) == [list(graph.nodes).index(e.source) for e in graph.edges.values()]
+    snapshot.close()
+    del sources
+    gc.collect()
+    assert mapping() is None
+
+
+def test_invalid_inputs(tmp_path):
+    (tmp_path / "junk").write_bytes(b"not an export at all")
+    with pytest.raises(ValueError, match="EXPORT_INVALID"):
+        load_columnar(tmp_path / "junk")
+    with pytest.raises(ValueError, match="UNKNOWN_CODEC"):
+        export_columnar(binding_graph(), tmp_path / "g", "brotli")
+    with pytest.raises(ValueError, match="UNKNOWN_FORMAT"):
+        export_graph(binding_graph(), tmp_path / "g", format="csv")
+
+
+def test_arrow_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    graph = binding_graph()
+    export_graph(graph, tmp_path / "arrow", format="arrow")
+    loaded = load_graph(tmp_path / "arrow")
+    assert loaded.nodes == graph.nodes and loaded.edges == graph.edges
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Test graph index, SCC engine and authority escalation detection."""
+
+from test_helpers import make_graph, make_node, pair_edges
+from topology.graph_loader import Authority
+from topology.graph_index import GraphIndex, strongly_connected_components
+from validation.topology_validator import TopologyValidator
+
+
+def test_scc_groups_cycles():
+    graph = make_graph(
+        [make_node("a"), make_node("b"), make_node("c"), make_node("d")],
+        pair_edges([("covenant.yaml", "a"), ("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("d", "c")]),
+    )
+    index = GraphIndex.from_graph(graph)
+    component_of, components = strongly_connected_components(index)
+
+    groups = {frozenset(index.node_ids[i] for i in members) for members in components}
+    assert groups == {frozenset({"covenant.yaml"}), frozenset({"a", "b"}), frozenset({"c", "d"})}
+    # Sinks first: {c, d} is emitted before {a, b}, which precedes the root
+    assert component_of[index.position["c"]] < component_of[index.position["a"]]
+    assert component_of[index.position["a"]] < component_of[index.position["covenant.yaml"]]
+
+
+def test_escalation_cycle_reported_with_witness():
+    graph = make_graph(
+        [make_node("a"), make_node("b", authority=Authority.IMMUTABLE), make_node("c")],
+        pair_edges([("covenant.yaml", "a"), ("a", "b"), ("b", "c"), ("c", "a")]),
+    )
+    validator = TopologyValidator(".", graph=graph)
+
+    assert validator.check_no_authority_escalation_cycle() is False
+    (cycle,) = validator.escalation_cycles
+    assert set(cycle.members) == {"a", "b", "c"}
+    assert cycle.witness[0] == cycle.witness[-1]
+    assert validator._first_violation.startswith("AUTHORITY_ESCALATION_CYCLE: ")
+
+
+def test_uniform_cycle_is_not_escalation():
+    graph = make_graph(
+        [make_node("a"), make_node("b")],
+        pair_edges([("covenant.yaml", "a"), ("a", "b"), ("b", "a")]),
+    )
+    assert TopologyValidator(".", graph=graph).check_no_authority_escalation_cycle() is True
+
+
+def test_deep_chain_does_not_recurse():
+    depth = 100_000
+    nodes = [make_node(f"n{i}") for i in range(depth)]
+    pairs = [("covenant.yaml", "n0")] + [(f"n{i}", f"n{i + 1}") for i in range(depth - 1)]
+    pairs.append((f"n{depth - 1}", "covenant.yaml"))
+    graph = make_graph(nodes, pair_edges(pairs))
+
+    validator = TopologyValidator(".", graph=graph)
+    assert validator.check_no_authority_escalation_cycle() is False
+    (cycle,) = validator.escalation_cycles
+    assert len(cycle.members) == depth + 1
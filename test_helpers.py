@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""Node, edge and graph factories shared by the synthetic-graph tests."""
+
+from topology.graph_loader import (
+    TopologyGraph, Node, Edge, NodeClass, Authority, ConstraintLayer,
+    Verification, Temporal, EdgeClass, Directionality,
+)
+
+
+def make_node(node_id, authority=Authority.VALIDATED, verification=Verification.HASH_CHAIN,
+              node_class=NodeClass.PRINCIPLE_MODULE, temporal=Temporal.FOUNDATION,
+              layers=(ConstraintLayer.NONE,), modes=None):
+    return Node(node_id, node_class, authority, set(layers), verification, temporal, modes)
+
+
+def make_edge(source, target, edge_class=EdgeClass.DEPENDENCY_IMPORT):
+    edge_id = f"{source}::{target}::{edge_class.value}"
+    return Edge(edge_id, source, target, edge_class, Directionality.UNI, set())
+
+
+def pair_edges(pairs, edge_class=EdgeClass.DEPENDENCY_IMPORT, root_edge_class=None):
+    """Edges for (source, target) pairs; root_edge_class, if given, for edges leaving covenant.yaml"""
+    return [make_edge(source, target,
+                      root_edge_class if root_edge_class and source == "covenant.yaml" else edge_class)
+            for source, target in pairs]
+
+
+def make_graph(nodes, edges, root_layers=(ConstraintLayer.NONE,)):
+    """Graph of nodes and edges under a covenant.yaml root"""
+    root = make_node("covenant.yaml", Authority.EXTERNAL_ONLY, node_class=NodeClass.COVENANT_ROOT,
+                     temporal=Temporal.GENESIS, layers=root_layers)
+    return TopologyGraph(nodes={"covenant.yaml": root, **{n.node_id: n for n in nodes}},
+                         edges={e.edge_id: e for e in edges})
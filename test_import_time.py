@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Test package import cost with -X importtime."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# Cumulative microseconds for a warm `import <module>`; generous so only real regressions trip
+IMPORT_BUDGET_US = {
+    "src": 20_000,
+    "src.operational_modes": 60_000,
+    "src.principles": 60_000,
+}
+
+
+def import_profile(statement):
+    """{module: cumulative_us} for everything imported by statement in a fresh interpreter"""
+    # Warm run populates bytecode and covenant caches
+    subprocess.run([sys.executable, "-c", statement], cwd=ROOT, check=True)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, check=True, capture_output=True, text=True)
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_package_import_is_lazy():
+    profile = import_profile("import src")
+    assert "src" in profile
+    for module in ("src.principles", "src.infrastructure", "src.operational_modes", "src.verification", "yaml"):
+        assert module not in profile
+
+
+def test_submodule_imports_only_what_it_needs():
+    profile = import_profile("import src.operational_modes")
+    assert "src.principles" not in profile
+    assert "src.verification" not in profile
+    assert "yaml" not in profile
+
+    profile = import_profile("import src.infrastructure")
+    assert "src.principles" not in profile
+
+
+def test_lazy_attributes_resolve():
+    code = ("import src; "
+            "assert src.principles.LOGOS.name == 'LOGOS'; "
+            "from src.infrastructure import registry; "
+            "assert registry.compute_nodes['count'] == 5000; "
+            "assert 'operational_modes' in dir(src)")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_import_budget():
+    for module, budget in IMPORT_BUDGET_US.items():
+        profile = import_profile(f"import {module}")
+        assert profile[module] < budget, f"{module} import took {profile[module]}us (budget {budget}us)"
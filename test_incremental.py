@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Test incremental revalidation against full revalidation."""
+
+import random
+
+from test_helpers import make_edge, make_graph, make_node
+from topology.graph_loader import Authority, Verification
+from validation.incremental import IncrementalValidator, TopologyDelta
+from validation.topology_validator import TopologyValidator
+
+
+def full_checks(graph):
+    validator = TopologyValidator(".", graph=graph)
+    return {
+        'ROOT_REACHABILITY': validator.check_root_reachability(),
+        'VERIFICATION_MONOTONICITY': validator.check_verification_monotonicity(),
+        'NO_AUTHORITY_ESCALATION_CYCLE': validator.check_no_authority_escalation_cycle(),
+    }
+
+
+def random_node(rng, node_id):
+    return make_node(node_id, rng.choice([Authority.VALIDATED, Authority.VALIDATED, Authority.IMMUTABLE]),
+                     rng.choice([Verification.HASH_CHAIN, Verification.CORRESPONDENCE]))
+
+
+def test_random_deltas_match_full_validation():
+    rng = random.Random(7)
+    names = [f"m{i}" for i in range(30)]
+    graph = make_graph([random_node(rng, n) for n in names],
+                       [make_edge("covenant.yaml", "m0")] + [make_edge(rng.choice(names), rng.choice(names))
+                                                              for _ in range(25)])
+    incremental = IncrementalValidator(graph)
+    assert incremental.results()['checks'] == full_checks(graph)
+
+    for step in range(200):
+        nodes = dict(graph.nodes)
+        edges = dict(graph.edges)
+        for _ in range(rng.randint(1, 3)):
+            action = rng.random()
+            if action < 0.35:
+                edge = make_edge(rng.choice(list(nodes)), rng.choice(names))
+                if edge.target in nodes:
+                    edges[edge.edge_id] = edge
+            elif action < 0.7 and edges:
+                del edges[rng.choice(sorted(edges))]
+            elif action < 0.85:
+                node_id = rng.choice(names)
+                nodes[node_id] = random_node(rng, node_id)
+            else:
+                node_id = rng.choice(names)
+                nodes.pop(node_id, None)
+                edges = {k: e for k, e in edges.items() if node_id not in (e.source, e.target)}
+        new_graph = make_graph([n for k, n in nodes.items() if k != "covenant.yaml"], edges.values())
+
+        results = incremental.apply(TopologyDelta.from_graphs(graph, new_graph))
+        assert results['checks'] == full_checks(new_graph), step
+        graph = new_graph
+
+
+def test_merge_through_untouched_node_when_both_endpoints_change():
+    # r -> a -> x -> b; one delta retunes a and b and closes b -> a through untouched x
+    graph = make_graph([make_node("a"), make_node("x"), make_node("b")],
+                       [make_edge("covenant.yaml", "a"), make_edge("a", "x"), make_edge("x", "b")])
+    incremental = IncrementalValidator(graph)
+
+    new_graph = make_graph([make_node("a", Authority.IMMUTABLE), make_node("x"),
+                            make_node("b", Authority.UNRESTRICTED)],
+                           [*graph.edges.values(), make_edge("b", "a")])
+    results = incremental.apply(TopologyDelta.from_graphs(graph, new_graph))
+
+    assert results['checks'] == full_checks(new_graph)
+    assert results['checks']['NO_AUTHORITY_ESCALATION_CYCLE'] is False
+    assert incremental.component_of["x"] == frozenset({"a", "x", "b"})
+
+
+def test_leaf_change_costs_scale_with_delta():
+    depth = 5000
+    nodes = [make_node(f"n{i}") for i in range(depth)]
+    edges = [make_edge("covenant.yaml", "n0")] + [make_edge(f"n{i}", f"n{i + 1}") for i in range(depth - 1)]
+    incremental = IncrementalValidator(make_graph(nodes, edges))
+
+    delta = TopologyDelta(added_nodes={"leaf": make_node("leaf", verification=Verification.NONE)},
+                          added_edges={"x": make_edge(f"n{depth - 1}", "leaf")})
+    results = incremental.apply(delta)
+
+    assert results['checks']['ROOT_REACHABILITY'] is True
+    assert results['checks']['VERIFICATION_MONOTONICITY'] is False
+    assert incremental.last_stats['nodes_revisited'] <= 2
+    assert incremental.last_stats['components_recomputed'] <= 2
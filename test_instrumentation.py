@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Test opt-in instrumentation counters, timers and exporters."""
+
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+import instrumentation
+from generate_genesis_manifest import generate_genesis_manifest
+from topology_scanner import TopologyScanner
+from validation.topology_validator import run_validation
+
+ROOT = Path(__file__).resolve().parent
+
+
+@pytest.fixture
+def metrics():
+    instrumentation.reset()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def make_repo(root):
+    (root / "pkg").mkdir()
+    (root / "pkg" / "a.py").write_text("import os\n")
+    (root / "pkg" / "b.py").write_bytes(b"x" * 20000)
+
+
+def test_disabled_records_nothing(metrics, tmp_path):
+    make_repo(tmp_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_genesis_manifest(str(tmp_path), "t", str(tmp_path / "out.yaml"))
+    assert metrics.snapshot() == {"counters": {}, "timers": {}}
+    assert metrics.stage("anything") is metrics.stage("other")
+
+
+def test_counters_and_stage_timers(metrics, tmp_path):
+    make_repo(tmp_path)
+    metrics.enable()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_genesis_manifest(str(tmp_path), "t", str(tmp_path / "GENESIS.yaml"))
+        TopologyScanner(tmp_path).scan()
+    run_validation(str(ROOT), executor="serial")
+
+    data = metrics.snapshot()
+    assert data["counters"]["manifest.files_hashed"] == 2
+    assert data["counters"]["manifest.bytes_hashed"] == 20000 + len("import os\n")
+    assert data["counters"]["scan.files_walked"] == 3
+    for stage in ("manifest.enumerate", "manifest.write", "scan.walk", "validation.run",
+                  "validation.check.ROOT_REACHABILITY"):
+        assert data["timers"][stage]["count"] == 1
+
+    text = metrics.prometheus_text()
+    assert "covenant_manifest_files_hashed_total 2" in text
+    assert "covenant_validation_check_ROOT_REACHABILITY_seconds_count 1" in text
+
+    metrics.write_json(tmp_path / "metrics.json")
+    assert json.loads((tmp_path / "metrics.json").read_text())["counters"] == data["counters"]
+
+
+def test_prometheus_endpoint(metrics):
+    metrics.enable()
+    metrics.count("manifest.files_hashed", 3)
+    server = metrics.serve_prometheus(0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(base + "/metrics") as response:
+            assert b"covenant_manifest_files_hashed_total 3" in response.read()
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(base + "/other")
+        assert error.value.code == 404
+        assert error.value.read() == b"not found\n"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_profile_hook_writes_stats(metrics, tmp_path):
+    metrics.enable(profile_dir=tmp_path / "prof")
+    for _ in range(2):
+        with metrics.stage("demo"):
+            sum(range(1000))
+    assert (tmp_path / "prof" / "demo.prof").exists()
+    assert metrics.snapshot()["timers"]["demo"]["count"] == 2
+
+
+def test_environment_opt_in(tmp_path):
+    out = tmp_path / "metrics.json"
+    code = "import instrumentation; instrumentation.count('x', 3)"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                   env={"COVENANT_METRICS": str(out), "PATH": ""})
+    assert json.loads(out.read_text())["counters"] == {"x": 3}
+
+
+def test_disabled_overhead_is_negligible(metrics):
+    n = 200_000
+    start = time.perf_counter()
+    for _ in range(n):
+        metrics.count("hot")
+    per_call = (time.perf_counter() - start) / n
+    assert per_call < 2e-6
+    assert metrics.snapshot()["counters"] == {}
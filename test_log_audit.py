@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Test streaming operation-log audit."""
+
+import concurrent.futures
+import json
+import os
+import random
+
+from src.log_audit import audit_log, read_lines, shard_ranges, LogAuditor
+from src.log_audit import MALFORMED_RECORD, UNKNOWN_MODE, OPERATION_PROHIBITED, OPERATION_NOT_ALLOWED
+
+
+def write_log(path, records):
+    with open(path, "w") as f:
+        for record in records:
+            f.write(record if isinstance(record, str) else json.dumps(record))
+            f.write("\n")
+
+
+def test_violation_codes(tmp_path):
+    log = tmp_path / "ops.jsonl"
+    write_log(log, [
+        {"operation": "hash_verification", "mode": "forensic"},
+        {"operation": "emotion_labeling", "mode": "FORENSIC"},
+        {"operation": "hypothesis_testing", "mode": "forensic"},
+        {"operation": "log_analysis", "mode": "astrology"},
+        "{not json",
+        {"operation": ["x"], "mode": "forensic"},
+        {"operation": "counterexample_search", "mode": "popperian"},
+    ])
+    counts = {}
+    violations = list(audit_log(log, counts=counts))
+
+    assert [v["violation"] for v in violations] == [
+        OPERATION_PROHIBITED, OPERATION_NOT_ALLOWED, UNKNOWN_MODE, MALFORMED_RECORD, MALFORMED_RECORD,
+    ]
+    assert counts["records"] == 7 and counts["violations"] == 5
+    first_line = log.read_bytes().split(b"\n")[0]
+    assert violations[0]["offset"] == len(first_line) + 1
+
+
+def test_shards_cover_every_line_once(tmp_path):
+    log = tmp_path / "ops.jsonl"
+    rng = random.Random(3)
+    write_log(log, [{"operation": "op" * rng.randint(1, 20), "mode": "forensic", "i": i} for i in range(500)])
+
+    whole = [offset for offset, _ in read_lines(log)]
+    for shards in (1, 2, 7, 64, 10_000):
+        pieces = [offset for start, end in shard_ranges(log, shards)
+                  for offset, _ in read_lines(log, start, end, chunk_size=64)]
+        assert pieces == whole
+
+
+def test_parallel_matches_serial(tmp_path):
+    log = tmp_path / "ops.jsonl"
+    operations = ["hash_verification", "emotion_labeling", "hypothesis_testing", "narrative_construction"]
+    rng = random.Random(5)
+    write_log(log, [{"operation": rng.choice(operations), "mode": rng.choice(["forensic", "popperian"])}
+                    for _ in range(3000)])
+
+    serial_counts, parallel_counts = {}, {}
+    serial = list(audit_log(log, counts=serial_counts))
+    parallel = list(audit_log(log, workers=2, shards=9, counts=parallel_counts))
+    assert parallel == serial
+    assert parallel_counts == serial_counts
+
+
+def test_empty_log(tmp_path):
+    log = tmp_path / "empty.jsonl"
+    log.write_bytes(b"")
+    assert shard_ranges(log, 8) == [(0, 0)]
+    assert list(audit_log(log, workers=2)) == []
+    assert LogAuditor().counts()["records"] == 0
+
+
+def test_parallel_keeps_workers_shards_in_flight(tmp_path, monkeypatch):
+    submitted = []
+
+    class CountingPool(concurrent.futures.ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            submitted.append(args[-1])
+            return super().submit(fn, *args)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", CountingPool)
+    log = tmp_path / "ops.jsonl"
+    write_log(log, [{"operation": "emotion_labeling", "mode": "forensic"} for _ in range(400)])
+
+    stream = audit_log(log, workers=2, shards=20)
+    next(stream)
+    # First shard consumed, its replacement submitted: never all 20 at once
+    assert len(submitted) == 3
+    stream.close()
+    spill_dir = os.path.dirname(submitted[0])
+    assert not os.path.exists(spill_dir)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""Test compiled operational-mode permission checks."""
+
+from src.operational_modes import DECISION_TABLE, FORENSIC, MODES, POPPERIAN, ModeDecisionTable, OperationalMode
+
+OPERATIONS = [
+    "hash_verification", "emotion_labeling", "hypothesis_testing",
+    "interpretive_analysis", "log_analysis", "unknown_operation",
+]
+
+
+def test_batch_matches_single_checks():
+    for mode in (FORENSIC, POPPERIAN):
+        assert mode.is_allowed_many(OPERATIONS) == [mode.is_allowed(op) for op in OPERATIONS]
+        assert list(mode.filter(iter(OPERATIONS))) == [op for op in OPERATIONS if mode.is_allowed(op)]
+        assert list(mode.filter(OPERATIONS, allowed=False)) == [op for op in OPERATIONS if not mode.is_allowed(op)]
+
+
+def test_prohibition_overrides_allowance():
+    mode = OperationalMode("MIXED", "", allowed=["a", "b"], prohibited=["b"])
+    assert mode.is_allowed("a") and not mode.is_allowed("b")
+
+
+def test_decision_table_answers_allowed_in_which_modes():
+    assert DECISION_TABLE.allowed_in("hash_verification") == ("forensic",)
+    assert DECISION_TABLE.allowed_in("hypothesis_testing") == ("popperian",)
+    assert DECISION_TABLE.allowed_in("unknown_operation") == ()
+
+    masks = DECISION_TABLE.classify_many(OPERATIONS)
+    for operation, mask in zip(OPERATIONS, masks):
+        for key, mode in MODES.items():
+            assert bool(mask & DECISION_TABLE.mode_bits[key]) == mode.is_allowed(operation)
+
+
+def test_shared_operations_combine_bits():
+    modes = {
+        "a": OperationalMode("A", "", ["x", "y"], []),
+        "b": OperationalMode("B", "", ["y"], ["x"]),
+    }
+    table = ModeDecisionTable(modes)
+    assert table.allowed_in("y") == ("a", "b")
+    assert table.allowed_in("x") == ("a",)
+    assert table.prohibited["x"] == table.mode_bits["b"]
+    assert [table.mode_names(m) for m in range(4)] == [(), ("a",), ("b",), ("a", "b")]
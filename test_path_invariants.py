@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Test constraint-layer additivity and mode-boundary dataflow."""
+
+from test_helpers import make_graph, make_node, pair_edges
+from topology.graph_loader import ConstraintLayer, EdgeClass
+from topology.path_invariants import constraint_accumulator, constraint_mask, constraint_names
+from validation.topology_validator import TopologyValidator
+
+L = ConstraintLayer
+
+
+def bound_graph(nodes, pairs):
+    """Edges leaving the root bind the covenant; the root carries every layer"""
+    return make_graph(nodes, pair_edges(pairs, root_edge_class=EdgeClass.COVENANT_BINDING),
+                      root_layers={L.COMPOSITE})
+
+
+def test_constraints_accumulate_through_cycles():
+    every = {L.LOGOS, L.CHALCEDON, L.GRACE, L.KENOSIS, L.AGAPE}
+    graph = bound_graph(
+        [make_node("a", layers=every), make_node("b", layers=every), make_node("c", layers=every)],
+        [("covenant.yaml", "a"), ("a", "b"), ("b", "a"), ("b", "c")],
+    )
+    flow = constraint_accumulator(graph)
+
+    assert flow.accumulated("c") == constraint_mask({L.COMPOSITE})
+    assert flow.violations() == []
+    assert TopologyValidator(".", graph=graph).check_constraint_layer_additivity() is True
+
+
+def test_constraint_subtraction_is_reported():
+    every = {L.LOGOS, L.CHALCEDON, L.GRACE, L.KENOSIS, L.AGAPE}
+    graph = bound_graph(
+        [make_node("a", layers=every), make_node("b", layers=every - {L.GRACE})],
+        [("covenant.yaml", "a"), ("a", "b")],
+    )
+    (violation,) = constraint_accumulator(graph).violations()
+    assert violation.node_id == "b"
+    assert violation.via == "a"
+    assert constraint_names(violation.missing) == ["GRACE"]
+
+    validator = TopologyValidator(".", graph=graph)
+    assert validator.check_constraint_layer_additivity() is False
+    assert validator._first_violation.startswith("CONSTRAINT_LAYER_SUBTRACTED: b")
+
+
+def test_mode_binding_cannot_be_weakened():
+    every = {L.COMPOSITE}
+    graph = bound_graph(
+        [make_node("a", layers=every, modes={"FORENSIC_ONLY"}), make_node("b", layers=every, modes={"ANY"}),
+         make_node("c", layers=every, modes={"FORENSIC_ONLY"})],
+        [("covenant.yaml", "a"), ("a", "b"), ("covenant.yaml", "c")],
+    )
+    validator = TopologyValidator(".", graph=graph)
+    assert validator.check_mode_boundary_preservation() is False
+    assert "MODE_BOUNDARY_WEAKENED: b" in validator._first_violation
+
+    graph.nodes["b"] = make_node("b", layers=every, modes={"FORENSIC_ONLY"})
+    assert TopologyValidator(".", graph=graph).check_mode_boundary_preservation() is True
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Test reachability index and graph query API against plain BFS."""
+
+import random
+from collections import deque
+
+import pytest
+
+from topology.graph_loader import (
+    Node, NodeClass, Authority, Edge, EdgeClass, Directionality, load_topology_graph,
+)
+from topology.reachability import ReachabilityIndex
+from test_helpers import make_graph, make_node, pair_edges
+
+
+def successors(graph):
+    succ = {node_id: set() for node_id in graph.nodes}
+    for edge in graph.edges.values():
+        succ[edge.source].add(edge.target)
+    return succ
+
+
+def bfs(succ, source):
+    seen, queue = set(), deque([source])
+    while queue:
+        v = queue.popleft()
+        for target in succ[v]:
+            if target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return seen
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    names = [f"n{i}" for i in range(n)]
+    pairs = {("covenant.yaml", "n0")}
+    while len(pairs) < m:
+        a, b = rng.sample(names, 2)
+        pairs.add((a, b))
+    return make_graph([make_node(name) for name in names], pair_edges(sorted(pairs)))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_closure_matches_bfs(seed):
+    graph = random_graph(60, 90 + 20 * seed, seed)
+    reach = ReachabilityIndex(graph)
+    succ = successors(graph)
+    for source in graph.nodes:
+        expected = bfs(succ, source)
+        assert reach.descendants(source) == sorted(expected)
+        assert reach.unreachable_from(source) == sorted(set(graph.nodes) - expected - {source})
+        for target in graph.nodes:
+            assert reach.reaches(source, target) == (target in expected)
+            assert (source in reach.ancestors(target)) == (target in expected)
+
+            path = reach.path(source, target)
+            if source == target:
+                assert path == [source]
+            elif target not in expected:
+                assert path is None
+            else:
+                assert path[0] == source and path[-1] == target
+                assert all(b in succ[a] for a, b in zip(path, path[1:]))
+                # Shortest: BFS depth from source equals path length
+                depth, frontier, seen = 0, {source}, {source}
+                while target not in frontier:
+                    frontier = {w for v in frontier for w in succ[v]} - seen
+                    seen |= frontier
+                    depth += 1
+                assert len(path) == depth + 1
+
+
+def test_graph_query_api_and_edge_filter():
+    graph = make_graph(
+        [make_node("a"), make_node("b"), make_node("c"), make_node("guard", node_class=NodeClass.GUARDIAN_SYSTEM)],
+        pair_edges([("covenant.yaml", "a"), ("a", "b"), ("b", "a"), ("b", "c")]),
+    )
+    graph.edges["watch"] = Edge("watch", "guard", "c", EdgeClass.GUARDIAN_WATCH, Directionality.UNI, set())
+
+    assert graph.can_reach("covenant.yaml", "c")
+    assert not graph.can_reach("c", "a")
+    assert graph.descendants("a") == ["a", "b", "c"]
+    assert graph.descendants("covenant.yaml") == ["a", "b", "c"]
+    assert graph.ancestors("c") == ["a", "b", "covenant.yaml", "guard"]
+    assert graph.ancestors("c", {EdgeClass.DEPENDENCY_IMPORT}) == ["a", "b", "covenant.yaml"]
+    assert graph.shortest_path("covenant.yaml", "c") == ["covenant.yaml", "a", "b", "c"]
+    assert graph.reachability().path_edges("a", "c")[-1].edge_id == "b::c::DEPENDENCY_IMPORT"
+    assert graph.shortest_path("c", "covenant.yaml") is None
+    with pytest.raises(KeyError, match="NODE_NOT_FOUND"):
+        graph.can_reach("missing", "a")
+
+    # Cached index is rebuilt after the graph changes, even when the counts do not
+    reach = graph.reachability()
+    del graph.edges["b::c::DEPENDENCY_IMPORT"]
+    graph.edges["c::b::DEPENDENCY_IMPORT"] = Edge("c::b::DEPENDENCY_IMPORT", "c", "b", EdgeClass.DEPENDENCY_IMPORT,
+                                                 Directionality.UNI, set())
+    assert graph.reachability() is not reach
+    assert not graph.can_reach("covenant.yaml", "c", {EdgeClass.DEPENDENCY_IMPORT})
+    assert graph.shortest_path("c", "a") == ["c", "b", "a"]
+    graph.edges = {**graph.edges, "b::c::DEPENDENCY_IMPORT": Edge(
+        "b::c::DEPENDENCY_IMPORT", "b", "c", EdgeClass.DEPENDENCY_IMPORT, Directionality.UNI, set())}
+    del graph.edges["c::b::DEPENDENCY_IMPORT"]
+    assert graph.shortest_path("covenant.yaml", "c") == ["covenant.yaml", "a", "b", "c"]
+
+    # Cached index is rebuilt after the graph grows
+    reach = graph.reachability()
+    assert graph.reachability() is reach
+    graph.edges["back"] = Edge("back", "c", "covenant.yaml", EdgeClass.DEPENDENCY_IMPORT,
+                               Directionality.UNI, set())
+    assert graph.can_reach("c", "a")
+
+
+def test_repository_graph_queries():
+    graph = load_topology_graph(".")
+    root = graph.covenant_root_id
+    for node_id in graph.descendants(root):
+        path = graph.shortest_path(root, node_id)
+        assert path[0] == root and path[-1] == node_id
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Test sharded genesis manifests: generation, incremental update, verification."""
+
+import contextlib
+import io
+
+import yaml
+
+from generate_genesis_manifest import (
+    IGNORE_PATTERNS, enumerate_repository, generate_genesis_manifest,
+    root_digest, shard_manifest_path, update_sharded_manifest, verify_sharded_manifest,
+)
+from benchmarks.synthetic import SyntheticSpec, generate_repo
+
+
+def generate(repo, manifest, depth):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generate_genesis_manifest(str(repo), "synthetic", str(manifest), shard_depth=depth)
+
+
+def shard_files(manifest_path, manifest):
+    files = []
+    for shard in manifest['shards']:
+        with open(manifest_path.parent / shard['manifest']) as f:
+            files.extend(yaml.safe_load(f)['files'])
+    return files
+
+
+def test_shards_partition_flat_manifest(tmp_path):
+    repo = tmp_path / "repo"
+    generate_repo(repo, SyntheticSpec(files=80, fan_out=2, depth=3))
+    (repo / "pkg" / "__init__.py").write_text("")
+    flat = enumerate_repository(repo, IGNORE_PATTERNS)
+
+    for depth in (1, 2, 3):
+        manifest_path = tmp_path / f"depth{depth}.yaml"
+        manifest = generate(repo, manifest_path, depth)
+        files = shard_files(manifest_path, manifest)
+        assert sorted(files, key=lambda f: f['path']) == sorted(flat, key=lambda f: f['path'])
+        assert manifest['total_files'] == len(flat)
+
+    manifest = yaml.safe_load((tmp_path / "depth2.yaml").read_text())
+    assert [s['shard'] for s in manifest['shards']] == ["", "pkg", "pkg/d0_0", "pkg/d0_1", "pkg/d0_2",
+                                                        "pkg/d0_3", "src"]
+
+
+def test_incremental_update_touches_one_shard(tmp_path):
+    repo = tmp_path
+    generate_repo(repo, SyntheticSpec(files=40, fan_out=2, depth=3))
+    manifest_path = repo / "GENESIS_MANIFEST.yaml"
+    before = generate(repo, manifest_path, 2)
+    assert "GENESIS_MANIFEST" not in str(shard_files(manifest_path, before))
+
+    untouched = {s['shard']: shard_manifest_path(manifest_path, s['shard']).stat().st_mtime_ns
+                 for s in before['shards']}
+    (repo / "pkg" / "d0_1" / "d1_0" / "mod_1.py").write_text("changed\n")
+    (repo / "pkg" / "d0_1" / "new.py").write_text("new\n")
+    (repo / "src" / "principles.py").unlink()
+
+    rebuilt = update_sharded_manifest(str(repo), str(manifest_path),
+                                      ["pkg/d0_1/d1_0/mod_1.py", "pkg/d0_1/new.py", "src/principles.py"])
+    assert rebuilt == ["pkg/d0_1", "src"]
+    after = yaml.safe_load(manifest_path.read_text())
+    for shard in after['shards']:
+        mtime = shard_manifest_path(manifest_path, shard['shard']).stat().st_mtime_ns
+        assert (mtime == untouched[shard['shard']]) == (shard['shard'] not in rebuilt)
+
+    assert after['root_digest'] != before['root_digest']
+    expected = enumerate_repository(repo, IGNORE_PATTERNS | {"GENESIS_MANIFEST"})
+    assert sorted(shard_files(manifest_path, after), key=lambda f: f['path']) == \
+        sorted(expected, key=lambda f: f['path'])
+    assert after['root_digest'] == root_digest(after['shards'])
+
+    # Removing every file of a shard drops it
+    (repo / "src" / "__init__.py").unlink()
+    (repo / "src" / "operational_modes.py").unlink()
+    (repo / "src" / "infrastructure.py").unlink()
+    update_sharded_manifest(str(repo), str(manifest_path), ["src/__init__.py"])
+    shards = yaml.safe_load(manifest_path.read_text())['shards']
+    assert "src" not in [s['shard'] for s in shards]
+    assert not shard_manifest_path(manifest_path, "src").exists()
+
+
+def test_parallel_verification(tmp_path):
+    repo = tmp_path / "repo"
+    generate_repo(repo, SyntheticSpec(files=60, fan_out=2, depth=3))
+    manifest_path = tmp_path / "GENESIS_MANIFEST.yaml"
+    generate(repo, manifest_path, 2)
+
+    clean = verify_sharded_manifest(str(repo), str(manifest_path), workers=4)
+    assert clean == {'root_ok': True, 'shards_checked': 6, 'corrupt_shards': [],
+                     'missing': [], 'mismatched': []}
+
+    (repo / "pkg" / "d0_2" / "d1_0" / "mod_2.py").write_text("tampered\n")
+    (repo / "covenant.yaml").unlink()
+    shard = shard_manifest_path(manifest_path, "pkg/d0_3")
+    shard.write_text(shard.read_text().replace("total_files", "total_files_x"))
+
+    result = verify_sharded_manifest(str(repo), str(manifest_path), workers=4)
+    assert result['root_ok'] is True
+    assert result['corrupt_shards'] == ["pkg/d0_3"]
+    assert result['missing'] == ["covenant.yaml"]
+    assert result['mismatched'] == ["pkg/d0_2/d1_0/mod_2.py"]
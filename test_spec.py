@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Test compiled topology spec loading and caching."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from topology import spec as spec_module
+from topology.graph_loader import NodeClass, EdgeClass, Directionality
+from topology.spec import load_spec
+
+TOPOLOGY_DIR = Path(__file__).resolve().parent / "topology"
+
+
+def copy_spec(tmp_path):
+    target = tmp_path / "topology"
+    target.mkdir()
+    for filename in spec_module.SPEC_FILES:
+        shutil.copy(TOPOLOGY_DIR / filename, target / filename)
+    return target
+
+
+def test_compiled_tables(tmp_path):
+    spec = load_spec(copy_spec(tmp_path))
+
+    binding = spec.edge_classes[EdgeClass.COVENANT_BINDING]
+    assert binding.directionality == Directionality.UNI
+    assert binding.allowed_pairs == {(NodeClass.COVENANT_ROOT, NodeClass.PRINCIPLE_MODULE)}
+
+    mapping = spec.edge_classes[EdgeClass.CORRESPONDENCE_MAPPING]
+    assert mapping.directionality == Directionality.BI
+    assert (mapping.source_class, mapping.target_class) == (None, None)
+
+    assert "DEPENDENCY_FLOW" in spec.node_classes[NodeClass.COVENANT_ROOT].prohibited_axes
+    assert spec.invariants_by_check["graph_traversal_from_root"] == "INVARIANT_001"
+    with pytest.raises(TypeError):
+        spec.edge_classes[EdgeClass.COVENANT_BINDING] = None
+
+
+def test_disk_cache_skips_parsing(tmp_path, monkeypatch):
+    topology_dir = copy_spec(tmp_path)
+    first = load_spec(topology_dir)
+    assert list((topology_dir / "__pycache__").glob("spec-*.pickle"))
+
+    spec_module._memo.clear()
+    monkeypatch.setattr(spec_module, "compile_spec", lambda *a: pytest.fail("cache miss"))
+    second = load_spec(topology_dir)
+    assert second.digest == first.digest
+    assert second.edge_classes == first.edge_classes
+
+
+def test_cache_invalidated_by_content_change(tmp_path):
+    topology_dir = copy_spec(tmp_path)
+    first = load_spec(topology_dir)
+    path = topology_dir / "forbidden.yaml"
+    path.write_text(path.read_text() + "\n# amended\n")
+    assert load_spec(topology_dir).digest != first.digest
+
+
+def test_schema_violation_rejected(tmp_path):
+    topology_dir = copy_spec(tmp_path)
+    path = topology_dir / "edge_classes.yaml"
+    path.write_text(path.read_text().replace("directionality: BI", "directionality: SIDEWAYS"))
+    with pytest.raises(ValueError, match="SPEC_INVALID: .*SIDEWAYS"):
+        load_spec(topology_dir)
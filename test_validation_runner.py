@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Test check registry and concurrent validation runner."""
+
+import multiprocessing
+import os
+from pathlib import Path
+
+from test_helpers import make_edge, make_graph, make_node, pair_edges
+from topology.graph_loader import ConstraintLayer, EdgeClass, Verification
+from validation.topology_validator import (
+    CHECK_REGISTRY, TopologyValidator, choose_executor, run_checks, run_validation,
+)
+import validation.topology_validator as topology_validator
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def chain_graph(width=200):
+    """Root-bound chain m0 -> ... -> m<width-1> whose last link drops verification"""
+    every = {ConstraintLayer.COMPOSITE}
+    nodes = [make_node(f"m{i}", verification=Verification.NONE if i == width - 1 else Verification.CORRESPONDENCE,
+                       layers=every) for i in range(width)]
+    pairs = [("covenant.yaml", "m0")] + [(f"m{i - 1}", f"m{i}") for i in range(1, width)]
+    return make_graph(nodes, pair_edges(pairs, root_edge_class=EdgeClass.COVENANT_BINDING), root_layers=every)
+
+
+def test_executors_agree():
+    graph = chain_graph()
+    expected = run_checks(TopologyValidator(".", graph=graph), executor="serial")
+    assert set(expected) == set(CHECK_REGISTRY)
+    assert expected['VERIFICATION_MONOTONICITY'].passed is False
+
+    for executor in ("thread", "process"):
+        results = run_checks(TopologyValidator(".", graph=graph), executor=executor)
+        assert {n: (r.passed, r.violation) for n, r in results.items()} == \
+            {n: (r.passed, r.violation) for n, r in expected.items()}
+        assert all(r.elapsed_s >= 0 for r in results.values())
+
+
+def test_process_executor_without_fork(monkeypatch):
+    # Workers then rebuild the validator from the pickled graph
+    graph = chain_graph(20)
+    expected = run_checks(TopologyValidator(".", graph=graph), executor="serial")
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    results = run_checks(TopologyValidator(".", graph=graph), executor="process")
+    assert {n: r.violation for n, r in results.items()} == {n: r.violation for n, r in expected.items()}
+
+
+def test_auto_executor_choice(monkeypatch):
+    validator = TopologyValidator(".", graph=chain_graph(20))
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    assert choose_executor(validator) == "serial"
+    monkeypatch.setattr(topology_validator, "PROCESS_MIN_EDGES", 10)
+    assert choose_executor(validator) == "process"
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    assert choose_executor(validator) == "serial"
+
+
+def test_check_exception_becomes_violation():
+    graph = chain_graph(3)
+    dangling = make_edge("m0", "missing")
+    graph.edges[dangling.edge_id] = dangling
+    validator = TopologyValidator(".", graph=graph)
+    result = run_checks(validator, names=['MODE_BOUNDARY_PRESERVATION'])['MODE_BOUNDARY_PRESERVATION']
+    assert result.passed is False
+    assert result.violation.startswith("KeyError")
+
+
+def test_run_validation_on_repository():
+    results = run_validation(str(REPO_ROOT))
+    assert set(results['checks']) == set(CHECK_REGISTRY)
+    assert set(results['timings']) == set(CHECK_REGISTRY)
+    assert results['checks']['VERIFICATION_MONOTONICITY'] is True
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Test compiled principle verification engine."""
+
+import pytest
+
+from src.principles import ALL_PRINCIPLES, LOGOS, KENOSIS, Principle
+from src.verification import CONSTRAINT_REGISTRY, VerificationEngine
+
+CLEAN = b"def add(a, b):\n    return a + b\n"
+OBFUSCATED = b"import base64\nexec(base64.b64decode(payload))\n"
+FLOAT_POWER = b"authority = 2.0 ** depth\n"
+
+
+def test_every_covenant_constraint_is_registered():
+    for principle in ALL_PRINCIPLES:
+        for constraint in principle.constraints:
+            assert constraint in CONSTRAINT_REGISTRY
+
+
+def test_principle_verify_uses_predicates():
+    assert LOGOS.verify(CLEAN) is True
+    assert KENOSIS.verify(OBFUSCATED) is False
+    assert LOGOS.verify(FLOAT_POWER) is False
+    assert LOGOS._check_constraint("no_floating_point_exponentiation_as_authority", CLEAN) is True
+
+
+def test_batch_matches_single_verification():
+    artifacts = [CLEAN, OBFUSCATED, FLOAT_POWER, b"", b"os.setuid(0) # exec(zlib.decompress(x))"]
+    batch = VerificationEngine().verify_batch(artifacts)
+    single = VerificationEngine()
+    for artifact, verdict in zip(artifacts, batch):
+        assert verdict == {p.name: single.verify(p, artifact) for p in ALL_PRINCIPLES}
+    assert batch[4]["AGAPE"] is False and batch[4]["KENOSIS"] is False
+
+
+def test_results_are_memoized_by_content_hash():
+    engine = VerificationEngine()
+    engine.verify_batch([CLEAN, OBFUSCATED])
+    evaluations = dict(engine.evaluations)
+    engine.verify_batch([bytearray(CLEAN), OBFUSCATED.decode()])
+    assert engine.evaluations == evaluations
+    assert engine.memo_hits == 2
+
+
+def test_known_digests_and_unknown_constraints():
+    engine = VerificationEngine(known_digests=set())
+    assert engine.verify(LOGOS, CLEAN) is False
+
+    rogue = Principle("PRINCIPLE_999", "ROGUE", "00", ["undefined_constraint"])
+    with pytest.raises(ValueError, match="UNKNOWN_CONSTRAINT"):
+        VerificationEngine([rogue])
+
+
+def test_failing_constraints_move_to_the_front():
+    engine = VerificationEngine([KENOSIS], reorder_every=1)
+    for i in range(10):
+        engine.verify(KENOSIS, OBFUSCATED + str(i).encode())
+    assert engine._order["KENOSIS"][0] == "transparent_operation"
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""Test the zone index and zone-scoped validation, revalidation and scanning."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from test_helpers import make_edge, make_graph, make_node
+from test_spec import copy_spec
+from topology.graph_loader import Authority, ConstraintLayer, EdgeClass, Temporal, Verification
+from topology.spec import load_spec
+from topology.zones import ZoneIndex
+from topology_scanner import TopologyScanner
+from validation.incremental import TopologyDelta, zone_scoped_delta
+from validation.topology_validator import run_validation
+
+CHECKS = ['ROOT_REACHABILITY', 'VERIFICATION_MONOTONICITY', 'NO_AUTHORITY_ESCALATION_CYCLE']
+
+
+def layered_graph(overlay_edges=()):
+    nodes = [
+        make_node("core/a.py", temporal=Temporal.FOUNDATION),
+        make_node("core/b.py", temporal=Temporal.FOUNDATION),
+        make_node("lib/c.py", temporal=Temporal.SUBSTRATE),
+        make_node("ui/d.py", temporal=Temporal.OVERLAY),
+        make_node("ui/e.py", temporal=Temporal.OVERLAY, verification=Verification.NONE),
+        make_node("tmp/f.py", temporal=Temporal.EPHEMERAL),
+    ]
+    edges = [make_edge("covenant.yaml", "core/a.py"), make_edge("core/a.py", "core/b.py"),
+             make_edge("core/b.py", "lib/c.py"), make_edge("lib/c.py", "ui/d.py"),
+             *(make_edge(s, t) for s, t in overlay_edges)]
+    return make_graph(nodes, edges)
+
+
+def test_spec_zones_partition_temporal_stages(tmp_path):
+    spec = load_spec(copy_spec(tmp_path))
+    assert set(spec.zone_by_temporal) == set(Temporal)
+    assert [zone.key for zone in sorted(spec.zones.values(), key=lambda z: z.order)][:2] == [
+        "zone_1_immutable", "zone_2_foundation"]
+    assert {key for key, zone in spec.zones.items() if zone.overlay} == {"zone_4_overlay", "zone_5_ephemeral"}
+
+
+def test_spec_rejects_unzoned_stage(tmp_path):
+    topology_dir = copy_spec(tmp_path)
+    doc = yaml.safe_load((topology_dir / "zones.yaml").read_text())
+    del doc["zones"]["zone_5_ephemeral"]
+    (topology_dir / "zones.yaml").write_text(yaml.safe_dump(doc))
+    with pytest.raises(ValueError, match="SPEC_INVALID"):
+        load_spec(topology_dir)
+
+
+def test_zone_ranges_and_boundary_edges():
+    zones = ZoneIndex.from_graph(layered_graph([("ui/d.py", "ui/e.py")]))
+
+    assert zones.members("zone_4_overlay") == ["ui/d.py", "ui/e.py"]
+    start, end = zones.ranges["zone_4_overlay"]
+    assert zones.node_ids[start:end] == zones.members("zone_4_overlay")
+    assert zones.contains("zone_2_foundation", "core/a.py")
+    assert not zones.contains("zone_2_foundation", "lib/c.py")
+
+    assert [(e.source, e.target) for e in zones.boundary_edges("zone_4_overlay")] == [("lib/c.py", "ui/d.py")]
+    assert len(zones.zone_edges("zone_4_overlay")) == 2
+    assert zones.is_sink("zone_4_overlay") and not zones.is_sink("zone_3_substrate")
+    with pytest.raises(KeyError, match="UNKNOWN_ZONE"):
+        zones.members("zone_9")
+
+
+def test_zone_scoped_validation_matches_full_on_zone_nodes():
+    # ui/d.py -> ui/e.py weakens verification; tmp/f.py is unreachable
+    graph = layered_graph([("ui/d.py", "ui/e.py"), ("tmp/f.py", "tmp/f.py")])
+    full = run_validation(".", graph=graph, executor="serial")
+    assert full['checks']['VERIFICATION_MONOTONICITY'] is False
+
+    overlay = run_validation(".", graph=graph, executor="serial", zone="zone_4_overlay")
+    foundation = run_validation(".", graph=graph, executor="serial", zone="zone_2_foundation")
+    for check in ['VERIFICATION_MONOTONICITY', 'NO_AUTHORITY_ESCALATION_CYCLE']:
+        assert overlay['checks'][check] == full['checks'][check]
+    assert all(foundation['checks'][check] for check in CHECKS)
+    # Ephemeral tmp/f.py is unreachable: visible in its own zone, not in the overlay zone
+    assert overlay['checks']['ROOT_REACHABILITY'] is True
+    assert run_validation(".", graph=graph, executor="serial",
+                          zone="zone_5_ephemeral")['checks']['ROOT_REACHABILITY'] is False
+
+    with pytest.raises(KeyError, match="UNKNOWN_ZONE"):
+        run_validation(".", graph=graph, executor="serial", zone="zone_9")
+
+
+def test_zone_scoped_dataflow_and_cycles_stay_near_the_zone():
+    L = ConstraintLayer
+    nodes = [
+        make_node("core/a.py", temporal=Temporal.FOUNDATION, layers=[L.LOGOS]),
+        make_node("core/b.py", Authority.IMMUTABLE, temporal=Temporal.FOUNDATION, layers=[L.LOGOS]),
+        make_node("lib/c.py", temporal=Temporal.SUBSTRATE),
+        make_node("ui/d.py", temporal=Temporal.OVERLAY, modes={"FORENSIC_ONLY"}),
+        make_node("ui/e.py", temporal=Temporal.OVERLAY),
+    ]
+    # a -> c drops LOGOS; b <-> c escalates across two zones; d -> e widens modes
+    edges = [make_edge("covenant.yaml", "core/a.py"), make_edge("core/a.py", "core/b.py"),
+             make_edge("core/a.py", "lib/c.py"), make_edge("core/b.py", "lib/c.py"),
+             make_edge("lib/c.py", "core/b.py"), make_edge("lib/c.py", "ui/d.py"),
+             make_edge("ui/d.py", "ui/e.py")]
+    graph = make_graph(nodes, edges)
+
+    def failing(zone):
+        checks = run_validation(".", graph=graph, executor="serial", zone=zone)['checks']
+        return {name for name in ['CONSTRAINT_LAYER_ADDITIVITY', 'MODE_BOUNDARY_PRESERVATION',
+                                  'NO_AUTHORITY_ESCALATION_CYCLE'] if not checks[name]}
+
+    assert failing("zone_3_substrate") == {'CONSTRAINT_LAYER_ADDITIVITY', 'NO_AUTHORITY_ESCALATION_CYCLE'}
+    assert failing("zone_2_foundation") == {'NO_AUTHORITY_ESCALATION_CYCLE'}
+    assert failing("zone_4_overlay") == {'MODE_BOUNDARY_PRESERVATION'}
+
+    # The dataflow sees the zone plus the sources of edges entering it, nothing further upstream
+    zones = ZoneIndex.from_graph(graph)
+    inflow = zones.inflow_index("zone_4_overlay", {EdgeClass.DEPENDENCY_IMPORT})
+    assert inflow.node_ids == ["ui/d.py", "ui/e.py", "lib/c.py"]
+    assert len(zones.inflow_index("zone_3_substrate").node_ids) == 3
+
+
+def test_overlay_only_change_diffs_its_zone():
+    old = layered_graph()
+    new = layered_graph([("ui/d.py", "ui/e.py")])
+    old_zones, new_zones = ZoneIndex.from_graph(old), ZoneIndex.from_graph(new)
+
+    delta, touched = zone_scoped_delta(old, new, {"ui/d.py"}, old_zones, new_zones)
+    assert touched == {"zone_4_overlay"}
+    assert set(delta.added_edges) == {"ui/d.py::ui/e.py::DEPENDENCY_IMPORT"}
+
+    # A change reaching a non-overlay zone falls back to the full diff
+    delta, touched = zone_scoped_delta(old, new, {"ui/d.py", "lib/c.py"}, old_zones, new_zones)
+    assert touched is None
+    assert delta == TopologyDelta.from_graphs(old, new)
+
+
+def test_scanner_include_limits_walk(tmp_path):
+    (tmp_path / "ui").mkdir()
+    (tmp_path / "ui" / "d.py").write_text("import os\n")
+    (tmp_path / "core").mkdir()
+    (tmp_path / "core" / "a.py").write_text("import ui.d\n")
+    (tmp_path / "top.py").write_text("")
+
+    scanner = TopologyScanner(tmp_path, include=["ui", "top.py", "missing.py"])
+    scanner._walk_tree()
+    assert sorted(scanner.files) == [str(Path("top.py")), str(Path("ui/d.py"))]
@@ -0,0 +1,475 @@
+"""
+TOPOLOGY GRAPH EXPORT
+Compressed columnar snapshots of a TopologyGraph for offline analysis
+Authority: IMMUTABLE
+Generated: 2026-02-07
+
+Nodes and edges are written column by column: enum attributes as uint8
+codes, constraint layers as a uint16 bitmask, edge endpoints as uint32
+node positions and strings as (offsets, utf-8 bytes) pairs. Each column
+is compressed on its own (zlib, lzma, or zstd when zstandard is
+installed) and stored raw whenever compression would not shrink it.
+
+load_columnar() memory-maps the file; uncompressed columns are handed out
+as memoryviews into the mapping (zero-copy), compressed ones are decoded
+once on first access. to_graph() rebuilds a TopologyGraph when needed, so
+cross-repository analysis can read snapshots without re-running the
+loader. With pyarrow installed, format="arrow" writes Arrow IPC files
+instead (nodes.arrow, edges.arrow in a directory), loaded through an
+Arrow memory map.
+
+File layout (little-endian):
+  b"TOPOCOL\\x01" | u32 header length | JSON header | columns, 8-byte aligned
+"""
+
+import json
+import lzma
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from topology.graph_loader import (
+    TopologyGraph, Node, Edge, NodeClass, Authority, ConstraintLayer,
+    Verification, Temporal, EdgeClass, Directionality,
+)
+
+MAGIC = b"TOPOCOL\x01"
+FORMAT_VERSION = 1
+
+# Separator for set-valued string attributes (never part of a binding name)
+SET_SEPARATOR = "\x1f"
+
+# Column name -> enum, codes are positions in the enum's declaration order
+ENUM_COLUMNS = {
+    "nodes.node_class": NodeClass,
+    "nodes.authority": Authority,
+    "nodes.verification": Verification,
+    "nodes.temporal": Temporal,
+    "edges.edge_class": EdgeClass,
+    "edges.directionality": Directionality,
+}
+
+CONSTRAINT_LAYERS = list(ConstraintLayer)
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError("CODEC_UNAVAILABLE: zstd needs the zstandard package")
+    return zstandard
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, 6)
+    if codec == "lzma":
+        return lzma.compress(data)
+    if codec == "zstd":
+        return _zstd().ZstdCompressor(level=9).compress(data)
+    raise ValueError(f"UNKNOWN_CODEC: {codec}")
+
+
+def _decompress(codec: str, data) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "lzma":
+        return lzma.decompress(data)
+    if codec == "zstd":
+        return _zstd().ZstdDecompressor().decompress(bytes(data))
+    raise ValueError(f"UNKNOWN_CODEC: {codec}")
+
+
+def _string_column(values: List[str]) -> Tuple[array, bytes]:
+    """(uint32 offsets, utf-8 data) with offsets[i]:offsets[i+1] spanning value i"""
+    offsets = array("I", [0])
+    chunks = []
+    end = 0
+    for value in values:
+        encoded = value.encode("utf-8")
+        chunks.append(encoded)
+        end += len(encoded)
+        offsets.append(end)
+    return offsets, b"".join(chunks)
+
+
+def _set_value(values) -> str:
+    return SET_SEPARATOR.join(sorted(values))
+
+
+def graph_columns(graph: TopologyGraph) -> Dict[str, object]:
+    """Column name -> array or bytes for every column of graph"""
+    node_ids = list(graph.nodes)
+    position = {node_id: i for i, node_id in enumerate(node_ids)}
+    nodes = [graph.nodes[node_id] for node_id in node_ids]
+    edges = list(graph.edges.values())
+    codes = {enum: {member: i for i, member in enumerate(enum)} for enum in ENUM_COLUMNS.values()}
+    layer_bit = {layer: 1 << i for i, layer in enumerate(CONSTRAINT_LAYERS)}
+
+    columns: Dict[str, object] = {}
+
+    def strings(name: str, values: List[str]):
+        columns[name + ".offsets"], columns[name + ".data"] = _string_column(values)
+
+    strings("nodes.node_id", node_ids)
+    for name, attribute in [("nodes.node_class", "node_class"), ("nodes.authority", "authority"),
+                            ("nodes.verification", "verification"), ("nodes.temporal", "temporal")]:
+        enum_codes = codes[ENUM_COLUMNS[name]]
+        columns[name] = array("B", (enum_codes[getattr(node, attribute)] for node in nodes))
+    columns["nodes.constraint_layer"] = array(
+        "H", (sum(layer_bit[layer] for layer in node.constraint_layer) for node in nodes))
+    # None and the empty set are distinct
+    columns["nodes.has_mode_binding"] = array(
+        "B", (node.operational_mode_binding is not None for node in nodes))
+    strings("nodes.operational_mode_binding",
+            [_set_value(node.operational_mode_binding or ()) for node in nodes])
+
+    strings("edges.edge_id", [edge.edge_id for edge in edges])
+    columns["edges.source"] = array("I", (position[edge.source] for edge in edges))
+    columns["edges.target"] = array("I", (position[edge.target] for edge in edges))
+    columns["edges.edge_class"] = array("B", (codes[EdgeClass][edge.edge_class] for edge in edges))
+    columns["edges.directionality"] = array(
+        "B", (codes[Directionality][edge.directionality] for edge in edges))
+    strings("edges.axis_binding", [_set_value(edge.axis_binding) for edge in edges])
+    return columns
+
+
+def export_columnar(graph: TopologyGraph, path: Path, compression: str = "zlib") -> dict:
+    """
+    Write graph as one columnar file; returns its header
+    compression: "none", "zlib", "lzma" or "zstd" (needs zstandard).
+    "none" keeps every column mappable without a copy.
+    """
+    columns = graph_columns(graph)
+    if compression not in ("none", "zlib", "lzma", "zstd"):
+        raise ValueError(f"UNKNOWN_CODEC: {compression}")
+    if compression == "zstd":
+        _zstd()
+
+    blobs: List[bytes] = []
+    entries: Dict[str, dict] = {}
+    offset = 0
+    for name, column in columns.items():
+        typecode = column.typecode if isinstance(column, array) else "s"
+        if isinstance(column, array):
+            if sys.byteorder != "little":
+                column = array(column.typecode, column)
+                column.byteswap()
+            raw = column.tobytes()
+        else:
+            raw = column
+        codec, stored = "none", raw
+        if compression != "none" and raw:
+            compressed = _compress(compression, raw)
+            if len(compressed) < len(raw):
+                codec, stored = compression, compressed
+        entries[name] = {"type": typecode, "codec": codec, "offset": offset,
+                         "length": len(stored), "raw_length": len(raw)}
+        padding = -len(stored) % 8
+        blobs.append(stored + b"\0" * padding)
+        offset += len(stored) + padding
+
+    header = {
+        "format": FORMAT_VERSION,
+        "nodes": len(graph.nodes),
+        "edges": len(graph.edges),
+        "covenant_root": graph.covenant_root_id,
+        "enums": {name: [member.name for member in enum] for name, enum in ENUM_COLUMNS.items()},
+        "constraint_layers": [layer.name for layer in CONSTRAINT_LAYERS],
+        "columns": entries,
+    }
+    encoded = json.dumps(header, sort_keys=True, separators=(",", ":")).encode()
+    prefix = MAGIC + struct.pack("<I", len(encoded)) + encoded
+    prefix += b"\0" * (-len(prefix) % 8)
+
+    with open(path, "wb") as f:
+        f.write(prefix)
+        for blob in blobs:
+            f.write(blob)
+    return header
+
+
+class StringColumn:
+    """Read-only sequence of strings over (offsets, data) buffers"""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return bytes(self.data[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class ColumnarGraph:
+    """
+    Memory-mapped columnar snapshot
+    column(name) returns a typed memoryview (or bytes for string data);
+    strings(name) a StringColumn. Views hold the mapping open: close()
+    unmaps at once if none are alive, otherwise when the last is released.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._decoded: Dict[str, object] = {}
+        if self._view[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"EXPORT_INVALID: {self.path} is not a columnar topology export")
+        (header_length,) = struct.unpack_from("<I", self._view, len(MAGIC))
+        start = len(MAGIC) + 4
+        self.header = json.loads(bytes(self._view[start:start + header_length]))
+        if self.header.get("format") != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"EXPORT_INVALID: unsupported format {self.header.get('format')}")
+        self._data_start = start + header_length + (-(start + header_length) % 8)
+
+    @property
+    def node_count(self) -> int:
+        return self.header["nodes"]
+
+    @property
+    def edge_count(self) -> int:
+        return self.header["edges"]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.header["columns"])
+
+    def column(self, name: str):
+        """Column contents; zero-copy for uncompressed columns on little-endian hosts"""
+        if name in self._decoded:
+            return self._decoded[name]
+        entry = self.header["columns"].get(name)
+        if entry is None:
+            raise KeyError(f"UNKNOWN_COLUMN: {name}")
+        offset = self._data_start + entry["offset"]
+        raw = self._view[offset:offset + entry["length"]]
+        if entry["codec"] != "none":
+            raw = memoryview(_decompress(entry["codec"], raw))
+            if len(raw) != entry["raw_length"]:
+                raise ValueError(f"EXPORT_INVALID: column {name} decodes to {len(raw)} bytes")
+        if entry["type"] == "s":
+            value = raw
+        elif sys.byteorder == "little":
+            value = raw.cast(entry["type"])
+        else:
+            value = array(entry["type"], raw)
+            value.byteswap()
+        if entry["codec"] != "none" or sys.byteorder != "little":
+            self._decoded[name] = value
+        return value
+
+    def strings(self, name: str) -> StringColumn:
+        return StringColumn(self.column(name + ".offsets"), self.column(name + ".data"))
+
+    def to_graph(self) -> TopologyGraph:
+        """Materialize the snapshot as a TopologyGraph"""
+        enums = {name: [enum[member] for member in self.header["enums"][name]]
+                 for name, enum in ENUM_COLUMNS.items()}
+        layers = [ConstraintLayer[name] for name in self.header["constraint_layers"]]
+
+        node_ids = list(self.strings("nodes.node_id"))
+        node_class, authority = self.column("nodes.node_class"), self.column("nodes.authority")
+        verification, temporal = self.column("nodes.verification"), self.column("nodes.temporal")
+        layer_masks = self.column("nodes.constraint_layer")
+        has_binding = self.column("nodes.has_mode_binding")
+        bindings = self.strings("nodes.operational_mode_binding")
+
+        nodes = {}
+        for i, node_id in enumerate(node_ids):
+            mask = layer_masks[i]
+            nodes[node_id] = Node(
+                node_id=node_id,
+                node_class=enums["nodes.node_class"][node_class[i]],
+                authority=enums["nodes.authority"][authority[i]],
+                constraint_layer={layer for bit, layer in enumerate(layers) if mask >> bit & 1},
+                verification=enums["nodes.verification"][verification[i]],
+                temporal=enums["nodes.temporal"][temporal[i]],
+                operational_mode_binding=_split_set(bindings[i]) if has_binding[i] else None,
+            )
+
+        source, target = self.column("edges.source"), self.column("edges.target")
+        edge_class, directionality = self.column("edges.edge_class"), self.column("edges.directionality")
+        axis_bindings = self.strings("edges.axis_binding")
+        edges = {}
+        for i, edge_id in enumerate(self.strings("edges.edge_id")):
+            edges[edge_id] = Edge(
+                edge_id=edge_id,
+                source=node_ids[source[i]],
+                target=node_ids[target[i]],
+                edge_class=enums["edges.edge_class"][edge_class[i]],
+                directionality=enums["edges.directionality"][directionality[i]],
+                axis_binding=_split_set(axis_bindings[i]),
+            )
+        return TopologyGraph(nodes=nodes, edges=edges)
+
+    def close(self):
+        """Release the mapping, or leave it to the views from column() still held"""
+        if self._mmap is None:
+            return
+        self._decoded.clear()
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Exported views pin the buffer; the map is unmapped when the last one is collected
+            pass
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _split_set(value: str) -> set:
+    return set(value.split(SET_SEPARATOR)) if value else set()
+
+
+def load_columnar(path: Path) -> ColumnarGraph:
+    return ColumnarGraph(path)
+
+
+# ARROW (optional: pyarrow)
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError:
+        raise ValueError("FORMAT_UNAVAILABLE: arrow export needs pyarrow")
+    return pyarrow
+
+
+def export_arrow(graph: TopologyGraph, directory: Path, compression: str = "zstd"):
+    """Write nodes.arrow and edges.arrow (Arrow IPC files) into directory"""
+    pa = _pyarrow()
+    if compression not in ("none", "zstd", "lz4"):
+        raise ValueError(f"UNKNOWN_CODEC: {compression} (arrow supports none, zstd, lz4)")
+    nodes = list(graph.nodes.values())
+    edges = list(graph.edges.values())
+    tables = {
+        "nodes": pa.table({
+            "node_id": [n.node_id for n in nodes],
+            "node_class": [n.node_class.name for n in nodes],
+            "authority": [n.authority.name for n in nodes],
+            "constraint_layer": [sorted(layer.name for layer in n.constraint_layer) for n in nodes],
+            "verification": [n.verification.name for n in nodes],
+            "temporal": [n.temporal.name for n in nodes],
+            "operational_mode_binding": pa.array(
+                [sorted(n.operational_mode_binding) if n.operational_mode_binding is not None else None
+                 for n in nodes], type=pa.list_(pa.string())),
+        }),
+        "edges": pa.table({
+            "edge_id": [e.edge_id for e in edges],
+            "source": [e.source for e in edges],
+            "target": [e.target for e in edges],
+            "edge_class": [e.edge_class.name for e in edges],
+            "directionality": [e.directionality.name for e in edges],
+            "axis_binding": pa.array([sorted(e.axis_binding) for e in edges], type=pa.list_(pa.string())),
+        }),
+    }
+    options = pa.ipc.IpcWriteOptions(compression=None if compression == "none" else compression)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, table in tables.items():
+        with pa.OSFile(str(directory / f"{name}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+
+
+def load_arrow(directory: Path) -> Tuple[object, object]:
+    """(nodes, edges) pyarrow Tables, memory-mapped"""
+    pa = _pyarrow()
+    directory = Path(directory)
+    return tuple(pa.ipc.open_file(pa.memory_map(str(directory / f"{name}.arrow"))).read_all()
+                 for name in ("nodes", "edges"))
+
+
+def arrow_to_graph(nodes_table, edges_table) -> TopologyGraph:
+    nodes = {}
+    for row in nodes_table.to_pylist():
+        binding = row["operational_mode_binding"]
+        nodes[row["node_id"]] = Node(
+            node_id=row["node_id"],
+            node_class=NodeClass[row["node_class"]],
+            authority=Authority[row["authority"]],
+            constraint_layer={ConstraintLayer[layer] for layer in row["constraint_layer"]},
+            verification=Verification[row["verification"]],
+            temporal=Temporal[row["temporal"]],
+            operational_mode_binding=set(binding) if binding is not None else None,
+        )
+    edges = {}
+    for row in edges_table.to_pylist():
+        edges[row["edge_id"]] = Edge(
+            edge_id=row["edge_id"],
+            source=row["source"],
+            target=row["target"],
+            edge_class=EdgeClass[row["edge_class"]],
+            directionality=Directionality[row["directionality"]],
+            axis_binding=set(row["axis_binding"]),
+        )
+    return TopologyGraph(nodes=nodes, edges=edges)
+
+
+def export_graph(graph: TopologyGraph, path: Path, format: str = "columnar",
+                 compression: Optional[str] = None):
+    """Export in format "columnar" (single file) or "arrow" (directory)"""
+    if format == "columnar":
+        return export_columnar(graph, Path(path), compression or "zlib")
+    if format == "arrow":
+        return export_arrow(graph, Path(path), compression or "zstd")
+    raise ValueError(f"UNKNOWN_FORMAT: {format}")
+
+
+def load_graph(path: Path) -> TopologyGraph:
+    """TopologyGraph from either export format"""
+    path = Path(path)
+    if path.is_dir():
+        return arrow_to_graph(*load_arrow(path))
+    with load_columnar(path) as snapshot:
+        return snapshot.to_graph()
+
+
+if __name__ == '__main__':
+    import argparse
+    from topology.graph_loader import load_topology_graph
+
+    parser = argparse.ArgumentParser(description="Columnar topology graph export")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="load a repository's graph and export it")
+    export.add_argument("repo")
+    export.add_argument("output")
+    export.add_argument("--format", choices=["columnar", "arrow"], default="columnar")
+    export.add_argument("--compression", choices=["none", "zlib", "lzma", "zstd", "lz4"])
+    info = sub.add_parser("info", help="describe a columnar export")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_graph(load_topology_graph(args.repo), Path(args.output), args.format, args.compression)
+        print(f"EXPORTED: {args.output}")
+    else:
+        with load_columnar(Path(args.path)) as snapshot:
+            print(f"NODES: {snapshot.node_count}  EDGES: {snapshot.edge_count}")
+            for name, entry in snapshot.header["columns"].items():
+                print(f"  {name:36} {entry['codec']:5} {entry['length']:>10,} / {entry['raw_length']:>10,} bytes")
@@ -0,0 +1,234 @@
+"""
+TOPOLOGY GRAPH INDEX
+Interned, CSR-packed adjacency and strongly connected components
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from topology.graph_loader import TopologyGraph, Node, Edge, EdgeClass
+
+
+class GraphIndex:
+    """
+    Read-only integer index over a TopologyGraph
+    Node ids are interned to 0..n-1; adjacency is stored in CSR form
+    (offsets + flat target list) so traversals never scan the edge map
+    """
+
+    def __init__(self, nodes: List[Node], edges: List[Edge]):
+        self.nodes = nodes
+        self.node_ids = [node.node_id for node in nodes]
+        self.position: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        n = len(nodes)
+        position = self.position
+        sources = [position[edge.source] for edge in edges]
+        targets = [position[edge.target] for edge in edges]
+
+        # Outgoing adjacency
+        self.out_offsets, order = _csr_offsets(n, sources)
+        self.out_targets = [targets[k] for k in order]
+        self.out_edges = [edges[k] for k in order]
+
+        # Incoming adjacency
+        self.in_offsets, order = _csr_offsets(n, targets)
+        self.in_sources = [sources[k] for k in order]
+        self.in_edges = [edges[k] for k in order]
+
+    @classmethod
+    def from_graph(cls, graph: TopologyGraph,
+                   edge_classes: Optional[Set[EdgeClass]] = None) -> "GraphIndex":
+        """Build index over graph, optionally restricted to given edge classes"""
+        edges = list(graph.edges.values())
+        if edge_classes is not None:
+            edges = [e for e in edges if e.edge_class in edge_classes]
+        return cls(list(graph.nodes.values()), edges)
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def successors(self, i: int) -> List[int]:
+        """Interned targets of outgoing edges from node i"""
+        return self.out_targets[self.out_offsets[i]:self.out_offsets[i + 1]]
+
+    def predecessors(self, i: int) -> List[int]:
+        """Interned sources of incoming edges to node i"""
+        return self.in_sources[self.in_offsets[i]:self.in_offsets[i + 1]]
+
+    def edges_from(self, i: int) -> List[Edge]:
+        """Outgoing edges from node i"""
+        return self.out_edges[self.out_offsets[i]:self.out_offsets[i + 1]]
+
+
+def _csr_offsets(n: int, keys: List[int]) -> Tuple[List[int], List[int]]:
+    """Counting sort of edge positions by key; returns (offsets, permutation)"""
+    offsets = [0] * (n + 1)
+    for k in keys:
+        offsets[k + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    cursor = offsets[:-1]
+    order = [0] * len(keys)
+    for pos, k in enumerate(keys):
+        order[cursor[k]] = pos
+        cursor[k] += 1
+    return offsets, order
+
+
+# STRONGLY CONNECTED COMPONENTS
+
+def strongly_connected_components(index: GraphIndex) -> Tuple[List[int], List[List[int]]]:
+    """
+    Iterative Tarjan SCC over the index, O(V+E), no recursion
+    Returns (component_of, components); components are emitted in
+    reverse topological order of the condensed DAG (sinks first)
+    """
+    n = len(index)
+    offsets = index.out_offsets
+    targets = index.out_targets
+
+    order = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    component_of = [-1] * n
+    components: List[List[int]] = []
+    stack: List[int] = []
+    counter = 0
+
+    for start in range(n):
+        if order[start] != -1:
+            continue
+
+        order[start] = low[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack[start] = True
+        work_node = [start]
+        work_pos = [offsets[start]]
+
+        while work_node:
+            v = work_node[-1]
+            pos = work_pos[-1]
+
+            if pos < offsets[v + 1]:
+                work_pos[-1] = pos + 1
+                w = targets[pos]
+                if order[w] == -1:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work_node.append(w)
+                    work_pos.append(offsets[w])
+                elif on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+                continue
+
+            # All successors of v explored
+            work_node.pop()
+            work_pos.pop()
+            if work_node:
+                u = work_node[-1]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+
+            if low[v] == order[v]:
+                comp_id = len(components)
+                members = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component_of[w] = comp_id
+                    members.append(w)
+                    if w == v:
+                        break
+                components.append(members)
+
+    return component_of, components
+
+
+# FORBIDDEN_001: AUTHORITY ESCALATION CYCLES
+
+@dataclass(frozen=True)
+class EscalationCycle:
+    """Strongly connected component whose authority levels are not uniform"""
+    members: Tuple[str, ...]
+    witness: Tuple[str, ...]
+
+    def describe(self, nodes: Dict[str, Node]) -> str:
+        """Render witness path as 'a (AUTH) -> b (AUTH) -> ... -> a (AUTH)'"""
+        return " -> ".join(
+            f"{node_id} ({nodes[node_id].authority.name})" for node_id in self.witness
+        )
+
+
+def authority_escalation_cycles(index: GraphIndex,
+                                scc: Optional[Tuple[List[int], List[List[int]]]] = None
+                                ) -> List[EscalationCycle]:
+    """
+    Report every cycle along which authority increases
+    Any cycle through nodes of differing authority must contain an edge
+    into higher authority, so a component escalates iff its authority
+    levels are not uniform. Witness: escalating edge u -> v closed by a
+    shortest in-component path v -> ... -> u.
+    """
+    component_of, components = scc if scc is not None else strongly_connected_components(index)
+    authority = [node.authority.value for node in index.nodes]
+
+    # Single pass: min/max authority per component
+    comp_min = [5] * len(components)
+    comp_max = [0] * len(components)
+    for i, c in enumerate(component_of):
+        level = authority[i]
+        if level < comp_min[c]:
+            comp_min[c] = level
+        if level > comp_max[c]:
+            comp_max[c] = level
+
+    cycles = []
+    for c, members in enumerate(components):
+        if comp_min[c] == comp_max[c]:
+            continue
+        witness = _escalation_witness(index, component_of, authority, c, members)
+        cycles.append(EscalationCycle(
+            members=tuple(sorted(index.node_ids[i] for i in members)),
+            witness=tuple(index.node_ids[i] for i in witness),
+        ))
+
+    return cycles
+
+
+def _escalation_witness(index: GraphIndex, component_of: List[int], authority: List[int],
+                        comp: int, members: Iterable[int]) -> List[int]:
+    """Closed walk u -> v -> ... -> u inside component with authority[v] > authority[u]"""
+    for u in members:
+        for v in index.successors(u):
+            if component_of[v] == comp and authority[v] > authority[u]:
+                path = _path_within_component(index, component_of, comp, v, u)
+                return [u] + path
+    raise AssertionError("non-uniform component without escalating edge")
+
+
+def _path_within_component(index: GraphIndex, component_of: List[int], comp: int,
+                           source: int, target: int) -> List[int]:
+    """Shortest path source -> target using only nodes of the component"""
+    parent = {source: source}
+    frontier = [source]
+    while frontier and target not in parent:
+        next_frontier = []
+        for v in frontier:
+            for w in index.successors(v):
+                if w not in parent and component_of[w] == comp:
+                    parent[w] = v
+                    next_frontier.append(w)
+        frontier = next_frontier
+
+    path = [target]
+    while path[-1] != source:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
@@ -69,6 +69,47 @@ class Directionality(Enum):
 
 # Graph structures
 
+class _VersionedDict(dict):
+    """dict that counts its mutations, so caches over it can tell when it changed"""
+    version = 0
+    
+    def _bump(self):
+        self.version += 1
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._bump()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._bump()
+    
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._bump()
+        return result
+    
+    def pop(self, *args):
+        self._bump()
+        return super().pop(*args)
+    
+    def popitem(self):
+        self._bump()
+        return super().popitem()
+    
+    def setdefault(self, key, default=None):
+        self._bump()
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._bump()
+    
+    def clear(self):
+        super().clear()
+        self._bump()
+
+
 @dataclass(frozen=True)
 class Node:
     """Immutable node in topology graph"""
@@ -97,9 +138,13 @@ class TopologyGraph:
     edges: Dict[str, Edge] = field(default_factory=dict)
     covenant_root_id: Optional[str] = None
     zones: Dict[str, Set[str]] = field(default_factory=dict)
+    # edge class filter -> (nodes dict, nodes version, edges dict, edges version, ReachabilityIndex)
+    _reachability: Dict = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate graph after loading"""
+        self.nodes = _VersionedDict(self.nodes)
+        self.edges = _VersionedDict(self.edges)
         self._validate()
     
     def _validate(self):
@@ -139,6 +184,47 @@ class TopologyGraph:
         if not self.covenant_root_id:
             raise ValueError("GRAPH_INVALID: No covenant root set")
         return self.get_node(self.covenant_root_id)
+    
+    # Reachability queries (precomputed transitive closure, built on first use)
+    
+    def reachability(self, edge_classes: Optional[Set[EdgeClass]] = None):
+        """
+        ReachabilityIndex over this graph, optionally along given edge classes only
+        Cached per edge class filter; rebuilt after any change to nodes or edges,
+        including replacing the dicts themselves
+        """
+        from topology.reachability import ReachabilityIndex
+        
+        if not isinstance(self.nodes, _VersionedDict):
+            self.nodes = _VersionedDict(self.nodes)
+        if not isinstance(self.edges, _VersionedDict):
+            self.edges = _VersionedDict(self.edges)
+        key = frozenset(edge_classes) if edge_classes is not None else None
+        cached = self._reachability.get(key)
+        if (cached is None or cached[0] is not self.nodes or cached[1] != self.nodes.version
+                or cached[2] is not self.edges or cached[3] != self.edges.version):
+            cached = (self.nodes, self.nodes.version, self.edges, self.edges.version,
+                      ReachabilityIndex(self, edge_classes))
+            self._reachability[key] = cached
+        return cached[4]
+    
+    def can_reach(self, source: str, target: str,
+                  edge_classes: Optional[Set[EdgeClass]] = None) -> bool:
+        """True iff a non-empty path leads from source to target"""
+        return self.reachability(edge_classes).reaches(source, target)
+    
+    def descendants(self, node_id: str, edge_classes: Optional[Set[EdgeClass]] = None) -> List[str]:
+        """Everything downstream of node_id"""
+        return self.reachability(edge_classes).descendants(node_id)
+    
+    def ancestors(self, node_id: str, edge_classes: Optional[Set[EdgeClass]] = None) -> List[str]:
+        """Every node that can reach node_id"""
+        return self.reachability(edge_classes).ancestors(node_id)
+    
+    def shortest_path(self, source: str, target: str,
+                      edge_classes: Optional[Set[EdgeClass]] = None) -> Optional[List[str]]:
+        """Witness path source -> target as node ids, or None if unreachable"""
+        return self.reachability(edge_classes).path(source, target)
 
 
 class GraphLoader:
@@ -149,26 +235,29 @@ class GraphLoader:
     
     def load(self) -> TopologyGraph:
         """Load complete topology graph"""
-        graph = TopologyGraph()
+        nodes: Dict[str, Node] = {}
+        edges: Dict[str, Edge] = {}
+        zones: Dict[str, Set[str]] = {}
         
         # Load nodes
-        self._load_nodes(graph)
+        self._load_nodes(nodes)
         
         # Load edges
-        self._load_edges(graph)
+        self._load_edges(nodes, edges)
         
         # Load zones
-        self._load_zones(graph)
+        self._load_zones(nodes, zones)
         
-        return graph
+        # Graph validates itself on construction
+        return TopologyGraph(nodes=nodes, edges=edges, zones=zones)
     
-    def _load_nodes(self, graph: TopologyGraph):
+    def _load_nodes(self, nodes: Dict[str, Node]):
         """Load all nodes from repository structure"""
         
         # Covenant root
         covenant_path = self.repo_root / "covenant.yaml"
         if covenant_path.exists():
-            graph.nodes["covenant.yaml"] = Node(
+            nodes["covenant.yaml"] = Node(
                 node_id="covenant.yaml",
                 node_class=NodeClass.COVENANT_ROOT,
                 authority=Authority.EXTERNAL_ONLY,
@@ -182,7 +271,7 @@ class GraphLoader:
         if src_dir.exists():
             principles_path = src_dir / "principles.py"
             if principles_path.exists():
-                graph.nodes["src/principles.py"] = Node(
+                nodes["src/principles.py"] = Node(
                     node_id="src/principles.py",
                     node_class=NodeClass.PRINCIPLE_MODULE,
                     authority=Authority.VALIDATED,
@@ -196,7 +285,7 @@ class GraphLoader:
             # Operational modes
             modes_path = src_dir / "operational_modes.py"
             if modes_path.exists():
-                graph.nodes["src/operational_modes.py"] = Node(
+                nodes["src/operational_modes.py"] = Node(
                     node_id="src/operational_modes.py",
                     node_class=NodeClass.OPERATIONAL_MODE_ENFORCER,
                     authority=Authority.VALIDATED,
@@ -208,7 +297,7 @@ class GraphLoader:
             # Infrastructure
             infra_path = src_dir / "infrastructure.py"
             if infra_path.exists():
-                graph.nodes["src/infrastructure.py"] = Node(
+                nodes["src/infrastructure.py"] = Node(
                     node_id="src/infrastructure.py",
                     node_class=NodeClass.INFRASTRUCTURE_REGISTRY,
                     authority=Authority.VALIDATED,
@@ -217,13 +306,13 @@ class GraphLoader:
                     temporal=Temporal.FOUNDATION
                 )
     
-    def _load_edges(self, graph: TopologyGraph):
+    def _load_edges(self, nodes: Dict[str, Node], edges: Dict[str, Edge]):
         """Load all edges from repository structure"""
         
         # Covenant bindings
-        if "covenant.yaml" in graph.nodes and "src/principles.py" in graph.nodes:
+        if "covenant.yaml" in nodes and "src/principles.py" in nodes:
             edge_id = "covenant.yaml::src/principles.py::COVENANT_BINDING"
-            graph.edges[edge_id] = Edge(
+            edges[edge_id] = Edge(
                 edge_id=edge_id,
                 source="covenant.yaml",
                 target="src/principles.py",
@@ -236,14 +325,18 @@ class GraphLoader:
         # This would be populated by analyzing import statements
         # For now, minimal example
         
-    def _load_zones(self, graph: TopologyGraph):
-        """Load zone definitions"""
-        graph.zones["zone_1_immutable"] = {"covenant.yaml"}
-        graph.zones["zone_2_foundation"] = {
-            "src/principles.py",
-            "src/operational_modes.py", 
-            "src/infrastructure.py"
-        }
+    def _load_zones(self, nodes: Dict[str, Node], zones: Dict[str, Set[str]]):
+        """Assign every node to the zone owning its TEMPORAL_ORDERING stage (topology/zones.yaml)"""
+        from topology.spec import load_spec
+        
+        # Repositories without their own topology spec use the bundled one
+        topology_dir = self.repo_root / "topology"
+        if not (topology_dir / "zones.yaml").exists():
+            topology_dir = Path(__file__).resolve().parent
+        zone_by_temporal = load_spec(topology_dir).zone_by_temporal
+        
+        for node_id, node in nodes.items():
+            zones.setdefault(zone_by_temporal[node.temporal], set()).add(node_id)
 
 
 def load_topology_graph(repo_root: str) -> TopologyGraph:
@@ -0,0 +1,162 @@
+"""
+PATH-ACCUMULATING INVARIANT ENGINE
+Bitmask dataflow over the SCC-condensed DAG
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from topology.graph_loader import TopologyGraph, ConstraintLayer, EdgeClass
+from topology.graph_index import GraphIndex, strongly_connected_components
+
+# Bit encodings
+
+CONSTRAINT_BITS: Dict[ConstraintLayer, int] = {
+    ConstraintLayer.LOGOS: 1 << 0,
+    ConstraintLayer.CHALCEDON: 1 << 1,
+    ConstraintLayer.GRACE: 1 << 2,
+    ConstraintLayer.KENOSIS: 1 << 3,
+    ConstraintLayer.AGAPE: 1 << 4,
+}
+PRINCIPLE_LAYERS = list(CONSTRAINT_BITS)
+ALL_CONSTRAINTS = sum(CONSTRAINT_BITS.values())
+CONSTRAINT_BITS[ConstraintLayer.COMPOSITE] = ALL_CONSTRAINTS
+CONSTRAINT_BITS[ConstraintLayer.NONE] = 0
+
+MODE_FORENSIC = 1 << 0
+MODE_POPPERIAN = 1 << 1
+MODE_OTHER = 1 << 2
+ALL_MODES = MODE_FORENSIC | MODE_POPPERIAN | MODE_OTHER
+
+# OPERATIONAL_MODE_BINDING value -> modes permitted to access the node
+MODE_PERMITS: Dict[str, int] = {
+    "FORENSIC_ONLY": MODE_FORENSIC,
+    "POPPERIAN_ONLY": MODE_POPPERIAN,
+    "FORENSIC_AND_POPPERIAN": MODE_FORENSIC | MODE_POPPERIAN,
+    "ANY": ALL_MODES,
+}
+MODE_NAMES = {MODE_FORENSIC: "FORENSIC", MODE_POPPERIAN: "POPPERIAN", MODE_OTHER: "OTHER"}
+
+# Edge classes along which each property propagates
+CONSTRAINT_EDGE_CLASSES = {EdgeClass.COVENANT_BINDING, EdgeClass.DEPENDENCY_IMPORT}
+MODE_EDGE_CLASSES = {EdgeClass.DEPENDENCY_IMPORT, EdgeClass.MODE_RESTRICTION}
+
+
+def constraint_mask(layers: Iterable[ConstraintLayer]) -> int:
+    """Constraint layer set -> bitmask (COMPOSITE expands to all principles)"""
+    mask = 0
+    for layer in layers:
+        mask |= CONSTRAINT_BITS[layer]
+    return mask
+
+
+def constraint_names(mask: int) -> List[str]:
+    """Bitmask -> principle layer names"""
+    return [layer.value for layer in PRINCIPLE_LAYERS if mask & CONSTRAINT_BITS[layer]]
+
+
+def mode_restriction_mask(binding: Optional[Set[str]]) -> int:
+    """OPERATIONAL_MODE_BINDING -> bitmask of modes the node denies (unbound = none)"""
+    if not binding:
+        return 0
+    permitted = 0
+    for value in binding:
+        permitted |= MODE_PERMITS[value]
+    return ALL_MODES & ~permitted
+
+
+def mode_names(mask: int) -> List[str]:
+    """Bitmask -> mode names"""
+    return [name for bit, name in MODE_NAMES.items() if mask & bit]
+
+
+# Dataflow engine
+
+@dataclass(frozen=True)
+class AccumulationViolation:
+    """Node whose own mask drops bits accumulated along an incoming path"""
+    node_id: str
+    missing: int
+    via: Optional[str]
+
+
+class PathAccumulator:
+    """
+    Accumulated bitmask per node: OR of the own masks of every node with
+    a path to it (including itself). Computed once in topological order
+    over the condensed DAG, O(V+E); a property that may only grow along
+    paths holds at a node iff accumulated & ~own == 0.
+    """
+
+    def __init__(self, index: GraphIndex, own: List[int],
+                 scc: Optional[Tuple[List[int], List[List[int]]]] = None):
+        self.index = index
+        self.own = own
+        component_of, components = scc if scc is not None else strongly_connected_components(index)
+        self.component_of = component_of
+
+        offsets = index.out_offsets
+        targets = index.out_targets
+        inherited = [0] * len(components)
+        comp_mask = [0] * len(components)
+
+        # Tarjan emits sinks first: walk components backwards for topological order
+        for c in range(len(components) - 1, -1, -1):
+            members = components[c]
+            mask = inherited[c]
+            for i in members:
+                mask |= own[i]
+            comp_mask[c] = mask
+            for i in members:
+                for k in range(offsets[i], offsets[i + 1]):
+                    d = component_of[targets[k]]
+                    if d != c:
+                        inherited[d] |= mask
+
+        self.comp_mask = comp_mask
+
+    def accumulated(self, node_id: str) -> int:
+        """Memoized accumulated mask for node"""
+        return self.comp_mask[self.component_of[self.index.position[node_id]]]
+
+    def violations(self) -> List[AccumulationViolation]:
+        """All nodes missing accumulated bits, each with one offending predecessor"""
+        index = self.index
+        own = self.own
+        component_of = self.component_of
+        comp_mask = self.comp_mask
+
+        found = []
+        for i, c in enumerate(component_of):
+            missing = comp_mask[c] & ~own[i]
+            if not missing:
+                continue
+            via = None
+            for p in index.predecessors(i):
+                if comp_mask[component_of[p]] & missing:
+                    via = index.node_ids[p]
+                    break
+            found.append(AccumulationViolation(index.node_ids[i], missing, via))
+        return found
+
+
+def constraint_accumulator(graph: TopologyGraph, index: Optional[GraphIndex] = None) -> PathAccumulator:
+    """
+    INVARIANT_005 dataflow over COVENANT_BINDING / DEPENDENCY_IMPORT edges
+    index: prebuilt index over those edges (e.g. one zone's inflow) instead of the whole graph
+    """
+    if index is None:
+        index = GraphIndex.from_graph(graph, CONSTRAINT_EDGE_CLASSES)
+    return PathAccumulator(index, [constraint_mask(n.constraint_layer) for n in index.nodes])
+
+
+def mode_accumulator(graph: TopologyGraph, index: Optional[GraphIndex] = None) -> PathAccumulator:
+    """
+    INVARIANT_003 dataflow over DEPENDENCY_IMPORT / MODE_RESTRICTION edges
+    index: prebuilt index over those edges (e.g. one zone's inflow) instead of the whole graph
+    """
+    if index is None:
+        index = GraphIndex.from_graph(graph, MODE_EDGE_CLASSES)
+    return PathAccumulator(index, [mode_restriction_mask(n.operational_mode_binding) for n in index.nodes])
@@ -0,0 +1,204 @@
+"""
+TOPOLOGY REACHABILITY INDEX
+Transitive closure over the SCC-condensed DAG with witness paths
+Authority: IMMUTABLE
+Generated: 2026-02-07
+
+Every component stores the bitset of components it reaches, built in one
+pass over Tarjan's sinks-first order. Reachability is a single byte
+lookup; descendant / ancestor sets are bitset scans; witness paths are
+BFS pruned to nodes that can still reach the target, so they never
+explore dead branches. Memory is O(C^2 / 16) bytes for C components.
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from topology.graph_loader import TopologyGraph, Edge, EdgeClass
+from topology.graph_index import GraphIndex, strongly_connected_components
+
+
+def _bit_positions(bits: bytes) -> List[int]:
+    """Set bit positions of a little-endian bitset"""
+    positions = []
+    for byte_pos, byte in enumerate(bits):
+        while byte:
+            low = byte & -byte
+            positions.append(byte_pos * 8 + low.bit_length() - 1)
+            byte ^= low
+    return positions
+
+
+class ReachabilityIndex:
+    """Reachability queries over a TopologyGraph, optionally restricted to edge classes"""
+
+    def __init__(self, graph: TopologyGraph, edge_classes: Optional[Set[EdgeClass]] = None):
+        self.graph = graph
+        self.edge_classes: Optional[FrozenSet[EdgeClass]] = (
+            frozenset(edge_classes) if edge_classes is not None else None)
+        self.index = GraphIndex.from_graph(graph, edge_classes)
+        self.component_of, self.components = strongly_connected_components(self.index)
+
+        # Components come sinks first, so every successor component is
+        # finished before its predecessors; bit c of closure[c] is set
+        # only when c lies on a cycle (c reaches itself)
+        index = self.index
+        component_of = self.component_of
+        closure: List[int] = []
+        for c, members in enumerate(self.components):
+            mask = 0
+            cyclic = len(members) > 1
+            for v in members:
+                for w in index.successors(v):
+                    d = component_of[w]
+                    if d == c:
+                        cyclic = True
+                    else:
+                        mask |= closure[d] | (1 << d)
+            if cyclic:
+                mask |= 1 << c
+            closure.append(mask)
+
+        # Descendant components always have lower ids, so c // 8 + 1 bytes suffice
+        self._descendants = [mask.to_bytes(c // 8 + 1, 'little') for c, mask in enumerate(closure)]
+        self._ancestors: Optional[List[bytes]] = None
+
+    def _component(self, node_id: str) -> int:
+        position = self.index.position.get(node_id)
+        if position is None:
+            raise KeyError(f"NODE_NOT_FOUND: {node_id}")
+        return self.component_of[position]
+
+    def _expand(self, components: List[int]) -> List[str]:
+        node_ids = self.index.node_ids
+        return sorted(node_ids[v] for c in components for v in self.components[c])
+
+    # Queries
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True iff a non-empty path leads from source to target"""
+        c = self._component(source)
+        d = self._component(target)
+        bits = self._descendants[c]
+        return d // 8 < len(bits) and bool(bits[d // 8] >> (d % 8) & 1)
+
+    def descendants(self, node_id: str) -> List[str]:
+        """Nodes reachable from node_id (node_id itself only if on a cycle)"""
+        return self._expand(_bit_positions(self._descendants[self._component(node_id)]))
+
+    def ancestors(self, node_id: str) -> List[str]:
+        """Nodes that can reach node_id (node_id itself only if on a cycle)"""
+        if self._ancestors is None:
+            self._build_ancestors()
+        return self._expand(_bit_positions(self._ancestors[self._component(node_id)]))
+
+    def _build_ancestors(self):
+        """Closure over the reversed condensed DAG, built on first ancestor query"""
+        index = self.index
+        component_of = self.component_of
+        count = len(self.components)
+        ancestors = [0] * count
+        # Sources first: every predecessor component is finished before c
+        for c in range(count - 1, -1, -1):
+            mask = 0
+            cyclic = len(self.components[c]) > 1
+            for v in self.components[c]:
+                for w in index.predecessors(v):
+                    d = component_of[w]
+                    if d == c:
+                        cyclic = True
+                    else:
+                        mask |= ancestors[d] | (1 << d)
+            if cyclic:
+                mask |= 1 << c
+            ancestors[c] = mask
+        self._ancestors = [mask.to_bytes(mask.bit_length() // 8 + 1, 'little') for mask in ancestors]
+
+    def unreachable_from(self, source: str) -> List[str]:
+        """Nodes other than source with no path from source"""
+        c = self._component(source)
+        bits = self._descendants[c]
+        reached = set(_bit_positions(bits))
+        reached.add(c)
+        return self._expand([d for d in range(len(self.components)) if d not in reached])
+
+    def path_edges(self, source: str, target: str) -> Optional[List[Edge]]:
+        """
+        Witness: a shortest path source -> target as its edges
+        [] when source == target; None when target is unreachable
+        """
+        if source == target:
+            self._component(source)
+            return []
+        if not self.reaches(source, target):
+            return None
+
+        index = self.index
+        position = index.position
+        goal = position[target]
+        goal_component = self.component_of[goal]
+        descendants = self._descendants
+        component_of = self.component_of
+
+        def useful(w: int) -> bool:
+            d = component_of[w]
+            if d == goal_component:
+                return True
+            bits = descendants[d]
+            return goal_component // 8 < len(bits) and bool(
+                bits[goal_component // 8] >> (goal_component % 8) & 1)
+
+        start = position[source]
+        parent: Dict[int, Optional[Edge]] = {start: None}
+        queue = deque([start])
+        while queue:
+            v = queue.popleft()
+            for edge in index.edges_from(v):
+                w = position[edge.target]
+                if w in parent or not useful(w):
+                    continue
+                parent[w] = edge
+                if w == goal:
+                    path = []
+                    while parent[w] is not None:
+                        path.append(parent[w])
+                        w = position[parent[w].source]
+                    path.reverse()
+                    return path
+                queue.append(w)
+        raise AssertionError("closure reports reachable but no path found")
+
+    def path(self, source: str, target: str) -> Optional[List[str]]:
+        """Witness: node ids along a shortest path source -> target, or None"""
+        edges = self.path_edges(source, target)
+        if edges is None:
+            return None
+        return [source] + [edge.target for edge in edges]
+
+
+if __name__ == '__main__':
+    import argparse
+    from topology.graph_loader import load_topology_graph
+
+    parser = argparse.ArgumentParser(description="Reachability queries over the canonical graph")
+    parser.add_argument("query", choices=["reaches", "path", "descendants", "ancestors"])
+    parser.add_argument("node")
+    parser.add_argument("target", nargs="?")
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--edge-class", action="append", choices=[e.value for e in EdgeClass])
+    args = parser.parse_args()
+
+    graph = load_topology_graph(args.root)
+    edge_classes = {EdgeClass(e) for e in args.edge_class} if args.edge_class else None
+    reach = graph.reachability(edge_classes)
+    if args.query in ("reaches", "path") and not args.target:
+        parser.error(f"{args.query} needs a target")
+
+    if args.query == "reaches":
+        print("YES" if reach.reaches(args.node, args.target) else "NO")
+    elif args.query == "path":
+        path = reach.path(args.node, args.target)
+        print(" -> ".join(path) if path is not None else "NO PATH")
+    else:
+        for node_id in getattr(reach, args.query)(args.node):
+            print(node_id)
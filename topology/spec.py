@@ -0,0 +1,369 @@
+"""
+COMPILED TOPOLOGY SPECIFICATION
+Parse topology/*.yaml once, validate against graph_schema.yaml,
+freeze into lookup tables, cache on disk keyed by file hashes
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+import instrumentation
+from topology.graph_loader import NodeClass, EdgeClass, Directionality, Temporal
+
+SPEC_FILES = (
+    "axes.yaml",
+    "node_classes.yaml",
+    "edge_classes.yaml",
+    "invariants.yaml",
+    "forbidden.yaml",
+    "graph_schema.yaml",
+    "zones.yaml",
+)
+
+# Bump when compiled layout changes so stale caches are ignored
+SPEC_CACHE_VERSION = 3
+
+# Node attribute in graph_schema.yaml carrying each axis' values
+_AXIS_ATTRIBUTES = {
+    "AUTHORITY": "authority",
+    "CONSTRAINT_LAYER": "constraint_layer",
+    "VERIFICATION_REQUIREMENT": "verification",
+    "TEMPORAL_ORDERING": "temporal",
+    "OPERATIONAL_MODE_BINDING": "operational_mode_binding",
+}
+
+# edge_classes.yaml cannot_carry entries that name an axis; the rest
+# (interpretation, execution_logic, ...) are not structurally visible
+_CARRY_AXES = {
+    "authority": "AUTHORITY",
+    "constraints": "CONSTRAINT_LAYER",
+    "modes": "OPERATIONAL_MODE_BINDING",
+    "verification_requirements": "VERIFICATION_REQUIREMENT",
+}
+
+
+@dataclass(frozen=True)
+class NodeClassSpec:
+    """Compiled NODE_CLASS definition"""
+    name: NodeClass
+    class_id: str
+    allowed_axes: FrozenSet[str]
+    prohibited_axes: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class EdgeClassSpec:
+    """Compiled EDGE_CLASS definition; None endpoint class = any node"""
+    name: EdgeClass
+    class_id: str
+    directionality: Directionality
+    source_class: Optional[NodeClass]
+    target_class: Optional[NodeClass]
+    allowed_pairs: FrozenSet[Tuple[Optional[NodeClass], Optional[NodeClass]]]
+    axis_binding: FrozenSet[str]
+    permits: Tuple[str, ...]
+    cannot_carry: Tuple[str, ...]
+    forbidden_axes: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class ZoneSpec:
+    """Compiled zone: the TEMPORAL_ORDERING stages it contains"""
+    key: str
+    zone_id: str
+    order: int
+    temporal: FrozenSet[Temporal]
+    change_policy: str
+    overlay: bool
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    """Frozen lookup tables compiled from topology/*.yaml"""
+    digest: str
+    raw: Mapping[str, dict]
+    axes: Mapping[str, Tuple[str, ...]]
+    node_classes: Mapping[NodeClass, NodeClassSpec]
+    edge_classes: Mapping[EdgeClass, EdgeClassSpec]
+    invariants_by_check: Mapping[str, str]
+    forbidden_by_name: Mapping[str, str]
+    zones: Mapping[str, ZoneSpec]
+    zone_by_temporal: Mapping[Temporal, str]
+
+    # Mapping proxies are not picklable: store plain dicts, re-freeze on load
+    def __getstate__(self):
+        return {f.name: dict(v) if isinstance(v := getattr(self, f.name), MappingProxyType) else v
+                for f in fields(self)}
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            object.__setattr__(self, key, MappingProxyType(value) if isinstance(value, dict) else value)
+
+
+def spec_digest(topology_dir: Path) -> Tuple[str, Dict[str, bytes]]:
+    """SHA-256 over spec file names and bytes (missing files hash as absent)"""
+    sha256 = hashlib.sha256(f"spec-v{SPEC_CACHE_VERSION}".encode())
+    contents = {}
+    for filename in SPEC_FILES:
+        path = topology_dir / filename
+        data = path.read_bytes() if path.exists() else None
+        contents[filename] = data
+        sha256.update(filename.encode() + b"\0")
+        sha256.update(b"-" if data is None else hashlib.sha256(data).digest())
+    return sha256.hexdigest(), contents
+
+
+# In-process memo: stat signature -> compiled spec
+_memo: Dict[Tuple, CompiledSpec] = {}
+
+
+def load_spec(topology_dir: Path, cache_dir: Optional[Path] = None, use_cache: bool = True) -> CompiledSpec:
+    """
+    Compiled spec for topology_dir
+    Lookup order: in-process memo (by file stat), on-disk pickle (by
+    content hash, default topology/__pycache__), then parse + compile
+    """
+    topology_dir = Path(topology_dir).resolve()
+    signature = (str(topology_dir),) + tuple(_stat_signature(topology_dir / f) for f in SPEC_FILES)
+    if use_cache and signature in _memo:
+        instrumentation.count("spec_cache.memo_hit")
+        return _memo[signature]
+
+    digest, contents = spec_digest(topology_dir)
+    cache_path = Path(cache_dir or topology_dir / "__pycache__") / f"spec-{digest[:32]}.pickle"
+
+    spec = _read_cache(cache_path, digest) if use_cache else None
+    if spec is None:
+        instrumentation.count("spec_cache.miss")
+        spec = compile_spec(contents, digest)
+        if use_cache:
+            _write_cache(cache_path, spec)
+    else:
+        instrumentation.count("spec_cache.disk_hit")
+
+    if use_cache:
+        _memo[signature] = spec
+    return spec
+
+
+def _stat_signature(path: Path) -> Tuple:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (None,)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_cache(cache_path: Path, digest: str) -> Optional[CompiledSpec]:
+    try:
+        with open(cache_path, 'rb') as f:
+            spec = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(spec, CompiledSpec) or spec.digest != digest:
+        return None
+    return spec
+
+
+def _write_cache(cache_path: Path, spec: CompiledSpec):
+    """Atomic best-effort write; an unwritable cache dir only costs speed"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+
+# Compilation
+
+def compile_spec(contents: Dict[str, Optional[bytes]], digest: str = "") -> CompiledSpec:
+    """Parse, validate against graph_schema.yaml and freeze"""
+    import yaml
+
+    raw = {}
+    for filename, data in contents.items():
+        raw[filename[:-len(".yaml")]] = (yaml.safe_load(data) or {}) if data is not None else {}
+
+    errors: List[str] = []
+    schema = raw.get("graph_schema", {}).get("graph_structure", {})
+    node_attrs = schema.get("nodes", {}).get("schema", {}).get("attributes", {})
+    edge_attrs = schema.get("edges", {}).get("schema", {}).get("attributes", {})
+    schema_axes = set(schema.get("axes", {}).get("schema", {}))
+    schema_node_classes = set(node_attrs.get("node_class", {}).get("values", []))
+    schema_edge_classes = set(edge_attrs.get("edge_class", {}).get("values", []))
+    schema_directionality = set(edge_attrs.get("directionality", {}).get("values", []))
+    schema_axis_binding = set(edge_attrs.get("axis_binding", {}).get("values", []))
+
+    axes = _compile_axes(raw.get("axes", {}), schema_axes, node_attrs, errors)
+    node_classes = _compile_node_classes(raw.get("node_classes", {}), schema_node_classes, set(axes), errors)
+    edge_classes = _compile_edge_classes(raw.get("edge_classes", {}), schema_edge_classes,
+                                         schema_directionality, schema_axis_binding, errors)
+
+    invariants_by_check = {}
+    for key, inv in raw.get("invariants", {}).get("invariants", {}).items():
+        missing = [k for k in ("id", "name", "check") if k not in inv]
+        if missing:
+            errors.append(f"invariants.yaml: {key} missing {missing}")
+        else:
+            invariants_by_check[inv["check"]] = inv["id"]
+
+    forbidden_by_name = {}
+    for key, pattern in raw.get("forbidden", {}).get("forbidden_topologies", {}).items():
+        missing = [k for k in ("id", "name", "detection") if k not in pattern]
+        if missing:
+            errors.append(f"forbidden.yaml: {key} missing {missing}")
+        else:
+            forbidden_by_name[pattern["name"]] = pattern["id"]
+
+    zones = _compile_zones(raw.get("zones", {}), axes.get("TEMPORAL_ORDERING", ()), errors)
+
+    if errors:
+        raise ValueError("SPEC_INVALID: " + "; ".join(errors))
+
+    return CompiledSpec(
+        digest=digest,
+        raw=MappingProxyType(raw),
+        axes=MappingProxyType(axes),
+        node_classes=MappingProxyType(node_classes),
+        edge_classes=MappingProxyType(edge_classes),
+        invariants_by_check=MappingProxyType(invariants_by_check),
+        forbidden_by_name=MappingProxyType(forbidden_by_name),
+        zones=MappingProxyType(zones),
+        zone_by_temporal=MappingProxyType(
+            {stage: zone.key for zone in zones.values() for stage in zone.temporal}),
+    )
+
+
+def _compile_axes(doc: dict, schema_axes: set, node_attrs: dict, errors: List[str]) -> Dict[str, Tuple[str, ...]]:
+    axes = {}
+    for key, axis in doc.get("axes", {}).items():
+        name = axis.get("name")
+        if schema_axes and name not in schema_axes:
+            errors.append(f"axes.yaml: {key} axis {name!r} not in graph_schema")
+            continue
+        values = tuple(axis.get("values", []))
+        attribute = _AXIS_ATTRIBUTES.get(name)
+        if attribute and attribute in node_attrs:
+            schema_values = set(node_attrs[attribute].get("values", []))
+            if set(values) != schema_values:
+                errors.append(f"axes.yaml: {name} values {sorted(values)} != graph_schema {sorted(schema_values)}")
+        axes[name] = values
+    return axes
+
+
+def _compile_node_classes(doc: dict, schema_classes: set, axis_names: set,
+                          errors: List[str]) -> Dict[NodeClass, NodeClassSpec]:
+    compiled = {}
+    for key, class_def in doc.get("node_classes", {}).items():
+        name = class_def.get("name")
+        if name not in schema_classes or name not in NodeClass.__members__:
+            errors.append(f"node_classes.yaml: {key} class {name!r} not in graph_schema")
+            continue
+        allowed = frozenset(class_def.get("allowed_axes", []))
+        prohibited = frozenset(class_def.get("prohibited_axes", []))
+        unknown = (allowed | prohibited) - axis_names
+        if unknown:
+            errors.append(f"node_classes.yaml: {name} references unknown axes {sorted(unknown)}")
+        if allowed & prohibited:
+            errors.append(f"node_classes.yaml: {name} both allows and prohibits {sorted(allowed & prohibited)}")
+        compiled[NodeClass(name)] = NodeClassSpec(
+            name=NodeClass(name),
+            class_id=class_def.get("id", ""),
+            allowed_axes=allowed,
+            prohibited_axes=prohibited,
+        )
+    return compiled
+
+
+def _compile_edge_classes(doc: dict, schema_classes: set, schema_directionality: set,
+                          schema_axis_binding: set, errors: List[str]) -> Dict[EdgeClass, EdgeClassSpec]:
+    compiled = {}
+    for key, edge_def in doc.get("edge_classes", {}).items():
+        name = edge_def.get("name")
+        if name not in schema_classes or name not in EdgeClass.__members__:
+            errors.append(f"edge_classes.yaml: {key} class {name!r} not in graph_schema")
+            continue
+        directionality = edge_def.get("directionality")
+        if directionality not in schema_directionality:
+            errors.append(f"edge_classes.yaml: {name} directionality {directionality!r} not in graph_schema")
+            continue
+        axis_binding = frozenset(edge_def.get("axis_binding", []))
+        if not axis_binding <= schema_axis_binding:
+            errors.append(f"edge_classes.yaml: {name} axis_binding {sorted(axis_binding - schema_axis_binding)} "
+                          f"not in graph_schema")
+
+        endpoints = parse_direction(str(edge_def.get("direction", "")), directionality)
+        if endpoints is None:
+            errors.append(f"edge_classes.yaml: {name} direction {edge_def.get('direction')!r} "
+                          f"does not match directionality {directionality}")
+            continue
+        source_class, target_class = endpoints
+        pairs = {(source_class, target_class)}
+        if directionality == "BI":
+            pairs.add((target_class, source_class))
+
+        compiled[EdgeClass(name)] = EdgeClassSpec(
+            name=EdgeClass(name),
+            class_id=edge_def.get("id", ""),
+            directionality=Directionality(directionality),
+            source_class=source_class,
+            target_class=target_class,
+            allowed_pairs=frozenset(pairs),
+            axis_binding=axis_binding,
+            permits=tuple(edge_def.get("permits", [])),
+            cannot_carry=tuple(edge_def.get("cannot_carry", [])),
+            forbidden_axes=frozenset(_CARRY_AXES[c] for c in edge_def.get("cannot_carry", []) if c in _CARRY_AXES),
+        )
+    return compiled
+
+
+def parse_direction(direction: str, directionality: str
+                    ) -> Optional[Tuple[Optional[NodeClass], Optional[NodeClass]]]:
+    """'COVENANT_ROOT → PRINCIPLE_MODULE' -> (COVENANT_ROOT, PRINCIPLE_MODULE); non-class names are wildcards"""
+    arrow = "↔" if directionality == "BI" else "→"
+    parts = [p.strip() for p in re.split(r"[→↔]", direction)]
+    if len(parts) != 2 or arrow not in direction:
+        return None
+    source, target = (NodeClass(p) if p in NodeClass.__members__ else None for p in parts)
+    return source, target
+
+
+def _compile_zones(doc: dict, stages: Tuple[str, ...], errors: List[str]) -> Dict[str, ZoneSpec]:
+    """Zones must partition the TEMPORAL_ORDERING stages"""
+    compiled = {}
+    owner: Dict[str, str] = {}
+    overlay_from = stages.index("OVERLAY") if "OVERLAY" in stages else len(stages)
+    for order, (key, zone_def) in enumerate(doc.get("zones", {}).items()):
+        temporal = zone_def.get("temporal", [])
+        unknown = [t for t in temporal if t not in stages or t not in Temporal.__members__]
+        if unknown or not temporal:
+            errors.append(f"zones.yaml: {key} has unknown or no temporal stages {unknown}")
+            continue
+        for stage in temporal:
+            if stage in owner:
+                errors.append(f"zones.yaml: {stage} in both {owner[stage]} and {key}")
+            owner[stage] = key
+        compiled[key] = ZoneSpec(
+            key=key,
+            zone_id=zone_def.get("id", key),
+            order=order,
+            temporal=frozenset(Temporal[t] for t in temporal),
+            change_policy=zone_def.get("change_policy", ""),
+            overlay=all(stages.index(t) >= overlay_from for t in temporal),
+        )
+    if compiled:
+        unzoned = [t for t in stages if t not in owner]
+        if unzoned:
+            errors.append(f"zones.yaml: temporal stages without a zone {unzoned}")
+    return compiled
@@ -0,0 +1,113 @@
+"""
+TOPOLOGY ZONE INDEX
+Node -> zone and zone -> contiguous node range, with boundary edges
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from topology.graph_loader import TopologyGraph, Edge, EdgeClass
+from topology.graph_index import GraphIndex
+from topology.spec import CompiledSpec
+
+
+class ZoneIndex:
+    """
+    Read-only zone index over a TopologyGraph
+    Nodes are ordered by (zone order, node_id), so each zone's members
+    occupy one contiguous range of node_ids. Every edge is filed under
+    the zone(s) of its endpoints: internal when both lie in one zone,
+    boundary (under both zones) otherwise.
+    """
+
+    def __init__(self, graph: TopologyGraph, spec: CompiledSpec):
+        self.graph = graph
+        self.spec = spec
+        zone_by_temporal = spec.zone_by_temporal
+        order = {key: zone.order for key, zone in spec.zones.items()}
+
+        self.zone_of: Dict[str, str] = {
+            node_id: zone_by_temporal[node.temporal] for node_id, node in graph.nodes.items()
+        }
+        self.node_ids: List[str] = sorted(self.zone_of, key=lambda n: (order[self.zone_of[n]], n))
+        self.position: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        # zone -> [start, end) in node_ids; every spec zone has a (possibly empty) range
+        self.ranges: Dict[str, Tuple[int, int]] = {}
+        cursor = 0
+        for key in sorted(spec.zones, key=order.get):
+            start = cursor
+            while cursor < len(self.node_ids) and self.zone_of[self.node_ids[cursor]] == key:
+                cursor += 1
+            self.ranges[key] = (start, cursor)
+
+        self.internal: Dict[str, List[Edge]] = {key: [] for key in spec.zones}
+        self.incoming: Dict[str, List[Edge]] = {key: [] for key in spec.zones}
+        self.outgoing: Dict[str, List[Edge]] = {key: [] for key in spec.zones}
+        for edge in graph.edges.values():
+            source_zone = self.zone_of[edge.source]
+            target_zone = self.zone_of[edge.target]
+            if source_zone == target_zone:
+                self.internal[source_zone].append(edge)
+            else:
+                self.outgoing[source_zone].append(edge)
+                self.incoming[target_zone].append(edge)
+
+    @classmethod
+    def from_graph(cls, graph: TopologyGraph, topology_dir=None) -> "ZoneIndex":
+        """Index graph with the zones of topology_dir (default: bundled spec)"""
+        from pathlib import Path
+        from topology.spec import load_spec
+        return cls(graph, load_spec(Path(topology_dir) if topology_dir else Path(__file__).resolve().parent))
+
+    def _zone(self, zone: str) -> Tuple[int, int]:
+        if zone not in self.ranges:
+            raise KeyError(f"UNKNOWN_ZONE: {zone}")
+        return self.ranges[zone]
+
+    def members(self, zone: str) -> List[str]:
+        """Node ids in zone, sorted"""
+        start, end = self._zone(zone)
+        return self.node_ids[start:end]
+
+    def contains(self, zone: str, node_id: str) -> bool:
+        start, end = self._zone(zone)
+        position = self.position.get(node_id)
+        return position is not None and start <= position < end
+
+    def boundary_edges(self, zone: str) -> List[Edge]:
+        """Edges with exactly one endpoint in zone"""
+        self._zone(zone)
+        return self.incoming[zone] + self.outgoing[zone]
+
+    def zone_edges(self, zone: str) -> List[Edge]:
+        """Edges with at least one endpoint in zone"""
+        self._zone(zone)
+        return self.internal[zone] + self.incoming[zone] + self.outgoing[zone]
+
+    def inflow_index(self, zone: str, edge_classes: Optional[Set[EdgeClass]] = None) -> GraphIndex:
+        """
+        GraphIndex over the zone's members, the sources of its incoming
+        edges, and its internal and incoming edges (optionally of the given
+        classes only). Dataflow over it sees everything that enters the zone.
+        """
+        edges = self.internal[zone] + self.incoming[zone]
+        if edge_classes is not None:
+            edges = [e for e in edges if e.edge_class in edge_classes]
+        outside = sorted({e.source for e in edges if self.zone_of[e.source] != zone})
+        nodes = self.graph.nodes
+        return GraphIndex([nodes[n] for n in self.members(zone) + outside], edges)
+
+    def is_sink(self, zone: str) -> bool:
+        """No edge leaves the zone: nothing outside depends on its contents"""
+        self._zone(zone)
+        return not self.outgoing[zone]
+
+    def is_overlay(self, zone: str) -> bool:
+        self._zone(zone)
+        return self.spec.zones[zone].overlay
+
+    def zones_of(self, node_ids: Iterable[str]) -> Set[Optional[str]]:
+        """Zones of node_ids; None stands for ids that are not nodes"""
+        return {self.zone_of.get(node_id) for node_id in node_ids}
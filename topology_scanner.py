@@ -10,6 +10,8 @@ from collections import defaultdict, Counter
 from datetime import datetime
 import json
 
+import instrumentation
+
 class TopologyScanner:
     """Map repository as navigable city for logic engines"""
     
@@ -26,8 +28,10 @@ class TopologyScanner:
         ],
     }
     
-    def __init__(self, root_path):
+    def __init__(self, root_path, include=None):
         self.root = Path(root_path).resolve()
+        # Repository-relative files/directories to scan (default: everything)
+        self.include = sorted(include) if include is not None else None
         self.files = {}
         self.dependency_graph = defaultdict(set)
         self.reverse_deps = defaultdict(set)
@@ -37,37 +41,66 @@ class TopologyScanner:
         print(f"\n🏗️  SCANNING: {self.root}\n")
         
         # Census
-        self._walk_tree()
+        with instrumentation.stage("scan.walk"):
+            self._walk_tree()
+        instrumentation.count("scan.files_walked", len(self.files))
         print(f"✓ Census: {len(self.files)} files")
         
         # Dependencies
-        self._extract_dependencies()
+        with instrumentation.stage("scan.dependencies"):
+            self._extract_dependencies()
         print(f"✓ Dependencies extracted")
         
         # Analysis
-        report = self._analyze()
+        with instrumentation.stage("scan.analyze"):
+            report = self._analyze()
         print(f"✓ Analysis complete\n")
         
         return report
     
+    @classmethod
+    def for_zone(cls, root_path, zone):
+        """Scanner restricted to the member paths of one topology zone"""
+        from topology.graph_loader import load_topology_graph
+        from topology.zones import ZoneIndex
+        
+        root = Path(root_path).resolve()
+        graph = load_topology_graph(str(root))
+        topology_dir = root / 'topology'
+        zones = ZoneIndex.from_graph(graph, topology_dir if (topology_dir / 'zones.yaml').exists() else None)
+        return cls(root, include=zones.members(zone))
+    
     def _walk_tree(self):
         """Catalog all files"""
         ignore = {'node_modules', '.git', '__pycache__', 'venv', 'dist', 'build'}
         
-        for root, dirs, files in os.walk(self.root):
-            dirs[:] = [d for d in dirs if d not in ignore]
-            
-            for fname in files:
-                fpath = Path(root) / fname
-                rel_path = fpath.relative_to(self.root)
+        if self.include is None:
+            tops = [self.root]
+        else:
+            tops = []
+            for rel in self.include:
+                fpath = self.root / rel
+                if fpath.is_dir():
+                    tops.append(fpath)
+                elif fpath.is_file():
+                    self._add_file(fpath)
+        
+        for top in tops:
+            for root, dirs, files in os.walk(top):
+                dirs[:] = [d for d in dirs if d not in ignore]
                 
-                self.files[str(rel_path)] = {
-                    'path': fpath,
-                    'size': fpath.stat().st_size if fpath.exists() else 0,
-                    'ext': fpath.suffix,
-                    'imports': set(),
-                    'depth': len(rel_path.parts)
-                }
+                for fname in files:
+                    self._add_file(Path(root) / fname)
+    
+    def _add_file(self, fpath):
+        rel_path = fpath.relative_to(self.root)
+        self.files[str(rel_path)] = {
+            'path': fpath,
+            'size': fpath.stat().st_size if fpath.exists() else 0,
+            'ext': fpath.suffix,
+            'imports': set(),
+            'depth': len(rel_path.parts)
+        }
     
     def _extract_dependencies(self):
         """Extract import relationships"""
@@ -77,6 +110,7 @@ class TopologyScanner:
             
             try:
                 content = info['path'].read_text(encoding='utf-8', errors='ignore')
+                instrumentation.count("scan.files_parsed")
                 
                 # Python imports
                 if info['ext'] == '.py':
@@ -204,8 +238,11 @@ class TopologyScanner:
 if __name__ == '__main__':
     import sys
     
-    repo_path = sys.argv[1] if len(sys.argv) > 1 else '.'
-    scanner = TopologyScanner(repo_path)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    repo_path = args[0] if args else '.'
+    # --zone=<zone> scans only that zone's member paths
+    zone = next((arg.split('=', 1)[1] for arg in sys.argv[1:] if arg.startswith('--zone=')), None)
+    scanner = TopologyScanner.for_zone(repo_path, zone) if zone else TopologyScanner(repo_path)
     report = scanner.scan()
     
     output = Path(repo_path) / 'TOPOLOGY_REPORT.html'
@@ -0,0 +1,257 @@
+"""
+HASH-CHAINED AUDIT LOG
+Append-only JSONL record of validation runs and violations
+Authority: IMMUTABLE
+Generated: 2026-02-07
+
+Each record carries the hash of the record before it, so deleting,
+reordering or editing any record breaks the chain (INVARIANT_009).
+Appends are group-committed: records are buffered and written with one
+write + fsync per group. Every checkpoint_every records a checkpoint
+(seq, byte offset, hash) is appended to the side index <log>.idx, and
+tail verification resumes from the last checkpoint, so its cost is
+O(records since checkpoint) rather than O(log size).
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import instrumentation
+
+GENESIS_HASH = "0" * 64
+
+# Default log location, relative to the repository root
+VIOLATION_LOG_PATH = "VIOLATION_LOG.jsonl"
+
+
+def _encode(fields: dict) -> bytes:
+    return json.dumps(fields, sort_keys=True, separators=(",", ":")).encode()
+
+
+def record_hash(record: dict) -> str:
+    """SHA-256 over the canonical encoding of every field except 'hash'"""
+    return hashlib.sha256(_encode({k: v for k, v in record.items() if k != "hash"})).hexdigest()
+
+
+def index_path(path: Path) -> Path:
+    return Path(str(path) + ".idx")
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Chain state at one record: its seq, byte offset and hash"""
+    seq: int
+    offset: int
+    hash: str
+
+
+def read_checkpoints(path: Path) -> List[Checkpoint]:
+    """Checkpoints from the index of log path (empty if none)"""
+    index = index_path(path)
+    if not index.exists():
+        return []
+    checkpoints = []
+    with open(index, "rb") as f:
+        for line in f:
+            # A torn trailing index line is ignored; the log is authoritative
+            if not line.endswith(b"\n"):
+                break
+            entry = json.loads(line)
+            checkpoints.append(Checkpoint(entry["seq"], entry["offset"], entry["hash"]))
+    return checkpoints
+
+
+@dataclass
+class VerifyResult:
+    """Outcome of a chain walk"""
+    violation: Optional[str]
+    records_checked: int
+    last_seq: int
+    head: str
+    end_offset: int
+
+    @property
+    def ok(self) -> bool:
+        return self.violation is None
+
+
+def _walk(f, offset: int, seq: int, head: str,
+          checkpoints: Dict[int, Checkpoint]) -> VerifyResult:
+    """Verify records from offset on, given the chain state before them"""
+    checked = 0
+    f.seek(offset)
+    for line in f:
+        if not line.endswith(b"\n"):
+            return VerifyResult(f"TORN_RECORD: at offset {offset}", checked, seq, head, offset)
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return VerifyResult(f"MALFORMED_RECORD: at offset {offset}", checked, seq, head, offset)
+
+        expected_seq = seq + 1
+        if record.get("seq") != expected_seq:
+            violation = f"SEQUENCE_BROKEN: expected {expected_seq}, found {record.get('seq')}"
+        elif record.get("prev") != head:
+            violation = f"CHAIN_BROKEN: record {expected_seq} does not follow its predecessor"
+        elif record.get("hash") != record_hash(record):
+            violation = f"RECORD_MODIFIED: record {expected_seq} hash mismatch"
+        elif expected_seq in checkpoints and (checkpoints[expected_seq].offset != offset or
+                                              checkpoints[expected_seq].hash != record["hash"]):
+            violation = f"CHECKPOINT_MISMATCH: record {expected_seq}"
+        else:
+            violation = None
+        if violation:
+            return VerifyResult(violation, checked, seq, head, offset)
+
+        seq, head = expected_seq, record["hash"]
+        offset += len(line)
+        checked += 1
+
+    instrumentation.count("audit.records_verified", checked)
+    if checkpoints and max(checkpoints) > seq:
+        return VerifyResult(f"LOG_TRUNCATED: checkpoint {max(checkpoints)} beyond record {seq}",
+                            checked, seq, head, offset)
+    return VerifyResult(None, checked, seq, head, offset)
+
+
+def verify_log(path: Path, full: bool = False) -> VerifyResult:
+    """
+    Verify the hash chain of log path
+    By default only the records from the last checkpoint on are read;
+    full=True walks the whole log and checks every checkpoint against it.
+    """
+    path = Path(path)
+    checkpoints = read_checkpoints(path)
+    if not path.exists():
+        if checkpoints:
+            return VerifyResult("LOG_TRUNCATED: log missing", 0, -1, GENESIS_HASH, 0)
+        return VerifyResult(None, 0, -1, GENESIS_HASH, 0)
+
+    with open(path, "rb") as f:
+        if full or not checkpoints:
+            return _walk(f, 0, -1, GENESIS_HASH, {cp.seq: cp for cp in checkpoints})
+
+        # Resume at the last checkpoint: re-check that record, then the tail
+        last = checkpoints[-1]
+        f.seek(last.offset)
+        line = f.readline()
+        try:
+            record = json.loads(line) if line.endswith(b"\n") else None
+        except ValueError:
+            record = None
+        if record is None:
+            code = "LOG_TRUNCATED" if not line else "CHECKPOINT_MISMATCH"
+            return VerifyResult(f"{code}: no record at checkpoint {last.seq}",
+                                0, -1, GENESIS_HASH, last.offset)
+        if (record.get("seq") != last.seq or record.get("hash") != last.hash
+                or record_hash(record) != last.hash):
+            return VerifyResult(f"CHECKPOINT_MISMATCH: record {last.seq}", 0, -1, GENESIS_HASH, last.offset)
+        result = _walk(f, last.offset + len(line), last.seq, last.hash, {})
+        result.records_checked += 1
+        return result
+
+
+def read_records(path: Path, offset: int = 0) -> Iterator[Tuple[int, dict]]:
+    """Yield (offset, record) from offset on"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            yield offset, json.loads(line)
+            offset += len(line)
+
+
+class AuditLog:
+    """
+    Appender for a hash-chained log
+    Opening verifies the tail and refuses to extend a broken chain.
+    Records are durable once flush() returns (or the group fills).
+    """
+
+    def __init__(self, path: Path, group_size: int = 64, checkpoint_every: int = 1024,
+                 fsync: bool = True):
+        self.path = Path(path)
+        self.group_size = group_size
+        self.checkpoint_every = checkpoint_every
+        self.fsync = fsync
+
+        state = verify_log(self.path)
+        if not state.ok:
+            raise ValueError(f"AUDIT_LOG_CORRUPT: {self.path}: {state.violation}")
+        self.seq = state.last_seq
+        self.head = state.head
+        self.size = state.end_offset
+
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._pending_checkpoints: List[Checkpoint] = []
+
+    def append(self, kind: str, data: dict) -> dict:
+        """Chain one record onto the log; written with its group"""
+        record = {
+            "seq": self.seq + 1,
+            "time": datetime.now(timezone.utc).isoformat(),
+            "kind": kind,
+            "data": data,
+            "prev": self.head,
+        }
+        record["hash"] = record_hash(record)
+        line = _encode(record) + b"\n"
+
+        offset = self.size + self._pending_bytes
+        if record["seq"] % self.checkpoint_every == 0:
+            self._pending_checkpoints.append(Checkpoint(record["seq"], offset, record["hash"]))
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        self.seq = record["seq"]
+        self.head = record["hash"]
+        instrumentation.count("audit.records_appended")
+
+        if len(self._pending) >= self.group_size:
+            self.flush()
+        return record
+
+    def flush(self):
+        """Write pending records in one group commit, then their checkpoints"""
+        if not self._pending:
+            return
+        self._write(self.path, b"".join(self._pending))
+        # Index is written after the log, so it never points past durable records
+        if self._pending_checkpoints:
+            self._write(index_path(self.path), b"".join(
+                _encode({"seq": cp.seq, "offset": cp.offset, "hash": cp.hash}) + b"\n"
+                for cp in self._pending_checkpoints))
+        self.size += self._pending_bytes
+        self._pending = []
+        self._pending_bytes = 0
+        self._pending_checkpoints = []
+        instrumentation.count("audit.group_commits")
+
+    def _write(self, path: Path, data: bytes):
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def verify(self, full: bool = False) -> VerifyResult:
+        self.flush()
+        return verify_log(self.path, full=full)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
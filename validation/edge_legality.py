@@ -0,0 +1,122 @@
+"""
+BATCHED EDGE CLASS LEGALITY
+Bulk check of (source, target, edge_type) triples against compiled edge_classes.yaml
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import instrumentation
+
+from topology.graph_loader import TopologyGraph, NodeClass, EdgeClass
+from topology.spec import CompiledSpec
+
+# Interned node classes; code len(NodeClass) = node unknown to the graph
+NODE_CLASS_CODES: Dict[NodeClass, int] = {c: i for i, c in enumerate(NodeClass)}
+_UNKNOWN = len(NODE_CLASS_CODES)
+_WIDTH = _UNKNOWN + 1
+
+
+def edge_bit(bitmap: bytearray, i: int) -> bool:
+    """Result for triple i: bit set = legal (LSB-first within each byte)"""
+    return bool(bitmap[i >> 3] >> (i & 7) & 1)
+
+
+def illegal_positions(bitmap: bytearray, count: int) -> List[int]:
+    """Positions of illegal triples among the first count"""
+    positions = []
+    for byte_index, byte in enumerate(bitmap):
+        if byte == 0xFF:
+            continue
+        base = byte_index << 3
+        for bit in range(min(8, count - base)):
+            if not byte >> bit & 1:
+                positions.append(base + bit)
+    return positions
+
+
+class EdgeLegalityTable:
+    """
+    Per-edge-class lookup tables compiled from the spec:
+    - pairs: flat class x class byte table, 1 = direction allowed
+    - bound / forbidden: axis_binding and cannot_carry axis sets
+    """
+
+    def __init__(self, spec: CompiledSpec):
+        self.pairs: Dict[EdgeClass, bytes] = {}
+        self.bound: Dict[EdgeClass, frozenset] = {}
+        self.forbidden: Dict[EdgeClass, frozenset] = {}
+
+        for edge_class, edge_spec in spec.edge_classes.items():
+            table = bytearray(_WIDTH * _WIDTH)
+            for source_class, target_class in edge_spec.allowed_pairs:
+                # None endpoint = any node known to the graph
+                sources = [NODE_CLASS_CODES[source_class]] if source_class else range(_UNKNOWN)
+                targets = [NODE_CLASS_CODES[target_class]] if target_class else range(_UNKNOWN)
+                for s in sources:
+                    for t in targets:
+                        table[s * _WIDTH + t] = 1
+            self.pairs[edge_class] = bytes(table)
+            self.bound[edge_class] = edge_spec.axis_binding
+            self.forbidden[edge_class] = edge_spec.forbidden_axes
+
+        # Accept EdgeClass, its value ('DEPENDENCY_IMPORT') or yaml key ('dependency_import')
+        self.edge_types: Dict[object, EdgeClass] = {}
+        for edge_class in self.pairs:
+            self.edge_types[edge_class] = edge_class
+            self.edge_types[edge_class.value] = edge_class
+            self.edge_types[edge_class.value.lower()] = edge_class
+
+        # Interned codes of the last node_classes mapping, reused while it is the same object
+        self._interned: Tuple[object, Dict[str, int]] = (None, {})
+
+    def check_many(self, triples: Iterable[Sequence], node_classes: Mapping[str, NodeClass]) -> bytearray:
+        """
+        Validate (source, target, edge_type[, axis_binding]) triples in one pass
+        Returns packed bitmap, one bit per triple, set = legal
+        Illegal: unknown edge type, source/target class outside the edge
+        class direction, or axis_binding outside the class binding or
+        naming a cannot_carry axis. Each bit depends only on its own triple.
+        """
+        if self._interned[0] is not node_classes:
+            self._interned = (node_classes, {node_id: NODE_CLASS_CODES[node_class]
+                                             for node_id, node_class in node_classes.items()})
+        code_of = self._interned[1].get
+        edge_types = self.edge_types
+        pairs = self.pairs
+        bound = self.bound
+        forbidden = self.forbidden
+
+        bitmap = bytearray()
+        current = 0
+        count = 0
+
+        for triple in triples:
+            source, target, edge_type = triple[0], triple[1], triple[2]
+            edge_class = edge_types.get(edge_type)
+            legal = False
+            if edge_class is not None:
+                legal = pairs[edge_class][code_of(source, _UNKNOWN) * _WIDTH + code_of(target, _UNKNOWN)] == 1
+                if legal and len(triple) > 3 and triple[3]:
+                    axes = triple[3]
+                    legal = bound[edge_class].issuperset(axes) and forbidden[edge_class].isdisjoint(axes)
+
+            if legal:
+                current |= 1 << (count & 7)
+            count += 1
+            if count & 7 == 0:
+                bitmap.append(current)
+                current = 0
+
+        if count & 7:
+            bitmap.append(current)
+
+        instrumentation.count("validation.edges_checked", count)
+        return bitmap
+
+
+def graph_edge_triples(graph: TopologyGraph) -> Iterable[Tuple[str, str, EdgeClass, set]]:
+    """Canonical graph edges as (source, target, edge_class, axis_binding)"""
+    return ((e.source, e.target, e.edge_class, e.axis_binding) for e in graph.edges.values())
+
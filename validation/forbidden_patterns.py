@@ -0,0 +1,154 @@
+"""
+FORBIDDEN TOPOLOGY MATCHER
+Indexed detection of forbidden.yaml patterns on the canonical graph
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from topology.graph_loader import TopologyGraph, NodeClass, EdgeClass
+from topology.graph_index import GraphIndex
+from topology.spec import CompiledSpec
+
+
+def hub_node_classes(spec: CompiledSpec) -> Set[NodeClass]:
+    """
+    Node classes that are hubs by definition: the fixed endpoint of an
+    edge class whose other endpoint is any node (e.g. GUARDIAN_SYSTEM →
+    watched_node), plus the single COVENANT_ROOT
+    """
+    hubs = {NodeClass.COVENANT_ROOT}
+    for edge_spec in spec.edge_classes.values():
+        endpoints = [c for c in (edge_spec.source_class, edge_spec.target_class) if c is not None]
+        if len(endpoints) == 1:
+            hubs.add(endpoints[0])
+    return hubs
+
+
+class ForbiddenPatternMatcher:
+    """
+    Matches forbidden topologies using degree and class indexes built once
+    in O(V+E); every matcher is a linear scan, no subgraph enumeration.
+    Each matcher returns witnesses; an empty list means the pattern is absent.
+    """
+
+    def __init__(self, graph: TopologyGraph, spec: CompiledSpec,
+                 index: Optional[GraphIndex] = None,
+                 hub_sigma: float = 3.0, correlation_threshold: float = 0.8):
+        self.graph = graph
+        self.index = index if index is not None else GraphIndex.from_graph(graph)
+        self.hub_sigma = hub_sigma
+        self.correlation_threshold = correlation_threshold
+
+        n = len(self.index)
+        offsets_in = self.index.in_offsets
+        offsets_out = self.index.out_offsets
+        self.in_degree = [offsets_in[i + 1] - offsets_in[i] for i in range(n)]
+        self.out_degree = [offsets_out[i + 1] - offsets_out[i] for i in range(n)]
+
+        # Class index
+        self.by_class: Dict[NodeClass, List[int]] = {}
+        for i, node in enumerate(self.index.nodes):
+            self.by_class.setdefault(node.node_class, []).append(i)
+
+        # Edge class -> (source class, target class) fixed by edge_classes.yaml
+        self.endpoint_classes: Dict[EdgeClass, Tuple[Optional[NodeClass], Optional[NodeClass]]] = {
+            edge_class: (edge_spec.source_class, edge_spec.target_class)
+            for edge_class, edge_spec in spec.edge_classes.items()
+        }
+
+        self.hub_classes = hub_node_classes(spec)
+
+        self.matchers: Dict[str, Callable[[], List[str]]] = {
+            'MIXED_AXIS_NODE': self.match_mixed_axis_node,
+            'AUTHORITY_THROUGH_CONNECTIVITY': self.match_authority_through_connectivity,
+            'OPTIMIZATION_SHORTCUT': self.match_optimization_shortcut,
+            'EMERGENT_HUB': self.match_emergent_hub,
+        }
+
+    def match(self, pattern_name: str) -> Optional[List[str]]:
+        """Witnesses for pattern, or None if no structural matcher exists"""
+        matcher = self.matchers.get(pattern_name)
+        return matcher() if matcher else None
+
+    # FORBIDDEN_001
+    def match_mixed_axis_node(self) -> List[str]:
+        """
+        Node matches multiple NODE_CLASS definitions: besides its declared
+        class, it is used as the endpoint that an edge class reserves for
+        another class (e.g. a COVENANT_ROOT sourcing MODE_RESTRICTION edges,
+        which only an OPERATIONAL_MODE_ENFORCER may)
+        """
+        nodes = self.graph.nodes
+        roles: Dict[str, Set[NodeClass]] = {}
+        for edge in self.graph.edges.values():
+            source_class, target_class = self.endpoint_classes.get(edge.edge_class, (None, None))
+            for node_id, role in ((edge.source, source_class), (edge.target, target_class)):
+                if role is not None and role != nodes[node_id].node_class:
+                    roles.setdefault(node_id, set()).add(role)
+
+        witnesses = []
+        for node_id in sorted(roles):
+            matched = sorted(c.value for c in roles[node_id] | {nodes[node_id].node_class})
+            witnesses.append(f"{node_id}: matches {matched}")
+        return witnesses
+
+    # FORBIDDEN_002
+    def match_authority_through_connectivity(self) -> List[str]:
+        """Authority level correlates with fan-in (Pearson r >= threshold)"""
+        n = len(self.index)
+        if n < 3:
+            return []
+        authority = [node.authority.value for node in self.index.nodes]
+        fan_in = self.in_degree
+
+        mean_a = sum(authority) / n
+        mean_f = sum(fan_in) / n
+        cov = sum((a - mean_a) * (f - mean_f) for a, f in zip(authority, fan_in))
+        var_a = sum((a - mean_a) ** 2 for a in authority)
+        var_f = sum((f - mean_f) ** 2 for f in fan_in)
+        if var_a == 0 or var_f == 0:
+            return []
+
+        r = cov / (var_a * var_f) ** 0.5
+        if r < self.correlation_threshold:
+            return []
+        top = max(range(n), key=lambda i: fan_in[i])
+        return [f"authority/fan-in correlation r={r:.3f} over {n} nodes; "
+                f"max fan-in {self.index.node_ids[top]} ({fan_in[top]}, {self.index.nodes[top].authority.name})"]
+
+    # FORBIDDEN_003
+    def match_optimization_shortcut(self) -> List[str]:
+        """Edge violates VERIFICATION_MONOTONICITY, or TEMPORAL_ORDERING on DEPENDENCY_IMPORT"""
+        nodes = self.graph.nodes
+        witnesses = []
+        for edge in self.graph.edges.values():
+            source = nodes[edge.source]
+            target = nodes[edge.target]
+            if target.verification.value < source.verification.value:
+                witnesses.append(f"{edge.edge_id}: VERIFICATION_DECREASE")
+            if edge.edge_class == EdgeClass.DEPENDENCY_IMPORT and target.temporal.value > source.temporal.value:
+                witnesses.append(f"{edge.edge_id}: TEMPORAL_ORDER_INVERSION")
+        return witnesses
+
+    # FORBIDDEN_004
+    def match_emergent_hub(self) -> List[str]:
+        """Degree above mean + hub_sigma * stddev on a node whose class is not a hub class"""
+        n = len(self.index)
+        if n == 0:
+            return []
+        degree = [a + b for a, b in zip(self.in_degree, self.out_degree)]
+        mean = sum(degree) / n
+        std = (sum((d - mean) ** 2 for d in degree) / n) ** 0.5
+        threshold = mean + self.hub_sigma * std
+
+        witnesses = []
+        for node_class, members in self.by_class.items():
+            if node_class in self.hub_classes:
+                continue
+            for i in members:
+                if degree[i] > threshold:
+                    witnesses.append(f"{self.index.node_ids[i]}: degree {degree[i]} > {threshold:.1f} "
+                                     f"({node_class.value} is not a hub class)")
+        return witnesses
@@ -0,0 +1,422 @@
+"""
+INCREMENTAL TOPOLOGY REVALIDATION
+Recompute only the checks a change can affect
+Authority: IMMUTABLE
+Generated: 2026-02-07
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from topology.graph_loader import TopologyGraph, Node, Edge, NodeClass
+from topology.graph_index import (
+    GraphIndex, EscalationCycle, strongly_connected_components, authority_escalation_cycles,
+)
+from topology.zones import ZoneIndex
+
+
+@dataclass
+class TopologyDelta:
+    """Set of node/edge changes between two graph states"""
+    added_nodes: Dict[str, Node] = field(default_factory=dict)
+    modified_nodes: Dict[str, Node] = field(default_factory=dict)
+    removed_nodes: Set[str] = field(default_factory=set)
+    added_edges: Dict[str, Edge] = field(default_factory=dict)
+    removed_edges: Set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        return not (self.added_nodes or self.modified_nodes or self.removed_nodes
+                    or self.added_edges or self.removed_edges)
+
+    @classmethod
+    def from_graphs(cls, old: TopologyGraph, new: TopologyGraph,
+                    paths: Optional[Iterable[str]] = None) -> "TopologyDelta":
+        """
+        Diff two graph states
+        If paths is given (e.g. from a manifest diff) only those nodes
+        and the edges touching them are compared
+        """
+        delta = cls()
+
+        if paths is None:
+            node_ids = set(old.nodes) | set(new.nodes)
+            old_edges = old.edges
+            new_edges = new.edges
+        else:
+            node_ids = set(paths)
+            old_edges = {k: e for k, e in old.edges.items() if e.source in node_ids or e.target in node_ids}
+            new_edges = {k: e for k, e in new.edges.items() if e.source in node_ids or e.target in node_ids}
+
+        for node_id in node_ids:
+            before = old.nodes.get(node_id)
+            after = new.nodes.get(node_id)
+            if before is None and after is not None:
+                delta.added_nodes[node_id] = after
+            elif before is not None and after is None:
+                delta.removed_nodes.add(node_id)
+            elif before != after:
+                delta.modified_nodes[node_id] = after
+
+        for edge_id, edge in new_edges.items():
+            if old_edges.get(edge_id) != edge:
+                delta.added_edges[edge_id] = edge
+                if edge_id in old_edges:
+                    delta.removed_edges.add(edge_id)
+        for edge_id in old_edges:
+            if edge_id not in new_edges:
+                delta.removed_edges.add(edge_id)
+
+        return delta
+
+
+def manifest_changed_paths(old_manifest: dict, new_manifest: dict) -> Set[str]:
+    """Paths added, removed or rehashed between two GENESIS manifests"""
+    before = {f['path']: f['sha256'] for f in old_manifest.get('files', [])}
+    after = {f['path']: f['sha256'] for f in new_manifest.get('files', [])}
+    changed = {path for path, sha in after.items() if before.get(path) != sha}
+    changed.update(path for path in before if path not in after)
+    return changed
+
+
+def zone_scoped_delta(old: TopologyGraph, new: TopologyGraph, changed_paths: Iterable[str],
+                      old_zones: ZoneIndex, new_zones: ZoneIndex) -> Tuple[TopologyDelta, Optional[Set[str]]]:
+    """
+    Delta for a change, diffed only over the zones it touches
+    If every changed path lies in overlay zones (before and after), only
+    the members of those zones and their boundary edges are compared and
+    the touched zones are returned; otherwise the whole graph is diffed
+    and the zones are None.
+    """
+    changed = set(changed_paths)
+    touched = old_zones.zones_of(changed) | new_zones.zones_of(changed)
+    touched.discard(None)
+    in_graph = changed & (set(old.nodes) | set(new.nodes))
+    if not in_graph:
+        return TopologyDelta(), set()
+    if not all(old_zones.is_overlay(zone) and new_zones.is_overlay(zone) for zone in touched):
+        return TopologyDelta.from_graphs(old, new), None
+
+    scope: Set[str] = set(changed)
+    for zone in touched:
+        scope.update(old_zones.members(zone))
+        scope.update(new_zones.members(zone))
+    return TopologyDelta.from_graphs(old, new, paths=scope), touched
+
+
+class IncrementalValidator:
+    """
+    Holds validation state for ROOT_REACHABILITY, VERIFICATION_MONOTONICITY
+    and NO_AUTHORITY_ESCALATION_CYCLE and updates it per delta:
+    - reachability is repaired from the changed frontier only
+    - verification is rechecked on touched edges only
+    - escalation results are cached per SCC; only components a change can
+      merge or split are recomputed
+    """
+
+    def __init__(self, graph: TopologyGraph):
+        self.nodes: Dict[str, Node] = dict(graph.nodes)
+        self.edges: Dict[str, Edge] = dict(graph.edges)
+        self.covenant_root_id = graph.covenant_root_id
+        self.last_stats: Dict[str, int] = {}
+        self._full_rebuild()
+
+    # State construction
+
+    def _full_rebuild(self):
+        self.out_edges: Dict[str, Set[str]] = {node_id: set() for node_id in self.nodes}
+        self.in_edges: Dict[str, Set[str]] = {node_id: set() for node_id in self.nodes}
+        for edge_id, edge in self.edges.items():
+            self.out_edges[edge.source].add(edge_id)
+            self.in_edges[edge.target].add(edge_id)
+
+        self.reached: Set[str] = set()
+        self._extend_reach([self.covenant_root_id])
+        self.unreachable: Set[str] = set(self.nodes) - self.reached
+
+        self.verification_violations: Dict[str, str] = {}
+        for edge_id in self.edges:
+            self._check_edge(edge_id)
+
+        self.component_of: Dict[str, FrozenSet[str]] = {}
+        self.scc_results: Dict[FrozenSet[str], Optional[EscalationCycle]] = {}
+        self.escalating: Dict[FrozenSet[str], EscalationCycle] = {}
+        self._recompute_components(set(self.nodes))
+
+        self.last_stats = {
+            'nodes_revisited': len(self.nodes),
+            'edges_rechecked': len(self.edges),
+            'components_recomputed': len(self.scc_results),
+        }
+
+    # Incremental update
+
+    def apply(self, delta: TopologyDelta) -> Dict[str, any]:
+        """Apply delta and return updated results"""
+        touched_nodes: Set[str] = set()
+        touched_edges: Set[str] = set()
+        lost_targets: Set[str] = set()
+        split_components: Set[FrozenSet[str]] = set()
+        removed_edges = set(delta.removed_edges)
+
+        # Removed nodes take their incident edges with them
+        for node_id in delta.removed_nodes:
+            removed_edges |= self.out_edges.get(node_id, set()) | self.in_edges.get(node_id, set())
+
+        for edge_id in removed_edges:
+            edge = self.edges.pop(edge_id, None)
+            if edge is None:
+                continue
+            self.out_edges[edge.source].discard(edge_id)
+            self.in_edges[edge.target].discard(edge_id)
+            self.verification_violations.pop(edge_id, None)
+            lost_targets.add(edge.target)
+            component = self.component_of.get(edge.source)
+            if component is not None and component is self.component_of.get(edge.target):
+                split_components.add(component)
+
+        for node_id in delta.removed_nodes:
+            if node_id not in self.nodes:
+                continue
+            del self.nodes[node_id]
+            del self.out_edges[node_id]
+            del self.in_edges[node_id]
+            self.reached.discard(node_id)
+            self.unreachable.discard(node_id)
+            lost_targets.discard(node_id)
+            component = self.component_of.pop(node_id)
+            self.scc_results.pop(component, None)
+            self.escalating.pop(component, None)
+            split_components.add(component)
+
+        for node_id, node in list(delta.added_nodes.items()) + list(delta.modified_nodes.items()):
+            self.nodes[node_id] = node
+            self.out_edges.setdefault(node_id, set())
+            self.in_edges.setdefault(node_id, set())
+            touched_nodes.add(node_id)
+            touched_edges |= self.out_edges[node_id] | self.in_edges[node_id]
+            if node_id in self.component_of:
+                split_components.add(self.component_of[node_id])
+
+        for edge_id, edge in delta.added_edges.items():
+            if edge.source not in self.nodes or edge.target not in self.nodes:
+                raise ValueError(f"GRAPH_INVALID: Edge {edge_id} references non-existent node")
+            self.edges[edge_id] = edge
+            self.out_edges[edge.source].add(edge_id)
+            self.in_edges[edge.target].add(edge_id)
+            touched_edges.add(edge_id)
+
+        root_changed = self.covenant_root_id not in self.nodes or any(
+            (self.nodes[n].node_class == NodeClass.COVENANT_ROOT) != (n == self.covenant_root_id)
+            for n in touched_nodes
+        )
+        if root_changed:
+            # Root identity changed: nothing cached is trustworthy
+            roots = [n.node_id for n in self.nodes.values() if n.node_class == NodeClass.COVENANT_ROOT]
+            if len(roots) != 1:
+                raise ValueError(f"GRAPH_INVALID: expected exactly one COVENANT_ROOT, found {roots}")
+            self.covenant_root_id = roots[0]
+            self._full_rebuild()
+            return self.results()
+
+        nodes_revisited = self._repair_reach(lost_targets, delta.added_edges.values(), touched_nodes)
+
+        for edge_id in touched_edges:
+            if edge_id in self.edges:
+                self._check_edge(edge_id)
+
+        affected = self._scc_frontier(delta.added_edges.values(), split_components, touched_nodes)
+        components_recomputed = self._recompute_components(affected)
+
+        self.last_stats = {
+            'nodes_revisited': nodes_revisited,
+            'edges_rechecked': len(touched_edges),
+            'components_recomputed': components_recomputed,
+        }
+        return self.results()
+
+    # ROOT_REACHABILITY
+
+    def _extend_reach(self, frontier: Iterable[str]) -> int:
+        """BFS from frontier over not-yet-reached nodes; returns nodes visited"""
+        queue = [n for n in frontier if n in self.nodes]
+        self.reached.update(queue)
+        visited = len(queue)
+        while queue:
+            next_queue = []
+            for node_id in queue:
+                for edge_id in self.out_edges[node_id]:
+                    target = self.edges[edge_id].target
+                    if target not in self.reached:
+                        self.reached.add(target)
+                        next_queue.append(target)
+            visited += len(next_queue)
+            queue = next_queue
+        return visited
+
+    def _repair_reach(self, lost_targets: Set[str], added_edges: Iterable[Edge],
+                      touched_nodes: Set[str]) -> int:
+        """
+        Un-reach everything downstream of removed edges, then re-reach it
+        (and anything newly connected) from still-reached predecessors
+        """
+        suspect: Set[str] = set()
+        queue = [n for n in lost_targets if n in self.reached and n != self.covenant_root_id]
+        suspect.update(queue)
+        while queue:
+            next_queue = []
+            for node_id in queue:
+                for edge_id in self.out_edges[node_id]:
+                    target = self.edges[edge_id].target
+                    if target in self.reached and target not in suspect and target != self.covenant_root_id:
+                        suspect.add(target)
+                        next_queue.append(target)
+            queue = next_queue
+        self.reached -= suspect
+
+        frontier = [n for n in suspect
+                    if any(self.edges[e].source in self.reached for e in self.in_edges[n])]
+        frontier += [e.target for e in added_edges if e.source in self.reached]
+        frontier += [n for n in touched_nodes
+                     if n == self.covenant_root_id
+                     or any(self.edges[e].source in self.reached for e in self.in_edges[n])]
+        visited = self._extend_reach(frontier)
+
+        self.unreachable |= suspect | {n for n in touched_nodes if n not in self.reached}
+        self.unreachable -= self.reached
+        return len(suspect) + visited
+
+    # VERIFICATION_MONOTONICITY
+
+    def _check_edge(self, edge_id: str):
+        edge = self.edges[edge_id]
+        source_node = self.nodes[edge.source]
+        target_node = self.nodes[edge.target]
+        if target_node.verification.value < source_node.verification.value:
+            self.verification_violations[edge_id] = (
+                f"VERIFICATION_DECREASE: {edge.source} ({source_node.verification.value})"
+                f" -> {edge.target} ({target_node.verification.value})"
+            )
+        else:
+            self.verification_violations.pop(edge_id, None)
+
+    # NO_AUTHORITY_ESCALATION_CYCLE
+
+    def _walk(self, start: Iterable[str], forward: bool, within: Optional[Set[str]] = None) -> Set[str]:
+        """Nodes reachable from start (forward) or reaching it (backward), optionally bounded"""
+        seen = set(start)
+        queue = list(seen)
+        adjacency = self.out_edges if forward else self.in_edges
+        while queue:
+            node_id = queue.pop()
+            for edge_id in adjacency[node_id]:
+                edge = self.edges[edge_id]
+                nxt = edge.target if forward else edge.source
+                if nxt not in seen and (within is None or nxt in within):
+                    seen.add(nxt)
+                    queue.append(nxt)
+        return seen
+
+    def _reaches(self, source: str, target: str) -> bool:
+        """Bidirectional search, always expanding the smaller frontier"""
+        if source == target:
+            return True
+        forward_seen, backward_seen = {source}, {target}
+        forward, backward = [source], [target]
+        while forward and backward:
+            if len(forward) <= len(backward):
+                frontier, seen, other, adjacency, attr = forward, forward_seen, backward_seen, self.out_edges, 'target'
+            else:
+                frontier, seen, other, adjacency, attr = backward, backward_seen, forward_seen, self.in_edges, 'source'
+            next_frontier = []
+            for node_id in frontier:
+                for edge_id in adjacency[node_id]:
+                    nxt = getattr(self.edges[edge_id], attr)
+                    if nxt in other:
+                        return True
+                    if nxt not in seen:
+                        seen.add(nxt)
+                        next_frontier.append(nxt)
+            if frontier is forward:
+                forward = next_frontier
+            else:
+                backward = next_frontier
+        return False
+
+    def _scc_frontier(self, added_edges: Iterable[Edge], split_components: Set[FrozenSet[str]],
+                      touched_nodes: Set[str]) -> Set[str]:
+        """
+        Nodes whose SCC may have changed:
+        - an added edge u -> v can only merge components on v ->* u paths
+        - a removed edge/node can only split its own component
+        - a modified node invalidates its component's cached result
+        """
+        affected: Set[str] = set(touched_nodes)
+        for component in split_components:
+            affected.update(n for n in component if n in self.nodes)
+        for edge in added_edges:
+            # Even with both endpoints already affected, the merged cycle may run
+            # through untouched nodes, which the induced-subgraph Tarjan must see
+            if self.component_of.get(edge.source) is not None and \
+                    self.component_of.get(edge.source) is self.component_of.get(edge.target):
+                continue
+            if self._reaches(edge.target, edge.source):
+                upstream = self._walk([edge.source], forward=False)
+                affected |= self._walk([edge.target], forward=True, within=upstream)
+            affected.update((edge.source, edge.target))
+
+        # Close over existing components so no component is recomputed partially
+        for node_id in list(affected):
+            component = self.component_of.get(node_id)
+            if component is not None:
+                affected.update(n for n in component if n in self.nodes)
+        return affected
+
+    def _recompute_components(self, affected: Set[str]) -> int:
+        """Tarjan over the subgraph induced by affected nodes; refresh per-SCC cache"""
+        for node_id in affected:
+            component = self.component_of.pop(node_id, None)
+            if component is not None:
+                self.scc_results.pop(component, None)
+                self.escalating.pop(component, None)
+
+        nodes = [self.nodes[n] for n in affected]
+        edges = [self.edges[e] for n in affected for e in self.out_edges[n]
+                 if self.edges[e].target in affected]
+        index = GraphIndex(nodes, edges)
+        component_of, components = strongly_connected_components(index)
+        cycles = {cycle.members: cycle
+                  for cycle in authority_escalation_cycles(index, (component_of, components))}
+
+        for members in components:
+            component = frozenset(index.node_ids[i] for i in members)
+            cycle = cycles.get(tuple(sorted(component)))
+            self.scc_results[component] = cycle
+            if cycle is not None:
+                self.escalating[component] = cycle
+            for node_id in component:
+                self.component_of[node_id] = component
+        return len(components)
+
+    # Results
+
+    def results(self) -> Dict[str, any]:
+        """Results in run_validation format"""
+        unreachable = self.unreachable
+        cycles = list(self.escalating.values())
+
+        violations = {
+            'ROOT_REACHABILITY': f"UNREACHABLE_NODES: {unreachable}" if unreachable else None,
+            'VERIFICATION_MONOTONICITY': (
+                self.verification_violations[min(self.verification_violations)]
+                if self.verification_violations else None
+            ),
+            'NO_AUTHORITY_ESCALATION_CYCLE': (
+                "AUTHORITY_ESCALATION_CYCLE: " + "; ".join(
+                    c.describe(self.nodes) for c in sorted(cycles, key=lambda c: c.members))
+                if cycles else None
+            ),
+        }
+        return {
+            'checks': {name: violation is None for name, violation in violations.items()},
+            'violations': violations,
+        }
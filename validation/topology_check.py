@@ -5,9 +5,12 @@ Authority: IMMUTABLE
 Generated: 2026-02-07
 """
 
-import yaml
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from topology.graph_loader import load_topology_graph, TopologyGraph, NodeClass
+from topology.spec import load_spec
+from validation.edge_legality import EdgeLegalityTable, edge_bit, graph_edge_triples, illegal_positions
+from validation.forbidden_patterns import ForbiddenPatternMatcher
 
 class TopologyValidator:
     """Validation checks for topology structure"""
@@ -16,21 +19,20 @@ class TopologyValidator:
         self.root = Path(repo_root)
         self.topology_dir = self.root / "topology"
         
-        # Load topology definitions
-        self.axes = self._load_yaml("axes.yaml")
-        self.node_classes = self._load_yaml("node_classes.yaml")
-        self.edge_classes = self._load_yaml("edge_classes.yaml")
-        self.invariants = self._load_yaml("invariants.yaml")
-        self.forbidden = self._load_yaml("forbidden.yaml")
+        # Load compiled topology definitions (parsed once, cached by file hash)
+        self.spec = load_spec(self.topology_dir)
+        self.axes = self.spec.raw["axes"]
+        self.node_classes = self.spec.raw["node_classes"]
+        self.edge_classes = self.spec.raw["edge_classes"]
+        self.invariants = self.spec.raw["invariants"]
+        self.forbidden = self.spec.raw["forbidden"]
+        
+        self._matcher: Optional[ForbiddenPatternMatcher] = None
+        self.forbidden_witnesses: Dict[str, List[str]] = {}
+        self._edge_table: Optional[EdgeLegalityTable] = None
+        self._graph: Optional[TopologyGraph] = None
+        self._node_classes: Dict[str, NodeClass] = {}
         
-    def _load_yaml(self, filename: str) -> dict:
-        """Load YAML definition file"""
-        path = self.topology_dir / filename
-        if not path.exists():
-            return {}
-        with open(path, 'r') as f:
-            return yaml.safe_load(f)
-    
     # CHECK 1: NODE_CLASS_LEGALITY
     def check_node_class_legality(self, node_path: Path) -> bool:
         """
@@ -62,19 +64,35 @@ class TopologyValidator:
         Output: YES | NO
         Test: Does edge conform to exactly one EDGE_CLASS specification?
         """
-        edge_def = self.edge_classes.get('edge_classes', {}).get(edge_type)
-        if not edge_def:
-            return False
-        
-        # Verify directionality
-        if edge_def['directionality'] == 'UNI':
-            # Check direction is valid
-            pass
-        
-        # Verify axis binding
-        # Verify permits/cannot_carry
-        
-        return True  # Stub
+        return edge_bit(self.check_edge_class_legality_many([(source, target, edge_type)]), 0)
+    
+    def check_edge_class_legality_many(self, edges: Iterable[Sequence],
+                                       node_classes: Optional[Mapping[str, NodeClass]] = None) -> bytearray:
+        """
+        Input: (source, target, edge_type[, axis_binding]) triples
+        Output: bitmap, bit i set = YES for triple i (see edge_legality.edge_bit)
+        Test: directionality, direction (source class -> target class), cannot_carry
+        Node classes default to the canonical graph
+        """
+        if node_classes is None:
+            node_classes = self._canonical_node_classes()
+        return self._edge_legality_table().check_many(edges, node_classes)
+    
+    def _edge_legality_table(self) -> EdgeLegalityTable:
+        """Class x class tables are compiled once per spec"""
+        if self._edge_table is None:
+            self._edge_table = EdgeLegalityTable(self.spec)
+        return self._edge_table
+    
+    def _canonical_graph(self) -> TopologyGraph:
+        if self._graph is None:
+            self._graph = load_topology_graph(str(self.root))
+            self._node_classes = {node_id: node.node_class for node_id, node in self._graph.nodes.items()}
+        return self._graph
+    
+    def _canonical_node_classes(self) -> Dict[str, NodeClass]:
+        self._canonical_graph()
+        return self._node_classes
     
     # CHECK 3: INVARIANT_SATISFACTION
     def check_invariant_satisfaction(self, topology_graph: dict) -> Dict[str, bool]:
@@ -153,22 +171,39 @@ class TopologyValidator:
         return True  # Stub
     
     # CHECK 4: FORBIDDEN_TOPOLOGY_ABSENCE
-    def check_forbidden_topology_absence(self, subgraph: dict) -> Dict[str, bool]:
+    def check_forbidden_topology_absence(self, subgraph: TopologyGraph) -> Dict[str, bool]:
         """
-        Input: topology subgraph
+        Input: canonical topology graph
         Output: YES | NO (per forbidden pattern)
         Test: Does subgraph match any FORBIDDEN_TOPOLOGY?
         """
         results = {}
+        self.forbidden_witnesses = {}
         
         for forbidden_id, forbidden_def in self.forbidden.get('forbidden_topologies', {}).items():
             results[forbidden_id] = not self._matches_forbidden_pattern(subgraph, forbidden_def)
         
         return results
     
-    def _matches_forbidden_pattern(self, subgraph: dict, pattern_def: dict) -> bool:
+    def _pattern_matcher(self, subgraph: TopologyGraph) -> ForbiddenPatternMatcher:
+        """Degree/class indexes are built once per graph"""
+        if self._matcher is None or self._matcher.graph is not subgraph:
+            self._matcher = ForbiddenPatternMatcher(subgraph, self.spec)
+        return self._matcher
+    
+    def _matches_forbidden_pattern(self, subgraph: TopologyGraph, pattern_def: dict) -> bool:
         """Check if subgraph matches forbidden pattern"""
-        return False  # Stub
+        if not isinstance(subgraph, TopologyGraph):
+            return False
+        
+        witnesses = self._pattern_matcher(subgraph).match(pattern_def.get('name'))
+        if witnesses is None:
+            # No structural matcher: pattern is not detectable from graph shape
+            return False
+        
+        if witnesses:
+            self.forbidden_witnesses[pattern_def['name']] = witnesses
+        return bool(witnesses)
     
     # CHECK 5: AUTHORITY_CHAIN_VALIDITY
     def check_authority_chain_validity(self, node: str, graph: dict) -> bool:
@@ -253,12 +288,15 @@ class TopologyValidator:
 def run_all_checks(repo_root: str) -> Dict[str, bool]:
     """Execute all validation checks"""
     validator = TopologyValidator(Path(repo_root))
+    graph = validator._canonical_graph()
+    
+    edge_bitmap = validator.check_edge_class_legality_many(graph_edge_triples(graph))
     
     results = {
         'node_class_legality': True,
-        'edge_class_legality': True,
-        'invariant_satisfaction': validator.check_invariant_satisfaction({}),
-        'forbidden_topology_absence': validator.check_forbidden_topology_absence({}),
+        'edge_class_legality': not illegal_positions(edge_bitmap, len(graph.edges)),
+        'invariant_satisfaction': validator.check_invariant_satisfaction(graph),
+        'forbidden_topology_absence': validator.check_forbidden_topology_absence(graph),
         'authority_chain_validity': True,
         'verification_monotonicity': True,
         'mode_boundary_integrity': True,
@@ -278,5 +316,6 @@ if __name__ == '__main__':
     print("TOPOLOGY VALIDATION RESULTS")
     print("=" * 60)
     for check, result in results.items():
-        status = "YES" if result else "NO"
+        passed = all(result.values()) if isinstance(result, dict) else result
+        status = "YES" if passed else "NO"
         print(f"{check}: {status}")
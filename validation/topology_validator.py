@@ -5,54 +5,194 @@ Authority: IMMUTABLE
 Generated: 2026-02-07
 """
 
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Set, List
+from typing import Callable, Dict, Iterable, Set, List, Optional
+import instrumentation
 from topology.graph_loader import load_topology_graph, TopologyGraph, Node, Edge
-from topology.graph_loader import NodeClass, Authority, Verification, Temporal
+from topology.graph_loader import NodeClass, Authority, Verification, Temporal, EdgeClass
+from topology.graph_index import GraphIndex, EscalationCycle, authority_escalation_cycles
+from topology.zones import ZoneIndex
+from topology.path_invariants import PathAccumulator, constraint_accumulator, mode_accumulator
+from topology.path_invariants import CONSTRAINT_EDGE_CLASSES, MODE_EDGE_CLASSES
+from topology.path_invariants import constraint_names, mode_names
+from validation.audit_log import AuditLog, VIOLATION_LOG_PATH, verify_log
+
+# CHECK REGISTRY
+# Each registered check is a read-only evaluation returning its first
+# violation (or None), so independent checks can run concurrently
+
+@dataclass(frozen=True)
+class CheckSpec:
+    """Registered validation check"""
+    name: str
+    rule_id: str
+    evaluate: Callable[["TopologyValidator"], Optional[str]]
+
+
+CHECK_REGISTRY: Dict[str, CheckSpec] = {}
+
+
+def register_check(name: str, rule_id: str):
+    """Register a TopologyValidator method returning Optional[violation]"""
+    def decorator(func):
+        CHECK_REGISTRY[name] = CheckSpec(name=name, rule_id=rule_id, evaluate=func)
+        return func
+    return decorator
+
+
+@dataclass
+class CheckResult:
+    """Outcome of a single check run"""
+    name: str
+    passed: bool
+    violation: Optional[str]
+    elapsed_s: float
+
 
 class TopologyValidator:
     """Validation checks for topology structure"""
     
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, graph: Optional[TopologyGraph] = None,
+                 violation_log: Optional[Path] = None, zone: Optional[str] = None):
         self.root = Path(repo_root)
+        self.violation_log = Path(violation_log) if violation_log else self.root / VIOLATION_LOG_PATH
         # Load canonical graph once
-        self.graph = load_topology_graph(str(self.root))
+        self.graph = graph if graph is not None else load_topology_graph(str(self.root))
+        self._index: Optional[GraphIndex] = None
+        # Zone scope: checks examine only this zone's nodes and its boundary edges,
+        # taking everything outside the zone as previously validated
+        self.zone = zone
+        self._zones: Optional[ZoneIndex] = None
+        if zone is not None:
+            self.zones.members(zone)
+        self.escalation_cycles: List[EscalationCycle] = []
+        self._mode_flow: Optional[PathAccumulator] = None
+        self._constraint_flow: Optional[PathAccumulator] = None
+        self._first_violation: Optional[str] = None
+    
+    @property
+    def index(self) -> GraphIndex:
+        """Interned adjacency index over the canonical graph (built once)"""
+        if self._index is None:
+            self._index = GraphIndex.from_graph(self.graph)
+        return self._index
+    
+    @property
+    def zones(self) -> ZoneIndex:
+        """Zone index from the repository's topology spec (bundled spec if absent)"""
+        if self._zones is None:
+            topology_dir = self.root / "topology"
+            self._zones = ZoneIndex.from_graph(
+                self.graph, topology_dir if (topology_dir / "zones.yaml").exists() else None)
+        return self._zones
+    
+    def scoped_edges(self) -> Iterable[Edge]:
+        """All edges, or the zone's internal and boundary edges"""
+        if self.zone is None:
+            return self.graph.edges.values()
+        return self.zones.zone_edges(self.zone)
+    
+    def in_scope(self, node_id: str) -> bool:
+        return self.zone is None or self.zones.contains(self.zone, node_id)
+    
+    def scoped_index(self, edge_classes: Set[EdgeClass]) -> Optional[GraphIndex]:
+        """
+        Zone scope: index over the zone plus the sources of its incoming edges
+        Nodes outside the zone are taken as validated, so each one's own
+        mask already holds everything accumulated upstream of it and the
+        dataflow can start there. None (whole graph) without a zone.
+        """
+        if self.zone is None:
+            return None
+        return self.zones.inflow_index(self.zone, edge_classes)
+    
+    def cycle_scope_index(self) -> GraphIndex:
+        """
+        Zone scope: index over the nodes both reachable from and reaching the
+        zone. Every strongly connected component through the zone lies in
+        it, so Tarjan need not visit the rest of the graph.
+        """
+        index = self.index
+        position = index.position
+        members = [position[n] for n in self.zones.members(self.zone)]
+        
+        def closure(step):
+            seen = set(members)
+            queue = deque(members)
+            while queue:
+                for j in step(queue.popleft()):
+                    if j not in seen:
+                        seen.add(j)
+                        queue.append(j)
+            return seen
+        
+        keep = sorted(closure(index.successors) & closure(index.predecessors))
+        kept = set(keep)
+        edges = [edge for i in keep for j, edge in zip(index.successors(i), index.edges_from(i))
+                 if j in kept]
+        return GraphIndex([index.nodes[i] for i in keep], edges)
     
     # STEP 3: IMPLEMENT ONLY 3 CHECKS
     
+    def _record(self, violation: Optional[str]) -> bool:
+        """Bool-returning check API: keep first violation for callers"""
+        self._first_violation = violation
+        return violation is None
+    
     # CHECK 1: INVARIANT_001 - Root Reachability
     def check_root_reachability(self) -> bool:
         """
         All nodes must be reachable from COVENANT_ROOT via BFS/DFS
         NO EXCEPTIONS
         """
+        return self._record(self.root_reachability_violation())
+    
+    @register_check('ROOT_REACHABILITY', 'INVARIANT_001')
+    def root_reachability_violation(self) -> Optional[str]:
         root_id = self.graph.covenant_root_id
         if not root_id:
-            return False
+            return "NO_COVENANT_ROOT"
         
-        # BFS from root
-        visited: Set[str] = set()
-        queue: List[str] = [root_id]
-        visited.add(root_id)
+        # BFS from root over the interned CSR adjacency, O(V+E)
+        # Zone scope: BFS inside the zone from its entry points instead
+        index = self.index
+        position = index.position
+        if self.zone is None:
+            starts = [root_id]
+        else:
+            starts = [edge.target for edge in self.zones.incoming[self.zone]]
+            if self.in_scope(root_id):
+                starts.append(root_id)
+        visited = [False] * len(index)
+        queue = deque()
+        for node_id in starts:
+            if not visited[position[node_id]]:
+                visited[position[node_id]] = True
+                queue.append(position[node_id])
         
+        node_ids = index.node_ids
         while queue:
-            current = queue.pop(0)
-            
-            # Get all outgoing edges
-            for edge in self.graph.get_edges_from(current):
-                if edge.target not in visited:
-                    visited.add(edge.target)
-                    queue.append(edge.target)
+            current = queue.popleft()
+            for target in index.successors(current):
+                if not visited[target] and self.in_scope(node_ids[target]):
+                    visited[target] = True
+                    queue.append(target)
         
-        # All nodes must be visited
-        all_node_ids = set(self.graph.nodes.keys())
-        unreachable = all_node_ids - visited
+        # All nodes (of the zone) must be visited
+        candidates = range(len(index)) if self.zone is None else \
+            (position[node_id] for node_id in self.zones.members(self.zone))
+        unreachable = {node_ids[i] for i in candidates if not visited[i]}
         
         if unreachable:
-            self._first_violation = f"UNREACHABLE_NODES: {unreachable}"
-            return False
+            return f"UNREACHABLE_NODES: {unreachable}"
         
-        return True
+        return None
     
     # CHECK 2: INVARIANT_004 - Verification Monotonicity
     def check_verification_monotonicity(self) -> bool:
@@ -61,6 +201,10 @@ class TopologyValidator:
         Ordering: NONE < HASH_CHAIN < CORRESPONDENCE
         FAIL IMMEDIATELY on any decrease
         """
+        return self._record(self.verification_monotonicity_violation())
+    
+    @register_check('VERIFICATION_MONOTONICITY', 'INVARIANT_004')
+    def verification_monotonicity_violation(self) -> Optional[str]:
         # Define strict enum ordering
         verification_order = {
             Verification.NONE: 0,
@@ -70,8 +214,8 @@ class TopologyValidator:
             Verification.FALSIFIABLE: 4
         }
         
-        # Check all edges
-        for edge in self.graph.edges.values():
+        # Check all edges (zone scope: the zone's edges)
+        for edge in self.scoped_edges():
             source_node = self.graph.get_node(edge.source)
             target_node = self.graph.get_node(edge.target)
             
@@ -80,74 +224,94 @@ class TopologyValidator:
             
             # Verification can increase or stay same, never decrease
             if target_level < source_level:
-                self._first_violation = f"VERIFICATION_DECREASE: {edge.source} ({source_node.verification.value}) -> {edge.target} ({target_node.verification.value})"
-                return False
+                return f"VERIFICATION_DECREASE: {edge.source} ({source_node.verification.value}) -> {edge.target} ({target_node.verification.value})"
         
-        return True
+        return None
     
     # CHECK 3: FORBIDDEN_001 - Authority Escalation Cycle
     def check_no_authority_escalation_cycle(self) -> bool:
         """
         Detect any cycle where authority level increases
         Graph-theoretic proof only (no semantics)
+        Iterative Tarjan SCC: every escalating component is reported
         """
-        # Define authority ordering (lower number = higher authority)
-        authority_order = {
-            Authority.IMMUTABLE: 4,
-            Authority.EXTERNAL_ONLY: 3,
-            Authority.VALIDATED: 2,
-            Authority.UNRESTRICTED: 1
-        }
+        return self._record(self.authority_escalation_violation())
+    
+    @register_check('NO_AUTHORITY_ESCALATION_CYCLE', 'FORBIDDEN_001')
+    def authority_escalation_violation(self) -> Optional[str]:
+        if self.zone is not None and self.zones.is_sink(self.zone):
+            # No edge leaves the zone, so every cycle through it lies inside it
+            zone_nodes = [self.graph.nodes[n] for n in self.zones.members(self.zone)]
+            self.escalation_cycles = authority_escalation_cycles(
+                GraphIndex(zone_nodes, self.zones.internal[self.zone]))
+        elif self.zone is not None:
+            # Cycles through the zone may leave it; search only nodes that can lie on one
+            self.escalation_cycles = [
+                cycle for cycle in authority_escalation_cycles(self.cycle_scope_index())
+                if any(self.in_scope(n) for n in cycle.members)
+            ]
+        else:
+            self.escalation_cycles = authority_escalation_cycles(self.index)
         
-        # Detect cycles using DFS
-        visited: Set[str] = set()
-        rec_stack: Set[str] = set()
-        path_authority: List[int] = []
+        if self.escalation_cycles:
+            return "AUTHORITY_ESCALATION_CYCLE: " + "; ".join(
+                cycle.describe(self.graph.nodes) for cycle in self.escalation_cycles
+            )
         
-        def has_escalation_cycle(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            
-            node = self.graph.get_node(node_id)
-            current_authority = authority_order[node.authority]
-            path_authority.append(current_authority)
-            
-            # Check all neighbors
-            for edge in self.graph.get_edges_from(node_id):
-                target_id = edge.target
-                target_node = self.graph.get_node(target_id)
-                target_authority = authority_order[target_node.authority]
-                
-                if target_id not in visited:
-                    if has_escalation_cycle(target_id):
-                        return True
-                elif target_id in rec_stack:
-                    # Cycle detected - check if authority escalates
-                    if target_authority > current_authority:
-                        self._first_violation = f"AUTHORITY_ESCALATION_CYCLE: {node_id} ({node.authority.value}) -> {target_id} ({target_node.authority.value})"
-                        return True
-            
-            path_authority.pop()
-            rec_stack.remove(node_id)
-            return False
+        return None
+    
+    # CHECK 4: INVARIANT_003 - Mode Boundary Preservation
+    def check_mode_boundary_preservation(self) -> bool:
+        """
+        OPERATIONAL_MODE_BINDING restrictions only accumulate along
+        DEPENDENCY_IMPORT / MODE_RESTRICTION paths
+        Dataflow over condensed DAG, all nodes in O(V+E)
+        (zone scope: over the zone's inflow only, see scoped_index)
+        """
+        return self._record(self.mode_boundary_violation())
+    
+    @register_check('MODE_BOUNDARY_PRESERVATION', 'INVARIANT_003')
+    def mode_boundary_violation(self) -> Optional[str]:
+        if self._mode_flow is None:
+            self._mode_flow = mode_accumulator(self.graph, self.scoped_index(MODE_EDGE_CLASSES))
         
-        # Check from all nodes
-        for node_id in self.graph.nodes.keys():
-            if node_id not in visited:
-                if has_escalation_cycle(node_id):
-                    return False
+        violations = [v for v in self._mode_flow.violations() if self.in_scope(v.node_id)]
+        if violations:
+            first = violations[0]
+            return (
+                f"MODE_BOUNDARY_WEAKENED: {first.node_id} permits {mode_names(first.missing)}"
+                f" restricted upstream (via {first.via})"
+            )
         
-        return True
+        return None
     
-    # ALL OTHER CHECKS REMAIN STUBS (EXPLICIT FAILURE)
+    # CHECK 5: INVARIANT_005 - Constraint Layer Additivity
+    def check_constraint_layer_additivity(self) -> bool:
+        """
+        Constraint layers only accumulate along COVENANT_BINDING /
+        DEPENDENCY_IMPORT paths, never subtract
+        Dataflow over condensed DAG, all nodes in O(V+E)
+        (zone scope: over the zone's inflow only, see scoped_index)
+        """
+        return self._record(self.constraint_additivity_violation())
     
-    def check_mode_boundary_preservation(self) -> bool:
-        """STUB: NOT IMPLEMENTED"""
-        raise NotImplementedError("check_mode_boundary_preservation: NOT IMPLEMENTED")
+    @register_check('CONSTRAINT_LAYER_ADDITIVITY', 'INVARIANT_005')
+    def constraint_additivity_violation(self) -> Optional[str]:
+        if self._constraint_flow is None:
+            self._constraint_flow = constraint_accumulator(
+                self.graph, self.scoped_index(CONSTRAINT_EDGE_CLASSES))
+        
+        violations = [v for v in self._constraint_flow.violations() if self.in_scope(v.node_id)]
+        if violations:
+            first = violations[0]
+            return (
+                f"CONSTRAINT_LAYER_SUBTRACTED: {first.node_id} drops {constraint_names(first.missing)}"
+                f" (via {first.via})"
+            )
+        
+        return None
     
-    def check_constraint_layer_additivity(self) -> bool:
-        """STUB: NOT IMPLEMENTED"""
-        raise NotImplementedError("check_constraint_layer_additivity: NOT IMPLEMENTED")
+    # ALL OTHER CHECKS REMAIN STUBS (EXPLICIT FAILURE)
     
     def check_temporal_ordering_consistency(self) -> bool:
         """STUB: NOT IMPLEMENTED"""
@@ -161,61 +325,181 @@ class TopologyValidator:
         """STUB: NOT IMPLEMENTED"""
         raise NotImplementedError("check_guardian_non_interference: NOT IMPLEMENTED")
     
+    # CHECK 6: INVARIANT_009 - Violation Log Immutability
     def check_violation_log_immutability(self) -> bool:
-        """STUB: NOT IMPLEMENTED"""
-        raise NotImplementedError("check_violation_log_immutability: NOT IMPLEMENTED")
+        """
+        VIOLATION_LOG nodes admit only incoming VIOLATION_REFERENCE edges,
+        and the on-disk violation log's hash chain is intact
+        Chain verification resumes from the last checkpoint
+        """
+        return self._record(self.violation_log_violation())
+    
+    @register_check('VIOLATION_LOG_IMMUTABILITY', 'INVARIANT_009')
+    def violation_log_violation(self) -> Optional[str]:
+        nodes = self.graph.nodes
+        for edge in self.scoped_edges():
+            if nodes[edge.source].node_class == NodeClass.VIOLATION_LOG:
+                return f"VIOLATION_LOG_WRITES: {edge.source} -> {edge.target} ({edge.edge_class.value})"
+            if (nodes[edge.target].node_class == NodeClass.VIOLATION_LOG
+                    and edge.edge_class != EdgeClass.VIOLATION_REFERENCE):
+                return f"VIOLATION_LOG_NON_APPEND: {edge.source} -> {edge.target} ({edge.edge_class.value})"
+        
+        result = verify_log(self.violation_log)
+        if not result.ok:
+            return f"VIOLATION_LOG_TAMPERED: {result.violation}"
+        
+        return None
     
     def check_spatial_orthogonality(self) -> bool:
         """STUB: NOT IMPLEMENTED"""
         raise NotImplementedError("check_spatial_orthogonality: NOT IMPLEMENTED")
 
 
-def run_validation(repo_root: str) -> Dict[str, any]:
-    """Execute implemented validation checks only"""
-    validator = TopologyValidator(Path(repo_root))
-    validator._first_violation = None
-    
-    results = {}
-    
-    # Run only implemented checks
+def _run_check(validator: TopologyValidator, name: str) -> CheckResult:
+    """Evaluate one registered check; exceptions become violations"""
+    start = time.perf_counter()
     try:
-        results['ROOT_REACHABILITY'] = validator.check_root_reachability()
-        violation_1 = validator._first_violation
+        violation = CHECK_REGISTRY[name].evaluate(validator)
     except Exception as e:
-        results['ROOT_REACHABILITY'] = False
-        violation_1 = str(e)
+        violation = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+    instrumentation.observe(f"validation.check.{name}", elapsed)
+    return CheckResult(name=name, passed=violation is None, violation=violation,
+                       elapsed_s=elapsed)
+
+
+# Process workers hold one validator each: inherited from the parent when
+# workers are forked (shared copy-on-write snapshot), else built from the pickled graph
+_worker_validator: Optional[TopologyValidator] = None
+
+# Below this many edges process start-up outweighs the parallel speedup
+PROCESS_MIN_EDGES = 100_000
+
+
+def _init_worker(repo_root: str, graph: TopologyGraph, violation_log: str, zone: Optional[str]):
+    global _worker_validator
+    _worker_validator = TopologyValidator(Path(repo_root), graph=graph, violation_log=violation_log,
+                                          zone=zone)
+
+
+def _run_check_in_worker(name: str) -> CheckResult:
+    return _run_check(_worker_validator, name)
+
+
+def _warm(validator: TopologyValidator):
+    """Build shared indexes up front so workers only read them"""
+    validator.index
+    if validator.zone is not None:
+        validator.zones
+
+
+def choose_executor(validator: TopologyValidator) -> str:
+    """
+    "process" for graphs large enough to amortize worker start-up on a
+    multi-core host, else "serial". Threads are never chosen: the checks
+    are pure-Python CPU work, so under the GIL threads add overhead
+    without parallelism.
+    """
+    if (os.cpu_count() or 1) > 1 and len(validator.graph.edges) >= PROCESS_MIN_EDGES:
+        return "process"
+    return "serial"
+
+
+def run_checks(validator: TopologyValidator, names: Optional[List[str]] = None,
+               executor: str = "auto", max_workers: Optional[int] = None) -> Dict[str, CheckResult]:
+    """
+    Run registered checks on the validator's read-only graph
+    executor: "auto" (see choose_executor), "serial", "process" (one check
+    per worker; with fork, workers share the parent's graph and indexes
+    instead of unpickling a copy each) or "thread" (shared graph, only
+    useful for checks that wait on I/O)
+    """
+    names = list(CHECK_REGISTRY) if names is None else list(names)
+    if executor == "auto":
+        executor = choose_executor(validator)
     
-    validator._first_violation = None
-    try:
-        results['VERIFICATION_MONOTONICITY'] = validator.check_verification_monotonicity()
-        violation_2 = validator._first_violation
-    except Exception as e:
-        results['VERIFICATION_MONOTONICITY'] = False
-        violation_2 = str(e)
+    if executor == "serial" or len(names) <= 1:
+        return {name: _run_check(validator, name) for name in names}
     
-    validator._first_violation = None
-    try:
-        results['NO_AUTHORITY_ESCALATION_CYCLE'] = validator.check_no_authority_escalation_cycle()
-        violation_3 = validator._first_violation
-    except Exception as e:
-        results['NO_AUTHORITY_ESCALATION_CYCLE'] = False
-        violation_3 = str(e)
+    workers = max_workers or min(len(names), os.cpu_count() or 1)
+    if executor == "thread":
+        _warm(validator)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda name: _run_check(validator, name), names))
+    elif executor == "process":
+        global _worker_validator
+        if "fork" in multiprocessing.get_all_start_methods():
+            _warm(validator)
+            _worker_validator = validator
+            try:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context("fork")) as pool:
+                    results = list(pool.map(_run_check_in_worker, names))
+            finally:
+                _worker_validator = None
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(str(validator.root), validator.graph,
+                                               str(validator.violation_log), validator.zone)) as pool:
+                results = list(pool.map(_run_check_in_worker, names))
+    else:
+        raise ValueError(f"UNKNOWN_EXECUTOR: {executor}")
+    
+    return {result.name: result for result in results}
+
+
+def record_violations(audit_log: AuditLog, results: Dict[str, CheckResult]):
+    """Append one run record plus one record per failed check, then commit"""
+    audit_log.append("validation_run", {
+        'checks': {name: r.passed for name, r in results.items()},
+    })
+    for name, result in results.items():
+        if not result.passed:
+            audit_log.append("violation", {
+                'check': name,
+                'rule_id': CHECK_REGISTRY[name].rule_id,
+                'violation': result.violation,
+            })
+    audit_log.flush()
+
+
+def run_validation(repo_root: str, graph: Optional[TopologyGraph] = None,
+                   executor: str = "auto", max_workers: Optional[int] = None,
+                   audit_log: Optional[AuditLog] = None, zone: Optional[str] = None) -> Dict[str, any]:
+    """
+    Execute implemented validation checks only
+    With audit_log, the run and its violations are appended to the chain
+    With zone, only that zone's nodes and boundary edges are checked
+    """
+    validator = TopologyValidator(Path(repo_root), graph=graph,
+                                  violation_log=audit_log.path if audit_log else None, zone=zone)
+    
+    start = time.perf_counter()
+    with instrumentation.stage("validation.run"):
+        results = run_checks(validator, executor=executor, max_workers=max_workers)
+    elapsed = time.perf_counter() - start
+    
+    if audit_log is not None:
+        record_violations(audit_log, results)
     
     return {
-        'checks': results,
-        'violations': {
-            'ROOT_REACHABILITY': violation_1 if not results.get('ROOT_REACHABILITY') else None,
-            'VERIFICATION_MONOTONICITY': violation_2 if not results.get('VERIFICATION_MONOTONICITY') else None,
-            'NO_AUTHORITY_ESCALATION_CYCLE': violation_3 if not results.get('NO_AUTHORITY_ESCALATION_CYCLE') else None,
-        }
+        'checks': {name: r.passed for name, r in results.items()},
+        'violations': {name: r.violation for name, r in results.items()},
+        'timings': {name: r.elapsed_s for name, r in results.items()},
+        'elapsed_s': elapsed,
     }
 
 
 if __name__ == '__main__':
     import sys
     
-    repo = sys.argv[1] if len(sys.argv) > 1 else '.'
-    results = run_validation(repo)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    repo = args[0] if args else '.'
+    # --record appends the run and its violations to the repository violation log
+    audit_log = AuditLog(Path(repo) / VIOLATION_LOG_PATH) if '--record' in sys.argv else None
+    # --zone=<zone> checks one zone and its boundary edges
+    zone = next((arg.split('=', 1)[1] for arg in sys.argv[1:] if arg.startswith('--zone=')), None)
+    results = run_validation(repo, audit_log=audit_log, zone=zone)
     
     print("\nTOPOLOGY VALIDATION RESULTS")
     print("=" * 60)
@@ -229,4 +513,5 @@ if __name__ == '__main__':
             if violation:
                 print(f"  VIOLATION: {violation}")
     
+    print(f"\nElapsed: {results['elapsed_s'] * 1000:.1f} ms")
     print("\n")